@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Elaboration benchmarks.
+
+Elaborates each target (--elaborate-only, no software, no toolchain) in its default configuration
+and with all its --with-xxx features enabled (the first one of mutually exclusive options) and
+records the wall time, peak RSS and size of the generated Verilog. Each elaboration runs in its own
+process so that peak RSS are not shared between targets.
+
+Results are compared against benchmarks/baseline.json and the run fails when a metric regresses by
+more than --threshold percent. Targets/configurations without baseline (all of them while no
+baseline is recorded) are reported as warnings; record/refresh the baseline on the reference
+machine with --update-baseline:
+
+    $ python3 benchmarks/elaboration.py                     # All targets, check against baseline.
+    $ python3 benchmarks/elaboration.py arty kcu105 -j 4    # Some targets, 4 parallel jobs.
+    $ python3 benchmarks/elaboration.py --update-baseline
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir       = os.path.dirname(benchmarks_dir)
+
+sys.path.insert(0, root_dir)
+from litex_boards import targets
+
+metrics = ["time", "rss", "verilog_size"]
+
+# Configurations -----------------------------------------------------------------------------------
+
+def configurations(name):
+    """Return the {configuration: arguments} benchmarked for a target."""
+    info     = targets.info(name)
+    excluded = set()
+    for group in info["exclusive"]:
+        excluded.update(group[1:])
+    features = [f for f in info["flags"] if f.startswith("--with-") and f not in excluded]
+    r = {"default": []}
+    if features:
+        r["full"] = features
+    return r
+
+# Elaboration --------------------------------------------------------------------------------------
+
+def _verilog_size(output_dir):
+    size = 0
+    for root, dirs, files in os.walk(os.path.join(output_dir, "gateware")):
+        size += sum(os.path.getsize(os.path.join(root, f)) for f in files if f.endswith(".v"))
+    return size
+
+def elaborate(name, args=[]):
+    """Elaborate a target in a subprocess, return its metrics (raises RuntimeError on failure)."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        command = [sys.executable, "-m", "litex_boards.targets." + name,
+            "--elaborate-only",
+            "--output-dir", output_dir] + args
+        start = time.time()
+        process = subprocess.Popen(command,
+            cwd    = output_dir, # Targets may write to the current directory.
+            stdout = subprocess.PIPE,
+            stderr = subprocess.STDOUT,
+            env    = dict(os.environ, PYTHONPATH=os.pathsep.join([root_dir, os.environ.get("PYTHONPATH", "")])))
+        output = process.stdout.read()
+        _, status, rusage = os.wait4(process.pid, 0)
+        duration = time.time() - start
+        process.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") else status
+        if process.returncode != 0:
+            raise RuntimeError("\n".join(output.decode(errors="replace").strip().splitlines()[-1:]))
+        return {
+            "time"         : round(duration, 3),
+            "rss"          : rusage.ru_maxrss*(1 if sys.platform == "darwin" else 1024), # Bytes.
+            "verilog_size" : _verilog_size(output_dir),
+        }
+
+# Baseline -----------------------------------------------------------------------------------------
+
+def load(filename):
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        return json.load(f)
+
+def compare(results, baseline, threshold):
+    """Return the regressions: [(target, configuration, metric, baseline, result)]."""
+    regressions = []
+    for name, configs in sorted(results.items()):
+        for config, result in sorted(configs.items()):
+            base = baseline.get(name, {}).get(config)
+            if base is None or "error" in result:
+                continue
+            for metric in metrics:
+                if base.get(metric) and result[metric] > base[metric]*(1 + threshold/100):
+                    regressions.append((name, config, metric, base[metric], result[metric]))
+    return regressions
+
+def missing(results, baseline):
+    """Return the [(target, configuration)] results without baseline."""
+    return [(name, config) for name, configs in sorted(results.items()) for config, result in sorted(configs.items())
+        if "error" not in result and config not in baseline.get(name, {})]
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards elaboration benchmarks")
+    parser.add_argument("targets",           nargs="*",                                            help="Targets to benchmark (default: all)")
+    parser.add_argument("--exclude",         nargs="*", default=[],                                help="Targets to exclude")
+    parser.add_argument("-j", "--jobs",      default=1, type=int,                                  help="Number of parallel elaborations (default: 1, timings are noisier with more)")
+    parser.add_argument("--threshold",       default=10.0, type=float,                             help="Regression threshold in percent (default: 10)")
+    parser.add_argument("--baseline",        default=os.path.join(benchmarks_dir, "baseline.json"), help="Baseline file")
+    parser.add_argument("--results",         default="build/benchmarks/elaboration.json",          help="Results file")
+    parser.add_argument("--update-baseline", action="store_true",                                  help="Update the baseline with the results")
+    args = parser.parse_args()
+
+    names = [n for n in (args.targets or targets.boards()) if n not in args.exclude]
+    jobs  = [(name, config, config_args) for name in names for config, config_args in configurations(name).items()]
+
+    def run(job):
+        name, config, config_args = job
+        try:
+            result = elaborate(name, config_args)
+        except RuntimeError as e:
+            result = {"error": str(e)}
+        print("{:<24} {:<8} {}".format(name, config, result))
+        return job, result
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        for (name, config, _), result in executor.map(run, jobs):
+            results.setdefault(name, {})[config] = result
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+    with open(args.results, "w") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+
+    errors = [(name, config) for name, configs in results.items() for config, r in configs.items() if "error" in r]
+    for name, config in errors:
+        print("Error: {} ({}): {}".format(name, config, results[name][config]["error"]))
+
+    if args.update_baseline:
+        baseline = load(args.baseline)
+        for name, configs in results.items():
+            for config, result in configs.items():
+                if "error" not in result:
+                    baseline.setdefault(name, {})[config] = result
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print("Baseline updated: {}".format(args.baseline))
+        return
+
+    baseline    = load(args.baseline)
+    regressions = compare(results, baseline, args.threshold)
+    for name, config, metric, base, result in regressions:
+        print("Regression: {} ({}) {}: {} -> {} (+{:.1f}%)".format(
+            name, config, metric, base, result, 100*(result - base)/base))
+    if not baseline:
+        print("Warning: no baseline recorded in {}, nothing checked: record it with --update-baseline.".format(
+            args.baseline))
+    else:
+        for name, config in missing(results, baseline):
+            print("Warning: no baseline for {} ({}), record it with --update-baseline.".format(name, config))
+    if regressions or errors:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
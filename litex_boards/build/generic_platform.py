@@ -0,0 +1,147 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+from litex.build.generic_platform import ConstraintManager, ConstraintError, Pins, Subsignal
+
+# Indexed Constraint Manager -----------------------------------------------------------------------
+
+class IndexedConstraintManager(ConstraintManager):
+    """ConstraintManager with the IOs compiled into indexes.
+
+    LiteX's ConstraintManager scans the list of available resources on each request() and the
+    list of matched resources on each lookup_request(). Here resources are indexed by name/number
+    when added (at Platform construction and on add_extension()) so that requests and lookups are
+    done in constant time, and a reverse index from pins to resources allows pin conflict checks.
+    """
+    def __init__(self, io, connectors):
+        self._available  = {} # name -> {number -> [resources]}, in declaration order.
+        self._matched    = {} # name -> {number -> obj}, in request order.
+        self._pins       = {} # pin -> [(name, number, subsignal)].
+        self._requesting = None
+        ConstraintManager.__init__(self, [], connectors)
+        self.add_extension(io) # Once connector_manager is available to resolve connector pins.
+
+    @classmethod
+    def from_manager(cls, manager):
+        """Create an IndexedConstraintManager from a Platform's ConstraintManager."""
+        r = cls([], [])
+        r.connector_manager = manager.connector_manager
+        r.platform_commands = manager.platform_commands
+        r.add_extension(manager.available)
+        for resource, obj in manager.matched:
+            r.matched.append((resource, obj))
+            r._matched.setdefault(resource[0], {}).setdefault(resource[1], obj)
+        return r
+
+    # Available resources, kept for compatibility with ConstraintManager. During a request only
+    # the requested resource is returned so that ConstraintManager.request() finds it directly.
+    @property
+    def available(self):
+        if self._requesting is not None:
+            return [self._requesting]
+        return [r for numbers in self._available.values() for rs in numbers.values() for r in rs]
+
+    @available.setter
+    def available(self, io):
+        self._available = {}
+        self._pins      = {}
+        self.add_extension(io)
+
+    def _resource_pins(self, resource):
+        for element in resource[2:]:
+            if isinstance(element, Pins):
+                yield None, element.identifiers
+            elif isinstance(element, Subsignal):
+                for constraint in element.constraints:
+                    if isinstance(constraint, Pins):
+                        yield element.name, constraint.identifiers
+
+    def _resolve(self, identifiers):
+        try:
+            return self.connector_manager.resolve_identifiers(identifiers)
+        except Exception:
+            return identifiers # Unknown connector, keep the raw identifiers.
+
+    def add_extension(self, io):
+        for resource in io:
+            name, number = resource[0], resource[1]
+            self._available.setdefault(name, {}).setdefault(number, []).append(resource)
+            for subsignal, identifiers in self._resource_pins(resource):
+                for pin in self._resolve(identifiers):
+                    if pin != "None":
+                        self._pins.setdefault(pin, []).append((name, number, subsignal))
+
+    def lookup(self, name, number=None):
+        """Return the first available resource matching name/number, None if not found."""
+        numbers = self._available.get(name)
+        if not numbers:
+            return None
+        resources = numbers.get(number) if number is not None else next(iter(numbers.values()))
+        return resources[0] if resources else None
+
+    def request(self, name, number=None, loose=False):
+        resource = self.lookup(name, number)
+        if resource is None:
+            if loose:
+                return None
+            raise ConstraintError("Resource not found: {}:{}".format(name, number))
+        self._requesting = resource
+        try:
+            obj = ConstraintManager.request(self, name, number, loose)
+        finally:
+            self._requesting = None
+        numbers   = self._available[name]
+        resources = numbers[resource[1]]
+        resources.remove(resource)
+        if not resources:
+            del numbers[resource[1]]
+        if not numbers:
+            del self._available[name]
+        self._matched.setdefault(name, {}).setdefault(resource[1], obj)
+        return obj
+
+    def lookup_request(self, name, number=None, loose=False):
+        subname = None
+        if ":" in name:
+            name, subname = name.split(":")
+        objs = self._matched.get(name, {})
+        obj  = objs.get(number) if number is not None else next(iter(objs.values()), None)
+        if obj is None:
+            if loose:
+                return None
+            raise ConstraintError("Resource not found: {}:{}".format(name, number))
+        return obj if subname is None else getattr(obj, subname)
+
+    # Pins -----------------------------------------------------------------------------------------
+
+    def pin_resources(self, pin):
+        """Return the (name, number, subsignal) resources using pin (available or requested)."""
+        return list(self._pins.get(pin, []))
+
+    def pin_conflicts(self):
+        """Return the pins shared by several resources: pin -> [(name, number, subsignal)]."""
+        return {pin: list(owners) for pin, owners in self._pins.items() if len(owners) > 1}
+
+# Indexed Platform ---------------------------------------------------------------------------------
+
+class IndexedPlatform:
+    """Platform mixin using an IndexedConstraintManager.
+
+    Placed before the LiteX Platform in the bases of a Platform:
+
+        class Platform(IndexedPlatform, XilinxPlatform):
+
+    the ConstraintManager created by GenericPlatform.__init__() is replaced on assignment.
+    """
+    @property
+    def constraint_manager(self):
+        return self._constraint_manager
+
+    @constraint_manager.setter
+    def constraint_manager(self, manager):
+        if not isinstance(manager, IndexedConstraintManager):
+            manager = IndexedConstraintManager.from_manager(manager)
+        self._constraint_manager = manager
@@ -0,0 +1,282 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""OpenOCD fleet programming and programming sessions.
+
+The OpenOCD configurations of litex_boards/prog select the adapter by VID/PID, so the first
+matching adapter is used. FleetProgrammer runs the OpenOCD commands of a LiteX programmer (OpenOCD,
+OpenOCDJTAGProgrammer...) on several identical boards in parallel, each with a configuration
+selecting its adapter by serial number.
+
+OpenOCDSession keeps OpenOCD running between the loads/flash writes of a LiteX programmer: the
+adapter is opened and the JTAG chain scanned once, and the flash proxy bitstream kept loaded.
+"""
+
+import os
+import re
+import json
+import time
+import signal
+import socket
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Configurations -----------------------------------------------------------------------------------
+
+def serial_command(config):
+    """Return the command selecting the adapter by serial number for an OpenOCD configuration."""
+    # Legacy FTDI configurations (interface ftdi, ftdi_vid_pid...) use ftdi_serial, accepted by all
+    # OpenOCD versions; adapter serial is only available since OpenOCD 0.11.
+    if re.search(r"^\s*(interface\s+ftdi|ftdi_vid_pid)\b", config, re.MULTILINE):
+        return "ftdi_serial"
+    return "adapter serial"
+
+def serial_config(config, serial, directory):
+    """Write a copy of the OpenOCD configuration file config selecting the adapter serial."""
+    with open(config, "r") as f:
+        content = f.read()
+    name, ext = os.path.splitext(os.path.basename(config))
+    filename  = os.path.join(directory, "{}_{}{}".format(name, serial, ext))
+    os.makedirs(directory, exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(content.rstrip("\n") + "\n\n")
+        f.write("{} \"{}\"\n".format(serial_command(content), serial))
+    return filename
+
+# Fleet Programmer ---------------------------------------------------------------------------------
+
+def openocd_commands(programmer, method, *args, **kwargs):
+    """Return the commands called by a programmer's method (ex: load_bitstream), without running them.
+
+    Preparation steps done by the method (ex: .bit to .svf conversion) are run.
+    """
+    commands = []
+    call     = programmer.call
+    programmer.call = lambda command, check=True: commands.append(list(command))
+    try:
+        getattr(programmer, method)(*args, **kwargs)
+    finally:
+        programmer.call = call
+    for command in commands:
+        if not command or os.path.basename(command[0]) != "openocd" or "-f" not in command:
+            raise ValueError("{} is not an OpenOCD programmer.".format(type(programmer).__name__))
+    return commands
+
+
+class FleetProgrammer:
+    def __init__(self, programmer, serials, directory="build/fleet", jobs=None):
+        self.programmer = programmer
+        self.serials    = list(serials)
+        self.directory  = directory
+        self.jobs       = jobs or len(self.serials)
+
+    def _run(self, serial, commands):
+        config = serial_config(self.programmer.find_config(), serial, self.directory)
+        log    = os.path.join(self.directory, "{}.log".format(serial))
+        start  = time.time()
+        ok     = True
+        with open(log, "w") as f:
+            for command in commands:
+                command = list(command)
+                command[command.index("-f") + 1] = config
+                f.write("$ {}\n".format(" ".join(command)))
+                f.flush()
+                try:
+                    ok = subprocess.call(command, stdout=f, stderr=subprocess.STDOUT) == 0
+                except OSError as e:
+                    f.write("{}\n".format(e))
+                    ok = False
+                if not ok:
+                    break
+        return {"ok": ok, "time": time.time() - start, "log": log}
+
+    def run(self, method, *args, **kwargs):
+        """Run a programmer's method on all the boards, return the {serial: result} results."""
+        commands = openocd_commands(self.programmer, method, *args, **kwargs)
+        os.makedirs(self.directory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = executor.map(lambda serial: self._run(serial, commands), self.serials)
+            return dict(zip(self.serials, results))
+
+    def load_bitstream(self, bitstream):
+        return self.run("load_bitstream", bitstream)
+
+    def flash(self, address, data):
+        return self.run("flash", address, data)
+
+# Session ------------------------------------------------------------------------------------------
+
+def split_script(script):
+    """Split an OpenOCD -c script on the ; separators (outside braces/quotes)."""
+    commands = []
+    current  = ""
+    depth    = 0
+    quoted   = False
+    for c in script:
+        if c == "{" and not quoted:
+            depth += 1
+        elif c == "}" and not quoted:
+            depth -= 1
+        elif c == "\"" and depth == 0:
+            quoted = not quoted
+        elif c == ";" and depth == 0 and not quoted:
+            commands.append(current.strip())
+            current = ""
+            continue
+        current += c
+    commands.append(current.strip())
+    return [c for c in commands if c]
+
+def session_commands(commands):
+    """Split recorded OpenOCD calls in (configuration commands run before init, commands run after)."""
+    setup = []
+    run   = []
+    for command in commands:
+        initialized = False
+        for n, arg in enumerate(command):
+            if n == 0 or command[n - 1] != "-c":
+                continue
+            for c in split_script(arg):
+                if c == "init":
+                    initialized = True
+                elif c not in ["exit", "shutdown"]:
+                    (run if initialized else setup).append(c)
+    return setup, run
+
+
+class OpenOCDSession:
+    """Long-lived OpenOCD server running the commands of a LiteX programmer.
+
+    OpenOCD is started once (adapter opened, JTAG chain scanned) with its Tcl RPC server enabled
+    and the commands of the programmer's load_bitstream/flash are then sent to it. The flash proxy
+    bitstream is only loaded when the FPGA has been reconfigured since it was last loaded (by
+    a bitstream load or a flash write with reconfiguration).
+
+    The state of the session (OpenOCD's PID, port, configuration, loaded proxy) is saved to the
+    state file, so that the session can be shared by several processes.
+    """
+    def __init__(self, programmer, state, serial=None, port=6666):
+        self.programmer = programmer
+        self.serial     = serial
+        self.state_file = state
+        self.state      = {"pid": None, "port": port, "setup": [], "proxy": None}
+        if os.path.exists(state):
+            with open(state, "r") as f:
+                self.state = json.load(f)
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+        with open(self.state_file, "w") as f:
+            json.dump(self.state, f, indent=4)
+
+    def running(self):
+        pid = self.state["pid"]
+        if pid is None:
+            return False
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return False
+        return True
+
+    def start(self, setup=[]):
+        """Start OpenOCD with the configuration commands setup (stopping the current session)."""
+        self.stop()
+        config = self.programmer.find_config()
+        if self.serial is not None:
+            config = serial_config(config, self.serial, os.path.dirname(os.path.abspath(self.state_file)))
+        log     = os.path.splitext(self.state_file)[0] + ".log"
+        command = ["openocd", "-f", config,
+            "-c", "tcl_port {}; telnet_port disabled; gdb_port disabled".format(self.state["port"])]
+        for c in setup:
+            command += ["-c", c]
+        command += ["-c", "init"]
+        with open(log, "w") as f:
+            process = subprocess.Popen(command, stdout=f, stderr=subprocess.STDOUT, start_new_session=True)
+        self.state.update(pid=process.pid, setup=list(setup), proxy=None)
+        self._save()
+        # Wait for the RPC server (adapter opened and chain scanned).
+        for i in range(100):
+            if process.poll() is not None:
+                self.state["pid"] = None
+                self._save()
+                raise OSError("OpenOCD exited, see {}.".format(log))
+            try:
+                socket.create_connection(("127.0.0.1", self.state["port"]), timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.1)
+        self.stop()
+        raise OSError("OpenOCD RPC server not reachable, see {}.".format(log))
+
+    def stop(self):
+        if self.running():
+            try:
+                self.rpc("shutdown")
+            except OSError:
+                os.kill(self.state["pid"], signal.SIGTERM)
+        self.state.update(pid=None, proxy=None)
+        self._save()
+
+    def rpc(self, command):
+        """Run a command on OpenOCD, return its result (raises OSError on errors)."""
+        with socket.create_connection(("127.0.0.1", self.state["port"])) as s:
+            s.sendall("list [catch {{{}}} _r] $_r\x1a".format(command).encode())
+            data = b""
+            while not data.endswith(b"\x1a"):
+                chunk = s.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+        r = data.rstrip(b"\x1a").decode(errors="replace")
+        if command == "shutdown":
+            return r
+        if not r.startswith("0 "):
+            raise OSError("OpenOCD command \"{}\" failed: {}".format(command, r[2:].strip("{} ")))
+        return r[2:].strip("{}")
+
+    def run(self, method, *args, skip=[], **kwargs):
+        """Run the commands of a programmer's method (ex: load_bitstream) in the session.
+
+        Commands starting with one of the skip prefixes are not run.
+        """
+        proxies = []
+        find_flash_proxy = getattr(self.programmer, "find_flash_proxy", None)
+        if find_flash_proxy is not None:
+            def find(*args, **kwargs):
+                proxies.append(find_flash_proxy(*args, **kwargs))
+                return proxies[-1]
+            self.programmer.find_flash_proxy = find
+        try:
+            setup, commands = session_commands(openocd_commands(self.programmer, method, *args, **kwargs))
+        finally:
+            if find_flash_proxy is not None:
+                del self.programmer.find_flash_proxy
+        if not self.running() or not set(setup) <= set(self.state["setup"]):
+            self.start(self.state["setup"] + [c for c in setup if c not in self.state["setup"]])
+        for command in commands:
+            if command.startswith(tuple(skip)):
+                continue
+            proxy = [p for p in proxies if p in command]
+            if proxy:
+                # Flash proxy load (ex: jtagspi_init 0 {proxy}, svf {proxy}), skipped if loaded.
+                if self.state["proxy"] == proxy[0]:
+                    continue
+                self.rpc(command)
+                self.state["proxy"] = proxy[0]
+            else:
+                if re.match(r"(pld load|svf|fpga_program)\b", command):
+                    self.state["proxy"] = None # FPGA reconfigured.
+                self.rpc(command)
+            self._save()
+
+    def load_bitstream(self, bitstream):
+        self.run("load_bitstream", bitstream)
+
+    def flash(self, address, data, reconfigure=True, **kwargs):
+        """Flash data at address; with reconfigure=False, the FPGA is not reconfigured from the
+        flash at the end and the flash proxy stays loaded for the next flash writes."""
+        self.run("flash", address, data, skip=[] if reconfigure else ["fpga_program"], **kwargs)
@@ -0,0 +1,215 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Sector-diff SPI Flash programming.
+
+Instead of erasing and rewriting the whole image, the current content of the Flash is read back and
+only the sectors that differ from the image are erased and programmed (and verified). Changed 4KiB
+sectors are merged into 64KiB block erases when most of a block changed (and the device supports
+it). Pages that are blank (all 0xff) in the image are not programmed.
+
+Flash devices provide read(address, length), erase(address, length), write(address, data) and the
+erase_sizes they support (smallest first); PySPIFlash (pyspiflash, FTDI) and OpenOCDSPIFlash
+(OpenOCD jtagspi through a flash proxy bitstream) are provided.
+
+Fomu's DFU bootloader only accepts full images and is not supported.
+"""
+
+import os
+import time
+import tempfile
+
+# Planning -----------------------------------------------------------------------------------------
+
+def changed_sectors(current, image, sector_size):
+    """Return the addresses of the sectors of image differing from current."""
+    r = []
+    for address in range(0, len(image), sector_size):
+        if current[address:address + sector_size] != image[address:address + sector_size]:
+            r.append(address)
+    return r
+
+def plan(current, image, erase_sizes=[4096, 65536], merge=0.5):
+    """Return the (address, size) erases needed to program image over current.
+
+    Sectors use the smallest erase size; a block of a larger erase size is erased at once when more
+    than merge of its sectors changed.
+    """
+    sector_size = erase_sizes[0]
+    changed     = changed_sectors(current, image, sector_size)
+    erases      = [(address, sector_size) for address in changed]
+    for block_size in erase_sizes[1:]:
+        blocks = {}
+        for address, size in erases:
+            blocks.setdefault(address - address%block_size, []).append((address, size))
+        erases = []
+        for block, members in sorted(blocks.items()):
+            if sum(size for _, size in members) > merge*block_size and block + block_size <= len(current):
+                erases.append((block, block_size))
+            else:
+                erases.extend(members)
+    # Merge contiguous erases of the same size.
+    r = []
+    for address, size in erases:
+        if r and r[-1][0] + r[-1][1] == address and (r[-1][1] % size) == 0:
+            r[-1] = (r[-1][0], r[-1][1] + size)
+        else:
+            r.append((address, size))
+    return r
+
+def _pages(data, address, page_size=256):
+    # Non-blank (!= 0xff) runs of pages of data, as (address, data).
+    runs  = []
+    blank = bytes([0xff])*page_size
+    for offset in range(0, len(data), page_size):
+        page = data[offset:offset + page_size]
+        if page == blank[:len(page)]:
+            continue
+        if runs and runs[-1][0] + len(runs[-1][1]) == address + offset:
+            runs[-1] = (runs[-1][0], runs[-1][1] + page)
+        else:
+            runs.append((address + offset, page))
+    return runs
+
+# Programming --------------------------------------------------------------------------------------
+
+def program(device, address, image, verify=True, erase_sizes=None):
+    """Program image at address (aligned on a sector) of device, only erasing the changed sectors.
+
+    Return a summary of the operation ({"sectors": changed/total, "erased": bytes, ...}).
+    """
+    erase_sizes = erase_sizes or device.erase_sizes
+    sector_size = erase_sizes[0]
+    if address % sector_size:
+        raise ValueError("Address 0x{:08x} not aligned on a 0x{:x} bytes sector.".format(address, sector_size))
+    # Compare on whole sectors, the image is padded with the erased value.
+    length  = (len(image) + sector_size - 1)//sector_size*sector_size
+    image   = bytes(image) + bytes([0xff])*(length - len(image))
+    start   = time.time()
+    current = device.read(address, length)
+    erases  = plan(current, image, erase_sizes)
+    for offset, size in erases:
+        device.erase(address + offset, size)
+        for page_address, data in _pages(image[offset:offset + size], address + offset):
+            device.write(page_address, data)
+    if verify:
+        for offset, size in erases:
+            if device.read(address + offset, size) != image[offset:offset + size]:
+                raise OSError("Verification failed at 0x{:08x}.".format(address + offset))
+    return {
+        "sectors" : "{}/{}".format(len(changed_sectors(current, image, sector_size)), length//sector_size),
+        "erased"  : sum(size for _, size in erases),
+        "erases"  : erases,
+        "time"    : time.time() - start,
+    }
+
+def program_file(device, address, filename, **kwargs):
+    with open(filename, "rb") as f:
+        r = program(device, address, f.read(), **kwargs)
+    print("Flashed {} at 0x{:08x}: {} sectors changed, {} bytes erased/programmed in {:.1f}s.".format(
+        filename, address, r["sectors"], r["erased"], r["time"]))
+    return r
+
+# Devices ------------------------------------------------------------------------------------------
+
+class PySPIFlash:
+    """pyspiflash device (ex: SerialFlashManager.get_flash_device("ftdi://ftdi:2232/2"))."""
+    def __init__(self, dev):
+        from spiflash.serialflash import SerialFlash
+        self.dev         = dev
+        self.erase_sizes = []
+        for feature, kind in [
+            (SerialFlash.FEAT_SUBSECTERASE, "subsector"),
+            (SerialFlash.FEAT_HSECTERASE,   "hsector"),
+            (SerialFlash.FEAT_SECTERASE,    "sector")]:
+            if dev.has_feature(feature):
+                self.erase_sizes.append(dev.get_size(kind))
+        self.erase_sizes = sorted(set(self.erase_sizes)) or [dev.get_erase_size()]
+
+    def read(self, address, length):
+        return bytes(self.dev.read(address, length))
+
+    def erase(self, address, length):
+        self.dev.erase(address, length)
+
+    def write(self, address, data):
+        self.dev.write(address, data)
+
+
+class OpenOCDSPIFlash:
+    """SPI Flash behind a jtagspi flash proxy bitstream, through an OpenOCDSession.
+
+    The proxy is loaded with jtagspi_init (LiteX's Xilinx OpenOCD programmer) and kept loaded by the
+    session. OpenOCD's jtagspi erases 64KiB sectors. The read/write data goes through a temporary
+    directory, removed by close() (or when used as a context manager).
+    """
+    erase_sizes = [65536]
+
+    def __init__(self, session, bank=0):
+        self.session = session
+        self.bank    = bank
+        self.tmp     = tempfile.TemporaryDirectory()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.tmp.cleanup()
+
+    def _init(self):
+        proxy = self.session.programmer.find_flash_proxy()
+        if not self.session.running():
+            self.session.start()
+        if self.session.state["proxy"] != proxy:
+            self.session.rpc("jtagspi_init 0 {{{}}}".format(proxy))
+            self.session.state["proxy"] = proxy
+            self.session._save()
+
+    def read(self, address, length):
+        self._init()
+        filename = os.path.join(self.tmp.name, "read.bin")
+        self.session.rpc("flash read_bank {} {{{}}} 0x{:x} 0x{:x}".format(self.bank, filename, address, length))
+        with open(filename, "rb") as f:
+            return f.read()
+
+    def erase(self, address, length):
+        self._init()
+        self.session.rpc("flash erase_address 0x{:x} 0x{:x}".format(address, length))
+
+    def write(self, address, data):
+        self._init()
+        filename = os.path.join(self.tmp.name, "write.bin")
+        with open(filename, "wb") as f:
+            f.write(data)
+        self.session.rpc("flash write_bank {} {{{}}} 0x{:x}".format(self.bank, filename, address))
+
+    def reconfigure(self):
+        """Reconfigure the FPGA from the Flash (unloads the proxy)."""
+        self.session.rpc("fpga_program")
+        self.session.state["proxy"] = None
+        self.session._save()
+
+def flash_openocd(programmer, address, filename, state="build/openocd_session/spiflash.json", reconfigure=True, **kwargs):
+    """Sector-diff flash of filename at address through a (Xilinx jtagspi) LiteX OpenOCD programmer.
+
+    A running OpenOCDSession with the same state file is reused (and left running), otherwise a
+    session is started for the operation.
+    """
+    from litex_boards.build.openocd import OpenOCDSession
+    session = OpenOCDSession(programmer, state, **kwargs)
+    running = session.running()
+    try:
+        with OpenOCDSPIFlash(session) as device:
+            r = program_file(device, address, os.path.abspath(filename))
+            if reconfigure:
+                device.reconfigure()
+    finally:
+        if not running:
+            session.stop()
+    return r
@@ -0,0 +1,245 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""LiteX-Boards Builder.
+
+Drop-in replacement for LiteX's Builder/builder_args/builder_argdict used by the targets: it
+re-exports everything from litex.soc.integration.builder and extends the Builder with the build
+modes shared by all the boards.
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+from litex.soc.integration.builder import *
+
+from litex_boards.integration import profile
+from litex_boards.integration import incremental
+from litex_boards.integration import seeds as _seeds
+from litex_boards.integration.cache import BuildCache
+from litex_boards.integration.report import build_report, write_report
+
+_LiteXBuilder          = Builder
+_litex_builder_args    = builder_args
+_litex_builder_argdict = builder_argdict
+
+# Toolchains only reporting on their output: run by the Builder to log it (for the build report).
+_logged_toolchains = ["LatticeTrellisToolchain", "LatticeIceStormToolchain", "LatticeOxideToolchain"]
+
+if os.environ.get(profile.environ_variable, "0") not in ["", "0"]:
+    profile.enable()
+
+# Builder ------------------------------------------------------------------------------------------
+
+class Builder(_LiteXBuilder):
+    def __init__(self, soc,
+        elaborate_only     = False,
+        build_cache        = None,
+        seeds              = 1,
+        jobs               = None,
+        vivado_incremental = False,
+        max_threads        = None,
+        **kwargs):
+        _LiteXBuilder.__init__(self, soc, **kwargs)
+        self.elaborate_only     = elaborate_only
+        self.elaboration_time   = None
+        self.build_cache        = None if build_cache is None else BuildCache(build_cache)
+        self.seeds              = seeds
+        self.jobs               = jobs
+        self.seed_results       = None
+        self.vivado_incremental = vivado_incremental
+        self.max_threads        = max_threads
+        if any(name in soc.constants for name in ["SDRAM_CHANNELS", "SDRAM_CALIBRATION_FLASH_OFFSET"]):
+            # Extra SDRAM channels/calibration stored in SPI Flash: liblitedram replaced by the one
+            # wrapping sdram_init().
+            from litex_boards.integration.sdram_calibration import liblitedram_directory
+            self.software_packages = [(name, liblitedram_directory if name == "liblitedram" else src_dir)
+                for name, src_dir in self.software_packages]
+
+    def elaborate(self, **kwargs):
+        """Generate the gateware netlist and constraints only.
+
+        Skips the software steps of build() (software tree, generated headers, BIOS) and never
+        runs the toolchain.
+        """
+        start = time.time()
+        self.soc.platform.output_dir = self.output_dir
+        os.makedirs(self.gateware_dir, exist_ok=True)
+        self.soc.finalize()
+        kwargs["run"] = False
+        vns = self.soc.build(build_dir=self.gateware_dir, **kwargs)
+        self.elaboration_time = time.time() - start
+        print("Elaborated {} in {:.2f}s ({}).".format(
+            self.soc.build_name, self.elaboration_time, self.gateware_dir))
+        return vns
+
+    def _script(self):
+        if sys.platform in ["win32", "cygwin"]:
+            return "build_" + self.soc.build_name + ".bat"
+        return "build_" + self.soc.build_name + ".sh"
+
+    def _run_logged(self, commands, log, shell=False):
+        # Run the commands in gateware_dir, output displayed and logged.
+        with open(log, "wb") as f:
+            for command in commands:
+                process = subprocess.Popen(command,
+                    cwd    = self.gateware_dir,
+                    shell  = shell,
+                    stdout = subprocess.PIPE,
+                    stderr = subprocess.STDOUT)
+                for line in process.stdout:
+                    sys.stdout.write(line.decode(errors="replace"))
+                    sys.stdout.flush()
+                    f.write(line)
+                if process.wait() != 0:
+                    return False
+        return True
+
+    def run_toolchain(self):
+        """Run the toolchain on the build prepared in gateware_dir by build(run=False).
+
+        The output of the toolchain is also logged to build_<build_name>.log.
+        """
+        script  = self._script()
+        command = [script] if script.endswith(".bat") else ["bash", script]
+        if not os.path.exists(os.path.join(self.gateware_dir, script)):
+            if not os.path.exists(os.path.join(self.gateware_dir, "run.tcl")):
+                raise OSError("No toolchain script found in {}.".format(self.gateware_dir))
+            command = ["gw_sh", "run.tcl"] # Gowin.
+        log = os.path.join(self.gateware_dir, "build_" + self.soc.build_name + ".log")
+        if not self._run_logged([command], log):
+            raise OSError("Error occured during toolchain's script execution.")
+
+    def run_toolchain_seeds(self):
+        """Run synthesis once then place-and-route for --seeds seeds, keeping the best one."""
+        toolchain = self.soc.platform.toolchain
+        base      = getattr(toolchain, "seed", 1)
+        log       = os.path.join(self.gateware_dir, "build_" + self.soc.build_name + ".log")
+        best, results = _seeds.run_seeds(self.gateware_dir, self.soc.build_name, self._script(),
+            seeds         = list(range(base, base + self.seeds)),
+            jobs          = self.jobs,
+            run_synthesis = lambda commands: self._run_logged(commands, log, shell=True))
+        _seeds.print_results(best, results)
+        _seeds.write_results(os.path.join(self.gateware_dir, self.soc.build_name + "_seeds.json"), best, results)
+        self.seed_results = (best, results)
+
+    def run_toolchain_incremental(self):
+        """Run Vivado with the checkpoint of the last build as reference, full build on failure."""
+        build_name = self.soc.build_name
+        if os.path.exists(incremental.reference(self.gateware_dir, build_name)):
+            print("Incremental implementation from {}.".format(incremental.reference(self.gateware_dir, build_name)))
+        try:
+            self.run_toolchain()
+        except OSError:
+            if not incremental.discard(self.gateware_dir, build_name):
+                raise
+            print("Incremental implementation failed, running a full implementation.")
+            self.run_toolchain()
+        incremental.update(self.gateware_dir, build_name)
+
+    def write_report(self):
+        """Write the utilization/timing report of the build to <build_name>_report.json."""
+        toolchain = type(self.soc.platform.toolchain).__name__
+        # The fragment of the SoC has already been built by soc.build() (get_fragment() can only
+        # be called once).
+        fragment  = self.soc._fragment if self.soc.get_fragment_called else self.soc.get_fragment()
+        domains   = [cd.name for cd in fragment.clock_domains]
+        report    = build_report(self.gateware_dir, self.soc.build_name, toolchain, domains)
+        if report is None:
+            return None
+        if self.seed_results is not None:
+            best, results = self.seed_results
+            report["seeds"] = {"best": best, "spread": _seeds.spread(results)}
+        filename = os.path.join(self.gateware_dir, self.soc.build_name + "_report.json")
+        write_report(filename, report)
+        print("Build report written to {}.".format(filename))
+        return report
+
+    def build(self, **kwargs):
+        with profile.stage("Builder.build"):
+            vns = self._build(**kwargs)
+        if profile.enabled():
+            filename = os.path.join(self.output_dir, "elaboration_profile.json")
+            profile.write_report(filename, build_name=self.soc.build_name)
+            print("Elaboration profile written to {}.".format(filename))
+        return vns
+
+    def _build(self, **kwargs):
+        if self.elaborate_only:
+            return self.elaborate(**kwargs)
+        run = kwargs.pop("run", self.compile_gateware)
+        if not run:
+            return _LiteXBuilder.build(self, run=False, **kwargs)
+        toolchain = type(self.soc.platform.toolchain).__name__
+        if self.seeds > 1 and toolchain not in _logged_toolchains:
+            raise ValueError("--seeds is only supported with the nextpnr based toolchains.")
+        if self.vivado_incremental and toolchain != "XilinxVivadoToolchain":
+            raise ValueError("--vivado-incremental is only supported with the Vivado toolchain.")
+        if self.max_threads is not None and toolchain != "XilinxVivadoToolchain":
+            raise ValueError("--max-threads is only supported with the Vivado toolchain.")
+        if self.vivado_incremental:
+            incremental.enable(self.soc.platform.toolchain)
+        if self.max_threads is not None:
+            self.soc.platform.toolchain.pre_synthesis_commands.append(
+                "set_param general.maxThreads {}".format(self.max_threads))
+        if self.build_cache is not None:
+            # Reproducible software (BIOS built on __DATE__ __TIME__) for reproducible ROM contents.
+            os.environ.setdefault("SOURCE_DATE_EPOCH", "0")
+        if self.build_cache is None and toolchain not in _logged_toolchains and not self.vivado_incremental:
+            vns = _LiteXBuilder.build(self, run=True, **kwargs)
+        else:
+            # Prepare the toolchain build, then fetch the artifacts from the cache or run it.
+            vns   = _LiteXBuilder.build(self, run=False, **kwargs)
+            extra = None if self.seeds == 1 else {"seeds": self.seeds}
+            key   = None if self.build_cache is None else self.build_cache.key(self.soc.platform, self.gateware_dir, extra)
+            if key is not None and self.build_cache.fetch(key, self.gateware_dir):
+                print("Build cache hit ({}), toolchain not run.".format(key[:16]))
+            else:
+                snapshot = None if key is None else self.build_cache.snapshot(self.gateware_dir)
+                if self.seeds > 1:
+                    self.run_toolchain_seeds()
+                elif self.vivado_incremental:
+                    self.run_toolchain_incremental()
+                else:
+                    self.run_toolchain()
+                if key is not None:
+                    self.build_cache.store(key, self.gateware_dir, snapshot)
+        self.write_report()
+        return vns
+
+# Arguments ----------------------------------------------------------------------------------------
+
+class _ProfileElaborationAction(argparse.Action):
+    # Profiling has to be enabled on parse_args(), before the SoC is created.
+    def __init__(self, option_strings, dest, **kwargs):
+        argparse.Action.__init__(self, option_strings, dest, nargs=0, default=False, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        profile.enable()
+        setattr(namespace, self.dest, True)
+
+def builder_args(parser):
+    _litex_builder_args(parser)
+    parser.add_argument("--elaborate-only",      action="store_true",              help="Only generate the gateware netlist (no software, no toolchain)")
+    parser.add_argument("--build-cache",         default=None,                     help="Bitstream cache directory, reused when toolchain inputs are unchanged")
+    parser.add_argument("--profile-elaboration", action=_ProfileElaborationAction, help="Profile the elaboration stages (report in elaboration_profile.json)")
+    parser.add_argument("--seeds",               default=1, type=int,              help="Number of nextpnr place-and-route seeds, the bitstream with the best Fmax is kept")
+    parser.add_argument("--jobs",                default=None, type=int,           help="Number of parallel place-and-route runs with --seeds (default: all)")
+    parser.add_argument("--vivado-incremental",  action="store_true",              help="Vivado incremental implementation from the routed checkpoint of the last build")
+    parser.add_argument("--max-threads",         default=None, type=int,           help="Limit the threads used by the toolchain (Vivado)")
+
+def builder_argdict(args):
+    r = _litex_builder_argdict(args)
+    r["elaborate_only"]     = args.elaborate_only
+    r["build_cache"]        = args.build_cache
+    r["seeds"]              = args.seeds
+    r["jobs"]               = args.jobs
+    r["vivado_incremental"] = args.vivado_incremental
+    r["max_threads"]        = args.max_threads
+    return r
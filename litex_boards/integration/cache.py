@@ -0,0 +1,190 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Content-addressed cache of toolchain outputs.
+
+The key of a build is a SHA-256 over everything the toolchain consumes: the generated netlist,
+constraints, scripts and memory initialization files of the gateware directory, the external
+sources added to the platform (CPU cores, etc...) and the toolchain identity/version. A cache
+entry stores the bitstreams and reports produced for that key.
+
+SoCs built with ident_version=True embed the build time in their identifier ROM: it is masked when
+hashing the memory initialization files, so that rebuilding an unchanged SoC hits the cache (the
+identifier of the cached bitstream is then the one of the build that populated the cache).
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import subprocess
+
+# Toolchains ---------------------------------------------------------------------------------------
+
+# Executables used by each toolchain, with the command returning their version when known. Tools
+# without a version command are identified by their resolved path, size and modification time.
+_toolchain_executables = {
+    "XilinxVivadoToolchain"                : {"vivado": ["-version"]},
+    "XilinxISEToolchain"                   : {"xst": None, "par": None, "bitgen": None},
+    "SymbiflowToolchain"                   : {"symbiflow_synth": None, "symbiflow_write_bitstream": None},
+    "LatticeTrellisToolchain"              : {"yosys": ["-V"], "nextpnr-ecp5": ["--version"], "ecppack": None},
+    "LatticeIceStormToolchain"             : {"yosys": ["-V"], "nextpnr-ice40": ["--version"], "icepack": None},
+    "LatticeDiamondToolchain"              : {"pnmainc": None},
+    "LatticeRadiantToolchain"              : {"radiantc": None},
+    "LatticeOxideToolchain"                : {"yosys": ["-V"], "nextpnr-nexus": ["--version"], "prjoxide": None},
+    "AlteraQuartusToolchain"               : {"quartus_sh": ["--version"]},
+    "GowinToolchain"                       : {"gw_sh": None},
+    "MicrosemiLiberoSoCPolarfireToolchain" : {"libero": None},
+}
+
+def toolchain_version(toolchain):
+    """Return a string identifying the toolchain (and its version) used by a platform."""
+    name = type(toolchain).__name__
+    r = [name]
+    for executable, version_args in sorted(_toolchain_executables.get(name, {}).items()):
+        path = shutil.which(executable)
+        if path is None:
+            r.append("{}: not found".format(executable))
+            continue
+        version = None
+        if version_args is not None:
+            try:
+                version = subprocess.run([path] + version_args,
+                    stdout  = subprocess.PIPE,
+                    stderr  = subprocess.STDOUT,
+                    timeout = 120).stdout.decode(errors="replace").strip()
+            except (OSError, subprocess.SubprocessError):
+                pass
+        if version is None:
+            st = os.stat(path)
+            version = "{} {} {}".format(path, st.st_size, int(st.st_mtime))
+        r.append("{}: {}".format(executable, version))
+    return "\n".join(r)
+
+# Build Cache --------------------------------------------------------------------------------------
+
+# Files of the gateware directory consumed by the toolchains.
+input_extensions = {
+    ".v", ".sv", ".vh", ".vhd", ".vhdl",                       # Netlist/Sources.
+    ".xdc", ".ucf", ".lpf", ".pcf", ".qsf", ".sdc", ".cst",    # Constraints.
+    ".pdc", ".ldc",
+    ".tcl", ".ys", ".sh", ".bat", ".prj", ".xst", ".ut",       # Scripts/Projects.
+    ".init", ".mem", ".hex",                                   # Memory initialization.
+}
+
+# Files produced by the toolchains that are worth caching.
+artifact_extensions = {
+    ".bit", ".bin", ".svf", ".sof", ".rbf", ".pof", ".fs", ".jed", ".mcs", ".dfu", # Bitstreams.
+    ".rpt", ".log", ".summary", ".mrp", ".twr", ".txt", ".html",                   # Reports.
+}
+
+# Lines of generated files that change on every build without changing the design (banners).
+_banner_re = re.compile(rb"[Aa]uto-?generated by")
+
+def _hash_file(h, filename, build_dir=None):
+    # Generated scripts reference files with absolute paths: make them relative to the build
+    # directory so that identical builds done in different output directories share their key.
+    build_dir = None if build_dir is None else os.path.abspath(build_dir).encode()
+    with open(filename, "rb") as f:
+        for line in f:
+            if _banner_re.search(line):
+                continue
+            if build_dir is not None:
+                line = line.replace(build_dir, b"$BUILD_DIR")
+            h.update(line)
+
+# Build time of the identifier (ident_version=True, see SoC.add_identifier).
+_build_time_re = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+def _hash_init_file(h, filename):
+    # Byte-wide memories (identifier ROM): hash the content with the build time masked.
+    with open(filename, "rb") as f:
+        words = f.read().split()
+    if not words or any(len(w) != 2 for w in words):
+        return _hash_file(h, filename)
+    try:
+        data = bytes(int(w, 16) for w in words)
+    except ValueError:
+        return _hash_file(h, filename)
+    h.update(_build_time_re.sub(b"$BUILD_TIME", data))
+
+def _artifacts(directory):
+    r = {}
+    for root, dirs, files in os.walk(directory):
+        for f in files:
+            if os.path.splitext(f)[1] in artifact_extensions:
+                filename = os.path.join(root, f)
+                r[os.path.relpath(filename, directory)] = os.stat(filename).st_mtime
+    return r
+
+
+class BuildCache:
+    def __init__(self, directory):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+
+    def key(self, platform, gateware_dir, extra=None):
+        """Compute the key of the build prepared in gateware_dir (toolchain not yet run)."""
+        h = hashlib.sha256()
+        h.update(toolchain_version(platform.toolchain).encode())
+        h.update(repr(extra).encode())
+        for f in sorted(os.listdir(gateware_dir)):
+            filename = os.path.join(gateware_dir, f)
+            if os.path.isfile(filename) and os.path.splitext(f)[1] in input_extensions:
+                h.update(f.encode())
+                if f.endswith(".init"):
+                    _hash_init_file(h, filename)
+                else:
+                    _hash_file(h, filename, gateware_dir)
+        for source in sorted(platform.sources):
+            h.update(repr(source).encode())
+            _hash_file(h, source[0])
+        return h.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def fetch(self, key, gateware_dir):
+        """Copy the artifacts cached for key to gateware_dir, return True on a cache hit."""
+        entry = self.path(key)
+        try:
+            with open(os.path.join(entry, "manifest.json"), "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not all(os.path.isfile(os.path.join(entry, "files", f)) for f in manifest["files"]):
+            return False
+        for f in manifest["files"]:
+            dst = os.path.join(gateware_dir, f)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copyfile(os.path.join(entry, "files", f), dst)
+        return True
+
+    def snapshot(self, gateware_dir):
+        """Record the artifacts present before running the toolchain (see store)."""
+        return _artifacts(gateware_dir)
+
+    def store(self, key, gateware_dir, snapshot=None):
+        """Store the artifacts created or updated in gateware_dir since snapshot under key."""
+        snapshot = {} if snapshot is None else snapshot
+        files    = [f for f, mtime in _artifacts(gateware_dir).items() if snapshot.get(f) != mtime]
+        if not files:
+            return
+        entry = self.path(key)
+        tmp   = entry + ".tmp{}".format(os.getpid())
+        for f in files:
+            dst = os.path.join(tmp, "files", f)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copyfile(os.path.join(gateware_dir, f), dst)
+        with open(os.path.join(tmp, "manifest.json"), "w") as f:
+            json.dump({"files": sorted(files), "time": time.time()}, f, indent=4)
+        # Publish atomically; a concurrent build of the same key may have won the race.
+        shutil.rmtree(entry, ignore_errors=True)
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,98 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""SPI Flash image assembly.
+
+Places binaries (bitstream, BIOS, firmware...) at given offsets of a Flash image. The image is
+assembled in a single buffer pre-filled with the erase value, binaries are read directly into it
+and the result is written with a single call, along with a JSON manifest describing the layout.
+"""
+
+import os
+import json
+import hashlib
+
+# Flash Image --------------------------------------------------------------------------------------
+
+class FlashImageRegion:
+    def __init__(self, name, filename, offset, size=None):
+        self.name     = name
+        self.filename = filename
+        self.offset   = offset
+        self.size     = size # Region size, None for the size of the file.
+        self.length   = None # Length of the data, known once the image is assembled.
+        self.sha256   = None
+
+    @property
+    def end(self):
+        return self.offset + (os.path.getsize(self.filename) if self.size is None else self.size)
+
+class FlashImage:
+    """Flash image built from binaries placed at given offsets.
+
+    Gaps between regions (and the end of fixed-size regions) are filled with `fill`. When `size`
+    is not specified, the image ends with the last region.
+    """
+    def __init__(self, size=None, fill=0xff):
+        self.size    = size
+        self.fill    = fill
+        self.regions = []
+
+    def add(self, name, filename, offset, size=None):
+        """Place filename at offset, in a region of size bytes (default: size of the file)."""
+        region = FlashImageRegion(name, filename, offset, size)
+        self.regions.append(region)
+        return region
+
+    def check(self):
+        """Check that the regions fit in their size/in the image and do not overlap."""
+        for region in self.regions:
+            length = os.path.getsize(region.filename)
+            if region.size is not None and length > region.size:
+                raise ValueError("{} (0x{:08x} bytes) does not fit in its 0x{:08x} bytes region.".format(
+                    region.name, length, region.size))
+            if self.size is not None and region.end > self.size:
+                raise ValueError("{} ends at 0x{:08x}, beyond the 0x{:08x} bytes image.".format(
+                    region.name, region.end, self.size))
+        regions = sorted(self.regions, key=lambda r: r.offset)
+        for a, b in zip(regions, regions[1:]):
+            if a.end > b.offset:
+                raise ValueError("{}/{} overlap 0x{:08x} vs 0x{:08x}, increase {} offset.".format(
+                    a.name, b.name, a.end, b.offset, b.name))
+
+    def build(self, filename, manifest=True):
+        """Assemble the image to filename (and its manifest to filename.json), return the size."""
+        self.check()
+        size   = self.size if self.size is not None else max([r.end for r in self.regions], default=0)
+        buf    = bytearray([self.fill])*size
+        view   = memoryview(buf)
+        for region in self.regions:
+            with open(region.filename, "rb") as f:
+                region.length = f.readinto(view[region.offset:region.end])
+            region.sha256 = hashlib.sha256(view[region.offset:region.offset + region.length]).hexdigest()
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        with open(filename, "wb") as f:
+            f.write(buf)
+        if manifest:
+            self.write_manifest(filename, size, hashlib.sha256(buf).hexdigest())
+        return size
+
+    def write_manifest(self, filename, size, sha256):
+        with open(filename + ".json", "w") as f:
+            json.dump({
+                "image"   : os.path.basename(filename),
+                "size"    : size,
+                "fill"    : self.fill,
+                "sha256"  : sha256,
+                "regions" : [{
+                    "name"     : r.name,
+                    "filename" : r.filename,
+                    "offset"   : r.offset,
+                    "size"     : r.end - r.offset,
+                    "length"   : r.length,
+                    "sha256"   : r.sha256,
+                } for r in sorted(self.regions, key=lambda r: r.offset)],
+            }, f, indent=4)
@@ -0,0 +1,51 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Vivado incremental implementation.
+
+The routed checkpoint of the last successful build is kept in the gateware directory as
+<build_name>_incremental.dcp and passed to Vivado's incremental flow on the next build (read before
+placement). Vivado's automatic incremental mode (-auto_incremental) falls back to the default flow
+when the reference is not suitable (design diverged too far: low cell reuse or bad timing); when
+the incremental build fails anyway, the reference is discarded and a full build is run.
+
+The reference is only read when present, so the generated TCL is the same for full and
+incremental builds.
+"""
+
+import os
+import shutil
+
+# TCL commands (formatted with build_name by the Vivado toolchain).
+read_command = (
+    "if {{[file exists {build_name}_incremental.dcp]}} {{ "
+    "read_checkpoint -incremental -auto_incremental {build_name}_incremental.dcp }}")
+report_command = (
+    "if {{[file exists {build_name}_incremental.dcp]}} {{ "
+    "catch {{report_incremental_reuse -file {build_name}_incremental_reuse.rpt}} }}")
+
+def reference(gateware_dir, build_name):
+    return os.path.join(gateware_dir, build_name + "_incremental.dcp")
+
+def enable(toolchain):
+    """Add the incremental flow commands to a XilinxVivadoToolchain."""
+    if read_command not in toolchain.pre_placement_commands:
+        toolchain.pre_placement_commands.append(read_command)
+        toolchain.additional_commands.append(report_command)
+
+def update(gateware_dir, build_name):
+    """Use the routed checkpoint of the build as reference for the next build."""
+    checkpoint = os.path.join(gateware_dir, build_name + "_route.dcp")
+    if os.path.exists(checkpoint):
+        shutil.copyfile(checkpoint, reference(gateware_dir, build_name))
+
+def discard(gateware_dir, build_name):
+    """Remove the reference checkpoint, return True if there was one."""
+    filename = reference(gateware_dir, build_name)
+    if not os.path.exists(filename):
+        return False
+    os.remove(filename)
+    return True
@@ -0,0 +1,18 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""PCIe integration checks."""
+
+# IRQs of LitePCIeMSI (default width), each DMA using two of them (writer/reader).
+msi_irqs = 32
+
+def check_pcie_dmas(ndmas, msi_irqs=msi_irqs):
+    """Check the number of PCIe DMAs against the MSI IRQs available, raise ValueError if invalid."""
+    if ndmas < 1:
+        raise ValueError("Invalid number of PCIe DMAs: {} (must be >= 1).".format(ndmas))
+    if 2*ndmas > msi_irqs:
+        raise ValueError("Too many PCIe DMAs: {} ({} MSI IRQs needed, {} available).".format(
+            ndmas, 2*ndmas, msi_irqs))
@@ -0,0 +1,153 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Elaboration profiler.
+
+Times the stages of a target's elaboration (SoCCore.__init__, the target's CRG, the SoC's add_xxx
+helpers and Builder.build) and records their tracemalloc peaks. Profiling is opt-in: enabled with
+the --profile-elaboration builder argument or with LITEX_BOARDS_PROFILE_ELABORATION=1 in the
+environment; the Builder then writes the report to elaboration_profile.json in the build directory.
+
+Stages can be nested (ex: Builder.build calls soc.finalize() that may call add_xxx helpers), the
+peak of a stage includes the peaks of its sub-stages.
+"""
+
+import sys
+import json
+import time
+import functools
+import tracemalloc
+from contextlib import contextmanager
+
+environ_variable = "LITEX_BOARDS_PROFILE_ELABORATION"
+
+# SoC helpers profiled.
+soc_methods = [
+    "add_sdram",
+    "add_pcie",
+    "add_ethernet",
+    "add_etherbone",
+    "add_sata",
+    "add_spi_flash",
+    "add_sdcard",
+]
+
+# Profiler -----------------------------------------------------------------------------------------
+
+class ElaborationProfiler:
+    def __init__(self):
+        self.stages = []
+        self._stack = []
+
+    @contextmanager
+    def stage(self, name):
+        # Save the peak of the parent stage before resetting it for this stage.
+        if self._stack:
+            self._stack[-1]["peak_memory"] = max(self._stack[-1]["peak_memory"], tracemalloc.get_traced_memory()[1])
+        if hasattr(tracemalloc, "reset_peak"): # Python >= 3.9, peaks are global peaks otherwise.
+            tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        stage = {
+            "name"        : name,
+            "depth"       : len(self._stack),
+            "time"        : None,
+            "peak_memory" : current,
+            "allocated"   : None,
+        }
+        self.stages.append(stage)
+        self._stack.append(stage)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage["time"]        = time.perf_counter() - start
+            stage["peak_memory"] = max(stage["peak_memory"], tracemalloc.get_traced_memory()[1])
+            stage["allocated"]   = tracemalloc.get_traced_memory()[0] - current
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]["peak_memory"] = max(self._stack[-1]["peak_memory"], stage["peak_memory"])
+
+    def report(self):
+        summary = {}
+        for stage in self.stages:
+            s = summary.setdefault(stage["name"], {"calls": 0, "time": 0.0, "peak_memory": 0})
+            s["calls"]      += 1
+            s["time"]       += stage["time"] or 0.0
+            s["peak_memory"] = max(s["peak_memory"], stage["peak_memory"])
+        return {"stages": self.stages, "summary": summary}
+
+    def write_report(self, filename, **info):
+        with open(filename, "w") as f:
+            json.dump({**info, **self.report()}, f, indent=4)
+
+_profiler = None
+
+# Instrumentation ----------------------------------------------------------------------------------
+
+def _wrap(cls, method, name):
+    func = getattr(cls, method)
+    if getattr(func, "_profiled", False):
+        return
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _profiler is None:
+            return func(*args, **kwargs)
+        with _profiler.stage(name):
+            return func(*args, **kwargs)
+    wrapper._profiled = True
+    setattr(cls, method, wrapper)
+
+def _wrap_crgs(soc):
+    # The CRGs are defined (_CRG, _CRGSDRAM...) or imported (CRG) by each target and created after
+    # SoCCore.__init__: instrument the CRG classes of the modules of the SoC when it is created.
+    from migen import Module
+    for module in {sys.modules.get(cls.__module__) for cls in type(soc).__mro__}:
+        for name, obj in list(vars(module).items()) if module is not None else []:
+            if "CRG" in name and isinstance(obj, type) and issubclass(obj, Module):
+                _wrap(obj, "__init__", "CRG")
+
+def enable():
+    """Enable the profiling of the elaborations (SoC creation and Builder.build)."""
+    global _profiler
+    if _profiler is not None:
+        return
+    from litex.soc.integration.soc import SoC
+    from litex.soc.integration.soc_core import SoCCore
+    _profiler = ElaborationProfiler()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if not getattr(SoCCore.__init__, "_profiled", False):
+        soccore_init = SoCCore.__init__
+        @functools.wraps(soccore_init)
+        def __init__(self, *args, **kwargs):
+            if _profiler is None:
+                return soccore_init(self, *args, **kwargs)
+            _wrap_crgs(self)
+            with _profiler.stage("SoCCore.__init__"):
+                return soccore_init(self, *args, **kwargs)
+        __init__._profiled = True
+        SoCCore.__init__ = __init__
+    for method in soc_methods:
+        if hasattr(SoC, method):
+            _wrap(SoC, method, method)
+
+def enabled():
+    return _profiler is not None
+
+def stage(name):
+    """Context manager profiling a stage (no-op when profiling is not enabled)."""
+    if _profiler is None:
+        return _null_stage()
+    return _profiler.stage(name)
+
+@contextmanager
+def _null_stage():
+    yield None
+
+def write_report(filename, **info):
+    """Write the report of the stages profiled so far and start a new one."""
+    _profiler.write_report(filename, **info)
+    _profiler.stages = []
@@ -0,0 +1,298 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Unified post-build utilization/timing report.
+
+Parses the reports left by the toolchains in the gateware directory (Vivado, nextpnr, Quartus,
+Radiant and Gowin) into a single schema:
+
+    {
+        "toolchain"   : "vivado",
+        "utilization" : {"lut": {"used": 1234, "available": 63400}, "ff": ..., "bram": ..., "dsp": ...},
+        "clocks"      : {"main_pll_clkout0": {"period": 10.0, "fmax": 131.2, "wns": 2.38}, ...},
+        "domains"     : {"sys": {"clocks": ["main_pll_clkout0"], "period": 10.0, "fmax": 131.2, "wns": 2.38}, ...},
+        "wns"         : 2.38,
+    }
+
+Clocks are associated to the clock domains of the SoC from their names (ex: sys_clk, main_sys4x_clk,
+$glbnet$sys_clk); values are None when not found in the reports, periods/wns in ns, fmax in MHz.
+"""
+
+import os
+import re
+import json
+import glob
+
+resources = ["lut", "ff", "bram", "dsp"]
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _read(*patterns):
+    # Content of the first existing file matching one of the patterns, None if none exists.
+    for pattern in patterns:
+        for filename in sorted(glob.glob(pattern)):
+            with open(filename, "r", errors="replace") as f:
+                return f.read()
+    return None
+
+def _int(s):
+    try:
+        return int(s.replace(",", "").strip())
+    except ValueError:
+        try:
+            return int(float(s.replace(",", "").strip()))
+        except ValueError:
+            return None
+
+def _float(s):
+    try:
+        return float(s.replace(",", "").strip())
+    except ValueError:
+        return None
+
+def _utilization(values, names):
+    # Map the toolchain's resource names to lut/ff/bram/dsp, first matching name wins.
+    r = {}
+    for resource in resources:
+        for name in names.get(resource, []):
+            if name in values:
+                used, available = values[name]
+                r[resource] = {"used": used, "available": available}
+                break
+        else:
+            r[resource] = None
+    return r
+
+def _clock(period=None, fmax=None, wns=None):
+    if fmax is None and period is not None and wns is not None and period > wns:
+        fmax = 1e3/(period - wns)
+    if wns is None and period is not None and fmax:
+        wns = period - 1e3/fmax
+    return {
+        "period" : period,
+        "fmax"   : None if fmax is None else round(fmax, 3),
+        "wns"    : None if wns  is None else round(wns, 3),
+    }
+
+# Vivado -------------------------------------------------------------------------------------------
+
+def _vivado_table(report, title):
+    # Rows of the text table following a title (ex: "Intra Clock Table"). Columns are given by the
+    # dashes under the header; values can be left or right-aligned and cells can be empty, so each
+    # word is assigned to the column it overlaps the most.
+    rows  = []
+    lines = report.splitlines()
+    for i, line in enumerate(lines):
+        if line.strip("| ").startswith(title):
+            break
+    else:
+        return rows
+    spans = None
+    for line in lines[i + 1:]:
+        if re.match(r"^-+( +-+)+\s*$", line):
+            spans = [m.span() for m in re.finditer(r"-+", line)]
+            continue
+        if spans is None:
+            continue
+        if not line.strip():
+            if rows:
+                break
+            continue
+        cells = [[] for _ in spans]
+        for m in re.finditer(r"\S+", line):
+            overlaps = [min(m.end(), e) - max(m.start(), s) for s, e in spans]
+            cells[overlaps.index(max(overlaps))].append(m.group())
+        rows.append([" ".join(c) for c in cells])
+    return rows
+
+def parse_vivado(gateware_dir, build_name):
+    util   = _read(os.path.join(gateware_dir, build_name + "_utilization_place.rpt"),
+                   os.path.join(gateware_dir, build_name + "_utilization*.rpt"))
+    timing = _read(os.path.join(gateware_dir, build_name + "_timing.rpt"),
+                   os.path.join(gateware_dir, build_name + "_timing*.rpt"))
+    values = {}
+    for line in (util or "").splitlines():
+        cells = [c.strip() for c in line.split("|")]
+        if len(cells) >= 6 and cells[1] not in values:
+            used, available = _int(cells[2]), _int(cells[-3])
+            if used is not None and available is not None:
+                values[cells[1]] = (used, available)
+    utilization = _utilization(values, {
+        "lut"  : ["CLB LUTs", "Slice LUTs", "CLB LUTs*", "Slice LUTs*"],
+        "ff"   : ["CLB Registers", "Slice Registers"],
+        "bram" : ["Block RAM Tile"],
+        "dsp"  : ["DSPs"],
+    })
+    clocks  = {}
+    periods = {}
+    for row in _vivado_table(timing or "", "Clock Summary"):
+        if len(row) >= 4:
+            periods[row[0]] = _float(row[2])
+    for row in _vivado_table(timing or "", "Intra Clock Table"):
+        if len(row) >= 2 and row[1]:
+            clocks[row[0]] = _clock(period=periods.get(row[0]), wns=_float(row[1]))
+    return utilization, clocks
+
+# nextpnr ------------------------------------------------------------------------------------------
+
+_nextpnr_util_re = re.compile(r"^Info:\s+(\w+):\s+(\d+)/\s*(\d+)\s+\d+%", re.MULTILINE)
+_nextpnr_fmax_re = re.compile(r"Max frequency for clock\s+'([^']+)':\s+([\d.]+) MHz \((?:PASS|FAIL) at ([\d.]+) MHz\)")
+
+def parse_nextpnr(gateware_dir, build_name):
+    log = _read(os.path.join(gateware_dir, "build_" + build_name + ".log"),
+                os.path.join(gateware_dir, build_name + "*.log")) or ""
+    # Utilization is reported after packing and after placement, keep the last one.
+    values = {}
+    for m in _nextpnr_util_re.finditer(log):
+        values[m.group(1)] = (int(m.group(2)), int(m.group(3)))
+    utilization = _utilization(values, {
+        "lut"  : ["TRELLIS_COMB", "ICESTORM_LC", "OXIDE_COMB", "TRELLIS_SLICE"],
+        "ff"   : ["TRELLIS_FF", "OXIDE_FF"],
+        "bram" : ["DP16KD", "ICESTORM_RAM", "OXIDE_EBR"],
+        "dsp"  : ["MULT18X18D", "ICESTORM_DSP", "MULT18_CORE"],
+    })
+    # Fmax is reported after placement and after routing, keep the last one.
+    clocks = {}
+    for m in _nextpnr_fmax_re.finditer(log):
+        clocks[m.group(1)] = _clock(period=1e3/float(m.group(3)), fmax=float(m.group(2)))
+    return utilization, clocks
+
+# Quartus ------------------------------------------------------------------------------------------
+
+_quartus_summary_re = re.compile(r"^\s*([^:\n]+?)\s*:\s*([\d,]+)\s*(?:/\s*([\d,]+))?", re.MULTILINE)
+_quartus_fmax_re    = re.compile(r"^;\s*([\d.]+) MHz\s*;\s*([\d.]+) MHz\s*;\s*(\S+)\s*;", re.MULTILINE)
+_quartus_slack_re   = re.compile(r"Type\s*:\s*.*?Setup '([^']+)'\s*\nSlack\s*:\s*(-?[\d.]+)")
+
+def parse_quartus(gateware_dir, build_name):
+    summary = _read(os.path.join(gateware_dir, build_name + ".fit.summary")) or ""
+    values  = {}
+    for m in _quartus_summary_re.finditer(summary):
+        values.setdefault(m.group(1), (_int(m.group(2)), _int(m.group(3)) if m.group(3) else None))
+    utilization = _utilization(values, {
+        "lut"  : ["Total logic elements", "Logic utilization (in ALMs)"],
+        "ff"   : ["Total registers", "Dedicated logic registers"],
+        "bram" : ["Total RAM Blocks", "Total memory bits", "Total block memory bits"],
+        "dsp"  : ["Total DSP Blocks", "Embedded Multiplier 9-bit elements"],
+    })
+    # Worst values over the timing corners.
+    fmax  = {}
+    slack = {}
+    for m in _quartus_fmax_re.finditer(_read(os.path.join(gateware_dir, build_name + ".sta.rpt")) or ""):
+        fmax[m.group(3)] = min(fmax.get(m.group(3), float("inf")), float(m.group(2)))
+    for m in _quartus_slack_re.finditer(_read(os.path.join(gateware_dir, build_name + ".sta.summary")) or ""):
+        slack[m.group(1)] = min(slack.get(m.group(1), float("inf")), float(m.group(2)))
+    clocks = {}
+    for name in sorted(set(fmax) | set(slack)):
+        period = None
+        if name in fmax and name in slack:
+            period = 1e3/fmax[name] + slack[name]
+        clocks[name] = _clock(period=period, fmax=fmax.get(name), wns=slack.get(name))
+    return utilization, clocks
+
+# Radiant ------------------------------------------------------------------------------------------
+
+_radiant_util_re   = re.compile(r"Number of ([\w ]+?):\s+(\d+)\s+out of\s+(\d+)")
+_radiant_target_re = re.compile(r"From (\S+)\s*\|\s*Target\s*\|\s*([\d.]+) ns")
+_radiant_actual_re = re.compile(r"\|\s*Actual \(all paths\)\s*\|\s*([\d.]+) ns")
+
+def parse_radiant(gateware_dir, build_name):
+    mrp    = _read(os.path.join(gateware_dir, "impl", "*.mrp"), os.path.join(gateware_dir, "*.mrp")) or ""
+    twr    = _read(os.path.join(gateware_dir, "impl", "*.twr"), os.path.join(gateware_dir, "*.twr")) or ""
+    values = {}
+    for m in _radiant_util_re.finditer(mrp):
+        values.setdefault(m.group(1), (int(m.group(2)), int(m.group(3))))
+    utilization = _utilization(values, {
+        "lut"  : ["LUT4s", "LUT4"],
+        "ff"   : ["registers", "slice registers"],
+        "bram" : ["EBRs", "EBR"],
+        "dsp"  : ["DSPs", "MAC16s"],
+    })
+    clocks = {}
+    lines  = twr.splitlines()
+    for i, line in enumerate(lines):
+        m = _radiant_target_re.search(line)
+        if m is None:
+            continue
+        actual = _radiant_actual_re.search(lines[i + 1]) if i + 1 < len(lines) else None
+        period = float(m.group(2))
+        clocks[m.group(1)] = _clock(period=period,
+            wns = None if actual is None else period - float(actual.group(1)))
+    return utilization, clocks
+
+# Gowin --------------------------------------------------------------------------------------------
+
+_gowin_util_re = re.compile(r"^\s*(Logic|Register|BSRAM|DSP Macro)\s*(?:\|\s*|<[^>]*>\s*)+(\d+)\s*/\s*(\d+)", re.MULTILINE)
+_gowin_fmax_re = re.compile(r"(\S+)\s+([\d.]+)\(MHz\)\s+([\d.]+)\(MHz\)")
+
+def parse_gowin(gateware_dir, build_name):
+    pnr    = os.path.join(gateware_dir, "impl", "pnr")
+    rpt    = _read(os.path.join(pnr, "*.rpt.txt"), os.path.join(pnr, "*.rpt.html")) or ""
+    tr     = _read(os.path.join(pnr, "*.tr.html"), os.path.join(pnr, "*.tr")) or ""
+    values = {}
+    for m in _gowin_util_re.finditer(rpt):
+        values.setdefault(m.group(1), (int(m.group(2)), int(m.group(3))))
+    utilization = _utilization(values, {
+        "lut"  : ["Logic"],
+        "ff"   : ["Register"],
+        "bram" : ["BSRAM"],
+        "dsp"  : ["DSP Macro"],
+    })
+    clocks = {}
+    text   = re.sub(r"<[^>]*>", " ", tr)
+    for m in _gowin_fmax_re.finditer(text):
+        clocks.setdefault(m.group(1), _clock(period=1e3/float(m.group(2)), fmax=float(m.group(3))))
+    return utilization, clocks
+
+# Report -------------------------------------------------------------------------------------------
+
+parsers = {
+    "XilinxVivadoToolchain"    : ("vivado",  parse_vivado),
+    "LatticeTrellisToolchain"  : ("nextpnr", parse_nextpnr),
+    "LatticeIceStormToolchain" : ("nextpnr", parse_nextpnr),
+    "LatticeOxideToolchain"    : ("nextpnr", parse_nextpnr),
+    "AlteraQuartusToolchain"   : ("quartus", parse_quartus),
+    "LatticeRadiantToolchain"  : ("radiant", parse_radiant),
+    "GowinToolchain"           : ("gowin",   parse_gowin),
+}
+
+def clock_domain(clock, domains):
+    """Return the clock domain of a clock from its name (longest matching domain), None if unknown."""
+    name  = clock.lower()
+    match = None
+    for domain in domains:
+        if re.search(r"(^|[^a-z0-9]){}(_clk)?($|[^a-z0-9])".format(re.escape(domain.lower())), name):
+            if match is None or len(domain) > len(match):
+                match = domain
+    return match
+
+def build_report(gateware_dir, build_name, toolchain, domains=[]):
+    """Parse the toolchain reports of gateware_dir, None if the toolchain is not supported."""
+    if toolchain not in parsers:
+        return None
+    name, parser = parsers[toolchain]
+    utilization, clocks = parser(gateware_dir, build_name)
+    r = {d: {"clocks": [], "period": None, "fmax": None, "wns": None} for d in domains}
+    for clock, values in sorted(clocks.items()):
+        domain = clock_domain(clock, domains)
+        if domain is None:
+            continue
+        r[domain]["clocks"].append(clock)
+        # Worst clock of the domain.
+        if r[domain]["wns"] is None or (values["wns"] is not None and values["wns"] < r[domain]["wns"]):
+            r[domain].update(values)
+    slacks = [c["wns"] for c in clocks.values() if c["wns"] is not None]
+    return {
+        "toolchain"   : name,
+        "build_name"  : build_name,
+        "utilization" : utilization,
+        "clocks"      : clocks,
+        "domains"     : r,
+        "wns"         : min(slacks) if slacks else None,
+    }
+
+def write_report(filename, report):
+    with open(filename, "w") as f:
+        json.dump(report, f, indent=4)
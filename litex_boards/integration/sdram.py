@@ -0,0 +1,306 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Multi-channel SDRAM integration.
+
+SoC.add_sdram() integrates a single LiteDRAM core as main_ram. add_sdram_channels() integrates a
+LiteDRAM core per PHY, the channels being exposed either as separate regions (main_ram for the
+first channel, main_ram1, main_ram2... for the others) or as a single main_ram region interleaved
+over all of them.
+
+The first channel is always named sdram (with the PHY passed by the target, generally ddrphy) so
+that the BIOS initializes/calibrates it. The other channels (sdram1, sdram2...) have the CSRs of
+their core located at the same offset from the ones of sdram as the CSRs of their PHY from the
+ones of the first PHY: the Builder then replaces LiteX's liblitedram with the one of
+software/liblitedram, whose sdram_init() initializes/calibrates each of them with LiteX's code (CSR
+base moved by this offset) before the first one; with interleaving, main_ram is only tested once
+all the channels are initialized.
+
+add_sdram_bench() adds LiteDRAM BIST generator/checker ports to the LiteDRAM cores of a SoC, used by
+tools/dram_bench.py to measure the bandwidth/latency of the memory. SDRAMBenchModel simulates the
+main_ram path of SoC.add_sdram() (L2 cache, LiteDRAM core) over a simulated SDRAM, used by
+tools/l2_sweep.py to evaluate L2 cache configurations.
+"""
+
+import copy
+import math
+
+from migen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.integration.soc import SoCRegion
+
+from litedram.common import GeomSettings
+from litedram.core import LiteDRAMCore
+from litedram.phy.model import SDRAMPHYModel
+from litedram.frontend.wishbone import LiteDRAMWishbone2Native
+from litedram.frontend.bist import LiteDRAMBISTGenerator, LiteDRAMBISTChecker
+
+# Wishbone Interleaver -----------------------------------------------------------------------------
+
+class WishboneInterleaver(Module):
+    """Interleave a Wishbone master over 2**n slaves.
+
+    Consecutive blocks of granularity bytes of the master's address space (starting at
+    base_address) are mapped to the slaves in turn; each slave sees a contiguous address space
+    starting at 0.
+    """
+    def __init__(self, master, slaves, base_address=0x00000000, granularity=4096):
+        nslaves    = len(slaves)
+        bytes_word = len(master.dat_w)//8
+        assert nslaves >= 2 and nslaves & (nslaves - 1) == 0
+        assert granularity >= bytes_word and granularity & (granularity - 1) == 0
+        sbits = log2_int(nslaves)
+        gbits = log2_int(granularity//bytes_word)
+
+        # # #
+
+        adr = Signal(len(master.adr))
+        sel = Signal(sbits)
+        self.comb += [
+            adr.eq(master.adr - base_address//bytes_word),
+            sel.eq(adr[gbits:gbits + sbits]),
+        ]
+        cases = {}
+        for i, slave in enumerate(slaves):
+            self.comb += [
+                slave.adr.eq(Cat(adr[:gbits], adr[gbits + sbits:])),
+                slave.dat_w.eq(master.dat_w),
+                slave.sel.eq(master.sel),
+                slave.we.eq(master.we),
+                slave.cti.eq(master.cti),
+                slave.bte.eq(master.bte),
+                slave.cyc.eq(master.cyc & (sel == i)),
+                slave.stb.eq(master.stb & (sel == i)),
+            ]
+            cases[i] = [
+                master.dat_r.eq(slave.dat_r),
+                master.ack.eq(slave.ack),
+                master.err.eq(slave.err),
+            ]
+        self.comb += Case(sel, cases)
+
+# SDRAM Channels -----------------------------------------------------------------------------------
+
+# Channels initialized by software/liblitedram (sdram_channels.c).
+max_sdram_channels = 8
+
+def _add_sdram_core(soc, name, phy, module, **kwargs):
+    core = LiteDRAMCore(
+        phy             = phy,
+        geom_settings   = module.geom_settings,
+        timing_settings = module.timing_settings,
+        clk_freq        = soc.sys_clk_freq,
+        **kwargs)
+    setattr(soc.submodules, name, core)
+    soc.add_csr(name, use_loc_if_exists=True)
+    return core
+
+def _add_sdram_bridge(soc, core, base_address=0x00000000, data_width=None):
+    # Wishbone (SoC data width) --> Wishbone (LiteDRAM port data width) --> LiteDRAM port.
+    port        = core.crossbar.get_port()
+    wb_sdram    = wishbone.Interface(data_width=soc.bus.data_width if data_width is None else data_width)
+    litedram_wb = wishbone.Interface(data_width=port.data_width)
+    soc.submodules += wishbone.Converter(wb_sdram, litedram_wb)
+    soc.submodules += LiteDRAMWishbone2Native(wishbone=litedram_wb, port=port, base_address=base_address)
+    return wb_sdram
+
+def _sdram_size(phy, module, size=None):
+    sdram_size = 2**(module.geom_settings.bankbits +
+                     module.geom_settings.rowbits +
+                     module.geom_settings.colbits)*phy.settings.nranks*phy.settings.databits//8
+    return sdram_size if size is None else min(sdram_size, size)
+
+def _submodule_name(soc, submodule):
+    for name, module in soc._submodules:
+        if module is submodule:
+            return name
+    raise ValueError("{} is not a submodule of the SoC.".format(type(submodule).__name__))
+
+def _add_sdram_csrs(soc, phys):
+    # Locate the CSRs of the sdram<n> cores at the offset of the ones of their PHY from the first
+    # PHY, relative to sdram: the software of sdram then reaches the CSRs of a channel by moving
+    # CSR_BASE by this offset (SDRAM<n>_CSR_BASE).
+    names = [_submodule_name(soc, phy) for phy in phys]
+    for name in names + ["sdram"]:
+        soc.csr.add(name, use_loc_if_exists=True)
+    for n, name in enumerate(names[1:], start=1):
+        offset = soc.csr.locs[name] - soc.csr.locs[names[0]]
+        loc    = soc.csr.locs["sdram"] + offset
+        if not 0 <= loc < soc.csr.n_locs or loc in soc.csr.locs.values():
+            raise ValueError("No CSR location for sdram{} at the offset of {} from {}.".format(
+                n, name, names[0]))
+        soc.csr.add("sdram{}".format(n), loc)
+        soc.add_constant("SDRAM{}_CSR_BASE".format(n), soc.mem_map["csr"] + offset*soc.csr.paging)
+    soc.add_constant("SDRAM_CHANNELS", len(phys))
+
+def add_sdram_channels(soc, phys, module, origin, size=None, interleave=False, granularity=4096,
+    l2_cache_size           = 8192,
+    l2_cache_min_data_width = 128,
+    l2_cache_reverse        = True,
+    **kwargs):
+    """Add a LiteDRAM core per PHY to the SoC, size being the size used on each channel.
+
+    When interleave is False, the first channel is added with SoC.add_sdram() as main_ram (at
+    origin, with the L2 cache) and the others as main_ram1, main_ram2... regions allocated by the
+    SoC. When interleave is True, the channels (2**n) are interleaved with the given granularity
+    in a single main_ram region at origin, behind the L2 cache.
+    """
+    nchannels = len(phys)
+    if nchannels > max_sdram_channels:
+        raise ValueError("At most {} DDRAM channels, got {}.".format(max_sdram_channels, nchannels))
+    if interleave and (nchannels < 2 or nchannels & (nchannels - 1)):
+        raise ValueError("Interleaving needs 2**n (n >= 1) DDRAM channels, got {}.".format(nchannels))
+    soc.add_sdram("sdram",
+        phy                     = phys[0],
+        module                  = module,
+        origin                  = origin,
+        size                    = size,
+        with_soc_interconnect   = not interleave,
+        l2_cache_size           = l2_cache_size,
+        l2_cache_min_data_width = l2_cache_min_data_width,
+        l2_cache_reverse        = l2_cache_reverse,
+        **kwargs)
+    if nchannels == 1:
+        return
+    _add_sdram_csrs(soc, phys)
+    cores = [soc.sdram] + [_add_sdram_core(soc, "sdram{}".format(n), phy, module, **kwargs)
+        for n, phy in enumerate(phys[1:], start=1)]
+    if not interleave:
+        for n, (phy, core) in enumerate(zip(phys[1:], cores[1:]), start=1):
+            region = soc.bus.alloc_region("main_ram{}".format(n), _sdram_size(phy, module, size))
+            soc.bus.add_slave("main_ram{}".format(n), _add_sdram_bridge(soc, core, region.origin), region)
+        return
+
+    # Interleaved channels: Wishbone --> (L2 Cache) --> Interleaver --> LiteDRAM ports, each channel
+    # seeing a contiguous address space starting at 0.
+    soc.add_constant("SDRAM_CHANNELS_INTERLEAVED")
+    channel_size = min(_sdram_size(phy, module, size) for phy in phys)
+    origin       = soc.mem_map.get("main_ram", origin)
+    if origin + nchannels*channel_size > 2**soc.bus.address_width:
+        raise ValueError("Interleaved main_ram of {} channels of 0x{:x} bytes above the address space, "
+                         "reduce the size of the channels (max_sdram_size).".format(nchannels, channel_size))
+    wb_sdram = wishbone.Interface(data_width=soc.bus.data_width)
+    if l2_cache_size != 0:
+        port_data_width = cores[0].crossbar.controller.data_width
+        l2_cache_size   = max(l2_cache_size, int(2*port_data_width/8))
+        l2_cache_size   = 2**int(math.log2(l2_cache_size))
+        soc.submodules.l2_cache = wishbone.Cache(
+            cachesize = l2_cache_size//4,
+            master    = wb_sdram,
+            slave     = wishbone.Interface(max(port_data_width, l2_cache_min_data_width)),
+            reverse   = l2_cache_reverse)
+        soc.add_config("L2_SIZE", l2_cache_size)
+        wb_interleaved = soc.l2_cache.slave
+    else:
+        wb_interleaved = wb_sdram
+    slaves = [_add_sdram_bridge(soc, core, data_width=len(wb_interleaved.dat_w)) for core in cores]
+    soc.submodules.sdram_interleaver = WishboneInterleaver(wb_interleaved, slaves,
+        base_address = origin,
+        granularity  = granularity)
+    soc.bus.add_slave("main_ram", wb_sdram, SoCRegion(origin=origin, size=nchannels*channel_size, mode="rwx"))
+
+# SDRAM Benchmark ----------------------------------------------------------------------------------
+
+# SoC bridges a host can use to access the BIST CSRs (through litex_server).
+_bench_bridges = ["uartbone", "etherbone", "jtagbone"]
+
+def add_sdram_bench(soc):
+    """Add BIST generator/checker ports to each LiteDRAM core (sdram, sdram1...) of the SoC.
+
+    The ports are named <core>_generator/<core>_checker (as SoC.add_sdram(with_bist=True) does) and
+    their data width/the size of the memory exported as <CORE>_BENCH_DATA_WIDTH/<CORE>_BENCH_SIZE
+    constants. Return the names of the cores.
+    """
+    cores = []
+    for name, module in list(soc._submodules):
+        if not isinstance(module, LiteDRAMCore) or hasattr(soc, name + "_generator"):
+            continue
+        port = module.crossbar.get_port()
+        setattr(soc.submodules, name + "_generator", LiteDRAMBISTGenerator(port))
+        setattr(soc.submodules, name + "_checker",   LiteDRAMBISTChecker(module.crossbar.get_port()))
+        soc.add_csr(name + "_generator")
+        soc.add_csr(name + "_checker")
+        soc.add_constant(name + "_bench_data_width", port.data_width)
+        soc.add_constant(name + "_bench_size",       2**port.address_width*port.data_width//8)
+        cores.append(name)
+    if cores and not any(bridge in soc.bus.masters for bridge in _bench_bridges):
+        soc.logger.warning("DRAM benchmark without a host bridge, use --uart-name=uartbone, "
+                           "--with-etherbone or --with-jtagbone when available.")
+    return cores
+
+# SDRAM Benchmark Model ----------------------------------------------------------------------------
+
+class SDRAMBenchModel(Module):
+    """main_ram path of SoC.add_sdram() (Wishbone bus, L2 cache, LiteDRAM core) over a SDRAMPHYModel.
+
+    The PHY settings/module are the ones of the board; the rows of the module are limited to cover
+    size bytes to keep the simulated memory small (the benchmarked accesses must stay below size),
+    the address width of the module being kept (A10 selects all the banks on precharges).
+    """
+    def __init__(self, module, phy_settings, clk_freq, size=2**16,
+        bus_data_width          = 32,
+        l2_cache_size           = 8192,
+        l2_cache_min_data_width = 128,
+        l2_cache_reverse        = True):
+        self.bus    = wishbone.Interface(data_width=bus_data_width)
+        self.cycles = Signal(32)
+
+        # # #
+
+        self.sync += self.cycles.eq(self.cycles + 1)
+
+        # Simulated SDRAM.
+        geom     = module.geom_settings
+        row_size = 2**(geom.bankbits + geom.colbits)*phy_settings.nranks*phy_settings.databits//8
+        module   = copy.copy(module)
+        module.geom_settings = GeomSettings(
+            bankbits = geom.bankbits,
+            rowbits  = min(geom.rowbits, max(1, math.ceil(math.log2(max(size//row_size, 1))))),
+            colbits  = geom.colbits)
+        module.geom_settings.addressbits = geom.addressbits
+        self.submodules.phy   = SDRAMPHYModel(module, phy_settings, clk_freq=clk_freq)
+        self.submodules.sdram = LiteDRAMCore(
+            phy             = self.phy,
+            geom_settings   = module.geom_settings,
+            timing_settings = module.timing_settings,
+            clk_freq        = clk_freq)
+
+        # Wishbone --> (L2 Cache) --> LiteDRAM port, as SoC.add_sdram().
+        port = self.sdram.crossbar.get_port()
+        port.data_width = 2**int(math.log2(port.data_width))
+        if l2_cache_size != 0:
+            l2_cache_size = max(l2_cache_size, int(2*port.data_width/8))
+            l2_cache_size = 2**int(math.log2(l2_cache_size))
+            self.submodules.l2_cache = wishbone.Cache(
+                cachesize = l2_cache_size//4,
+                master    = self.bus,
+                slave     = wishbone.Interface(max(port.data_width, l2_cache_min_data_width)),
+                reverse   = l2_cache_reverse)
+            litedram_wb = self.l2_cache.slave
+        else:
+            litedram_wb = wishbone.Interface(port.data_width)
+            self.submodules += wishbone.Converter(self.bus, litedram_wb)
+        self.submodules += LiteDRAMWishbone2Native(wishbone=litedram_wb, port=port)
+
+    def run(self, accesses, results):
+        """Simulation generator running the (we, byte address) accesses, results in results."""
+        yield self.sdram.dfii._control.storage.eq(1) # DFI under hardware control.
+        yield
+        written = {}
+        errors  = 0
+        word    = len(self.bus.dat_w)//8
+        start   = (yield self.cycles)
+        for we, address in accesses:
+            if we:
+                yield from self.bus.write(address//word, address)
+                written[address//word] = address
+            else:
+                data = (yield from self.bus.read(address//word))
+                if address//word in written and data != written[address//word]:
+                    errors += 1
+        results["cycles"] = (yield self.cycles) - start
+        results["errors"] = errors
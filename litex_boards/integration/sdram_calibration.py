@@ -0,0 +1,109 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""SDRAM calibration stored in SPI Flash.
+
+The BIOS calibrates the DDR PHYs (write leveling, read leveling...) on each boot by sweeping the
+delays/bitslips of each module. add_sdram_calibration_cache() adds a shadow of these delays to the
+SoC (SDRAMPHYDelayShadow, counting the increments done by software on each delay since its last
+reset) and the Builder then replaces LiteX's liblitedram with the one of software/liblitedram,
+wrapping sdram_init():
+
+- When a valid calibration is stored in the reserved SPI Flash sector, the SDRAM is initialized
+  and the calibration replayed (reset + same number of increments of each delay), then checked with
+  a memtest.
+- Otherwise, or when the memtest fails, the full calibration of LiteX's sdram_init() is run and the
+  resulting delays are stored in the sector.
+
+The stored calibration is tied to the PHY/memory type/system clock frequency of the SoC.
+"""
+
+import os
+import zlib
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+
+# liblitedram software package wrapping LiteX's one.
+liblitedram_directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), "software", "liblitedram")
+
+# Delays of the DDR PHYs: (name, reset CSR, increment CSR, per module).
+phy_delays = [
+    ("rdly_dq",         "rdly_dq_rst",         "rdly_dq_inc",     True),
+    ("rdly_dq_bitslip", "rdly_dq_bitslip_rst", "rdly_dq_bitslip", True),
+    ("wdly_dq",         "wdly_dq_rst",         "wdly_dq_inc",     True),
+    ("wdly_dqs",        "wdly_dqs_rst",        "wdly_dqs_inc",    True),
+    ("wdly_dq_bitslip", "wdly_dq_bitslip_rst", "wdly_dq_bitslip", True),
+    ("cdly",            "cdly_rst",            "cdly_inc",        False),
+]
+
+# SPI Flash erase sector of the BIOS (SE_CMD, 64KiB).
+spiflash_sector_size = 65536
+
+# PHY Delay Shadow ---------------------------------------------------------------------------------
+
+class SDRAMPHYDelayShadow(Module, AutoCSR):
+    """Shadow of the delays/bitslips set by software on a DDR PHY.
+
+    Snoops the dly_sel/<delay>_rst/<delay>_inc CSRs of the PHY and counts, for each module, the
+    increments of each delay since its last reset. The count of the module selected with sel is
+    read on the <delay> CSRs.
+    """
+    def __init__(self, phy, width=16):
+        nmodules  = len(phy._dly_sel.storage)
+        self._sel = CSRStorage(bits_for(nmodules - 1), name="sel")
+        self.delays = []
+
+        # # #
+
+        for name, rst, inc, per_module in phy_delays:
+            if not (hasattr(phy, "_" + rst) and hasattr(phy, "_" + inc)):
+                continue
+            rst    = getattr(phy, "_" + rst).re
+            inc    = getattr(phy, "_" + inc).re
+            counts = Array(Signal(width) for i in range(nmodules if per_module else 1))
+            for i, count in enumerate(counts):
+                sel = phy._dly_sel.storage[i] if per_module else 1
+                self.sync += [
+                    If(sel & rst,
+                        count.eq(0)
+                    ).Elif(sel & inc,
+                        count.eq(count + 1)
+                    )
+                ]
+            status = CSRStatus(width, name=name)
+            setattr(self, "_" + name, status)
+            self.comb += status.status.eq(counts[self._sel.storage] if per_module else counts[0])
+            self.delays.append(name)
+
+# SDRAM Calibration Cache --------------------------------------------------------------------------
+
+def add_spi_flash(soc):
+    """Add the spiflash of the platform to the SoC (when not already present), writable by the BIOS."""
+    if not hasattr(soc, "spiflash"):
+        if not any(io[0] == "spiflash" for io in soc.platform.constraint_manager.available):
+            raise ValueError("{} has no spiflash.".format(soc.platform.name))
+        soc.add_spi_flash(mode="1x", dummy_cycles=8)
+    for name, value in [("SPIFLASH_PAGE_SIZE", 256), ("SPIFLASH_SECTOR_SIZE", spiflash_sector_size)]:
+        if name not in soc.constants:
+            soc.add_constant(name, value)
+
+def add_sdram_calibration_cache(soc, flash_offset, phy_name="ddrphy"):
+    """Store the SDRAM calibration of the SoC in the SPI Flash sector at flash_offset."""
+    phy = getattr(soc, phy_name, None)
+    if phy is None or not hasattr(phy, "_dly_sel"):
+        raise ValueError("{}: no DDR PHY with software calibration.".format(type(soc).__name__))
+    if flash_offset % spiflash_sector_size:
+        raise ValueError("SDRAM calibration offset 0x{:x} not aligned on a 0x{:x} bytes sector.".format(
+            flash_offset, spiflash_sector_size))
+    add_spi_flash(soc)
+    soc.submodules.sdram_calibration = SDRAMPHYDelayShadow(phy)
+    soc.add_csr("sdram_calibration")
+    config = "{}:{}:{}:{}".format(type(phy).__name__, phy.settings.memtype, soc.sys_clk_freq,
+        ",".join(soc.sdram_calibration.delays))
+    soc.add_constant("SDRAM_CALIBRATION_FLASH_OFFSET", flash_offset)
+    soc.add_constant("SDRAM_CALIBRATION_ID",           zlib.crc32(config.encode()))
@@ -0,0 +1,152 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Multi-seed place-and-route for the nextpnr based toolchains (Trellis, IceStorm, Oxide).
+
+The build script generated by LiteX (yosys, nextpnr, pre-packer and packer commands) is split:
+synthesis is run once in the gateware directory, then nextpnr and the packer are run for each seed
+in gateware/seeds/<seed>, with the inputs of the gateware directory linked. The outputs of the seed
+with the best Fmax (highest ratio of Fmax over the requested frequency on its worst clock) are
+copied back to the gateware directory and the spread of the results is reported.
+"""
+
+import os
+import re
+import json
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from litex_boards.integration.cache import input_extensions
+from litex_boards.integration.report import parse_nextpnr
+
+# Inputs of nextpnr/packers linked in the seed directories (in addition to the toolchain inputs).
+seed_input_extensions = input_extensions | {".json", ".py"}
+
+# Script -------------------------------------------------------------------------------------------
+
+def split_script(script):
+    """Split a build script in (synthesis commands, nextpnr command, post-nextpnr commands)."""
+    commands = []
+    for line in script.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("@echo") or line.startswith("rem ") or line == "set -e":
+            continue
+        commands.append(re.sub(r"\s*\|\|\s*exit /b$", "", line)) # Windows failure statements.
+    for n, command in enumerate(commands):
+        if command.startswith("nextpnr-"):
+            return commands[:n], command, commands[n + 1:]
+    raise ValueError("No nextpnr command found in build script.")
+
+def seed_command(command, seed):
+    """Return the nextpnr command with its seed set to seed."""
+    if re.search(r"--seed\s+\d+", command):
+        return re.sub(r"--seed\s+\d+", "--seed {}".format(seed), command)
+    return command + " --seed {}".format(seed)
+
+# Results ------------------------------------------------------------------------------------------
+
+def seed_score(clocks):
+    """Ratio of Fmax over the requested frequency on the worst clock (None without timing)."""
+    ratios = [c["fmax"]*c["period"]/1e3 for c in clocks.values() if c["fmax"] and c["period"]]
+    return min(ratios) if ratios else None
+
+def best_seed(results):
+    """Return the seed of the results ({seed: {"score": ...}}) with the best score, None if none."""
+    scored = [(r["score"], seed) for seed, r in results.items() if r.get("score") is not None]
+    if not scored:
+        return None
+    return max(scored, key=lambda s: (s[0], -s[1]))[1]
+
+def spread(results):
+    """Return the {clock: {"min": fmax, "max": fmax}} spread of the results."""
+    r = {}
+    for result in results.values():
+        for clock, values in result.get("clocks", {}).items():
+            if values["fmax"] is None:
+                continue
+            s = r.setdefault(clock, {"min": values["fmax"], "max": values["fmax"]})
+            s["min"] = min(s["min"], values["fmax"])
+            s["max"] = max(s["max"], values["fmax"])
+    return r
+
+# Run ----------------------------------------------------------------------------------------------
+
+def _run(commands, cwd, log):
+    with open(log, "wb") as f:
+        for command in commands:
+            if subprocess.call(command, shell=True, cwd=cwd, stdout=f, stderr=subprocess.STDOUT) != 0:
+                return False
+    return True
+
+def _run_seed(gateware_dir, build_name, seed, nextpnr, post):
+    seed_dir = os.path.join(gateware_dir, "seeds", str(seed))
+    shutil.rmtree(seed_dir, ignore_errors=True)
+    os.makedirs(seed_dir)
+    for f in os.listdir(gateware_dir):
+        filename = os.path.join(gateware_dir, f)
+        if os.path.isfile(filename) and os.path.splitext(f)[1] in seed_input_extensions:
+            try:
+                os.symlink(os.path.abspath(filename), os.path.join(seed_dir, f))
+            except OSError:
+                shutil.copyfile(filename, os.path.join(seed_dir, f))
+    log = os.path.join(seed_dir, "build_" + build_name + ".log")
+    if not _run([seed_command(nextpnr, seed)] + post, seed_dir, log):
+        return {"dir": seed_dir, "error": "Error occured during place-and-route, see {}.".format(log)}
+    utilization, clocks = parse_nextpnr(seed_dir, build_name)
+    return {"dir": seed_dir, "clocks": clocks, "score": seed_score(clocks)}
+
+def run_seeds(gateware_dir, build_name, script, seeds, jobs=None, run_synthesis=None):
+    """Run place-and-route for seeds on the build script of gateware_dir, return the results.
+
+    run_synthesis(commands) runs the synthesis commands in gateware_dir (by default, logged to
+    build_<build_name>.log). The outputs of the best seed are copied to gateware_dir and its
+    nextpnr log appended to build_<build_name>.log.
+    """
+    with open(os.path.join(gateware_dir, script), "r") as f:
+        synthesis, nextpnr, post = split_script(f.read())
+    log = os.path.join(gateware_dir, "build_" + build_name + ".log")
+    if run_synthesis is None:
+        run_synthesis = lambda commands: _run(commands, gateware_dir, log)
+    if not run_synthesis(synthesis):
+        raise OSError("Error occured during synthesis.")
+
+    with ThreadPoolExecutor(max_workers=jobs or len(seeds)) as executor:
+        results = dict(zip(seeds, executor.map(
+            lambda seed: _run_seed(gateware_dir, build_name, seed, nextpnr, post), seeds)))
+
+    best = best_seed(results)
+    if best is None:
+        raise OSError("No seed completed place-and-route:\n" + "\n".join(
+            "- {}: {}".format(seed, r.get("error", "no timing")) for seed, r in sorted(results.items())))
+    best_dir = results[best]["dir"]
+    for f in os.listdir(best_dir):
+        filename = os.path.join(best_dir, f)
+        if os.path.isfile(filename) and not os.path.islink(filename) and f != os.path.basename(log):
+            shutil.copyfile(filename, os.path.join(gateware_dir, f))
+    with open(log, "a") as f, open(os.path.join(best_dir, os.path.basename(log)), "r") as l:
+        f.write("\nPlace-and-route of seed {}:\n".format(best))
+        f.write(l.read())
+    return best, results
+
+def print_results(best, results):
+    print("Place-and-route seeds (best: {}):".format(best))
+    for seed, r in sorted(results.items()):
+        if "error" in r:
+            print("- {:>4}: {}".format(seed, r["error"]))
+            continue
+        fmax = ", ".join("{} {:.2f}MHz".format(clock, v["fmax"]) for clock, v in sorted(r["clocks"].items()) if v["fmax"])
+        print("{} {:>4}: {}".format("*" if seed == best else "-", seed, fmax))
+    for clock, s in sorted(spread(results).items()):
+        print("Spread {}: {:.2f}MHz - {:.2f}MHz ({:.2f}MHz).".format(clock, s["min"], s["max"], s["max"] - s["min"]))
+
+def write_results(filename, best, results):
+    with open(filename, "w") as f:
+        json.dump({
+            "best"   : best,
+            "seeds"  : {str(seed): {k: v for k, v in r.items() if k != "dir"} for seed, r in results.items()},
+            "spread" : spread(results),
+        }, f, indent=4)
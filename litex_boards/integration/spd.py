@@ -0,0 +1,111 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""SDRAM module selection from a JEDEC SPD dump.
+
+SODIMM/DIMM targets default to the module fitted on the board; with --sdram-spd, the geometry and
+timings of the controller are derived from the SPD EEPROM content of the fitted module instead
+(through LiteDRAM's SDRAMModule.from_spd_data). The dump is either a raw binary file or the output
+of the BIOS sdram_spd command, available when the SoC has an I2C master on the SPD bus (ex: KC705
+with --with-i2c, selecting the SODIMM channel (6) of the PCA9548 I2C mux first, the mux keeping the
+last byte it received as its channels mask):
+
+    litex> i2c_write 0x74 0x40
+    litex> sdram_spd 0
+
+(BIOS with an <addr_size> i2c_write argument: i2c_write 0x74 0x40 1, 0x40 being sent alone.)
+
+The SPD data is also stored in the ROM of the SoC: sdram_spd then verifies that the fitted module
+matches the one the gateware was built for.
+"""
+
+# Only the first 256 bytes are read by the BIOS (and used by LiteDRAM, DDR4 included).
+spd_size = 256
+
+# JEDEC memory types (byte 2).
+spd_memtypes = {
+    0x0b: "DDR3",
+    0x0c: "DDR4",
+}
+
+# JEDEC module types (byte 3, bits 3:0).
+spd_module_types = {
+    0x1: "RDIMM",
+    0x2: "UDIMM",
+    0x3: "SO-DIMM",
+    0x4: "LRDIMM",
+}
+
+# Parsing ------------------------------------------------------------------------------------------
+
+def parse_spd_hexdump(text):
+    """Parse the output of the BIOS sdram_spd command.
+
+    Only the first dump is used (the BIOS dumps the SPD data of the gateware after the EEPROM
+    content when they differ).
+    """
+    data = []
+    last = -1
+    for line in text.splitlines():
+        tokens = line.strip().split()
+        if not tokens or not tokens[0].startswith("0x"):
+            continue
+        address = int(tokens[0], 16)
+        if address <= last:
+            break
+        data.extend(int(v, 16) for v in tokens[1:17] if len(v) == 2)
+        last = address
+    return data
+
+def load_spd(filename):
+    """Load the SPD data (list of bytes) of a binary or BIOS hexdump file."""
+    with open(filename, "rb") as f:
+        content = f.read()
+    try:
+        text = content.decode("ascii")
+    except UnicodeDecodeError:
+        text = None
+    data = parse_spd_hexdump(text) if text is not None and "0x" in text else list(content)
+    if len(data) < 128:
+        raise ValueError("{}: SPD data too short ({} bytes).".format(filename, len(data)))
+    return data[:spd_size]
+
+# Checks -------------------------------------------------------------------------------------------
+
+def spd_crc(data):
+    """CRC16 (XMODEM) of the SPD base configuration, as stored in bytes 126/127."""
+    # DDR3 may only cover bytes 0-116 (byte 0, bit 7).
+    length = 117 if (data[2] == 0x0b and data[0] & 0x80) else 126
+    crc = 0
+    for byte in data[:length]:
+        crc ^= byte << 8
+        for i in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+            crc &= 0xffff
+    return crc
+
+def check_spd(data, memtype=None, registered=None):
+    """Check the SPD data (CRC, memory/module type), raise ValueError on mismatch."""
+    if data[2] not in spd_memtypes:
+        raise ValueError("Unsupported SPD memory type 0x{:02x}.".format(data[2]))
+    if spd_crc(data) != data[126] | (data[127] << 8):
+        raise ValueError("SPD CRC mismatch, corrupted dump?")
+    if memtype is not None and spd_memtypes[data[2]] != memtype:
+        raise ValueError("SPD of a {} module, {} expected.".format(spd_memtypes[data[2]], memtype))
+    module_type = spd_module_types.get(data[3] & 0xf, "0x{:x}".format(data[3] & 0xf))
+    if registered is not None and (module_type in ["RDIMM", "LRDIMM"]) != registered:
+        raise ValueError("SPD of a {} module, {} module expected.".format(module_type,
+            "registered" if registered else "unbuffered"))
+
+# Module -------------------------------------------------------------------------------------------
+
+def sdram_module(module_cls, clk_freq, rate, spd=None):
+    """Return a module_cls SDRAM module, with the geometry/timings of the spd file when provided."""
+    if spd is None:
+        return module_cls(clk_freq, rate)
+    data = load_spd(spd)
+    check_spd(data, memtype=module_cls.memtype, registered=getattr(module_cls, "registered", False))
+    return module_cls.from_spd_data(data, clk_freq)
@@ -0,0 +1,41 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""LiteX-Boards target options.
+
+Features shared by all the boards that add gateware to the SoC of the target: target_args() adds
+their arguments to the parser of the target and add_target_options() applies them to the SoC,
+before it is passed to the Builder:
+
+    soc = BaseSoC(...)
+    add_target_options(soc, **target_argdict(args))
+    builder = Builder(soc, **builder_argdict(args))
+"""
+
+# Target Options -----------------------------------------------------------------------------------
+
+def add_target_options(soc, with_dram_bench=False, sdram_calibration_offset=None):
+    if with_dram_bench:
+        # BIST ports added before the SoC (and LiteDRAM crossbar) are finalized.
+        from litex_boards.integration.sdram import add_sdram_bench
+        if not add_sdram_bench(soc):
+            raise ValueError("--with-dram-bench: {} has no LiteDRAM core.".format(type(soc).__name__))
+    if sdram_calibration_offset is not None:
+        # Calibration stored in SPI Flash (the Builder then uses the liblitedram replaying it).
+        from litex_boards.integration.sdram_calibration import add_sdram_calibration_cache
+        add_sdram_calibration_cache(soc, sdram_calibration_offset)
+
+# Arguments ----------------------------------------------------------------------------------------
+
+def target_args(parser):
+    parser.add_argument("--with-dram-bench",          action="store_true", help="Add LiteDRAM BIST ports for DRAM bandwidth/latency measurements (see tools/dram_bench.py)")
+    parser.add_argument("--sdram-calibration-offset", default=None,        help="Store the SDRAM calibration in the SPI Flash sector at this offset, replayed at boot")
+
+def target_argdict(args):
+    r = dict()
+    r["with_dram_bench"]          = args.with_dram_bench
+    r["sdram_calibration_offset"] = None if args.sdram_calibration_offset is None else int(args.sdram_calibration_offset, 0)
+    return r
@@ -0,0 +1,54 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""LiteX-Boards platforms.
+
+Boards can be listed and described from a precomputed index (see tools/generate_index.py) without
+importing their modules; a platform module is only imported when requested with get():
+
+    >>> from litex_boards import platforms
+    >>> platforms.boards(vendor="lattice")
+    >>> platforms.info("arty")["devices"]
+    >>> platform = platforms.get("arty").Platform(variant="a7-100")
+"""
+
+import importlib
+
+from litex_boards.platforms._index import index as _index
+
+def boards(vendor=None, device=None):
+    """Return the sorted names of the platforms, optionally filtered by vendor/device."""
+    r = []
+    for name, info in sorted(_index.items()):
+        if vendor is not None and info["vendor"] != vendor:
+            continue
+        if device is not None and not any(d.lower().startswith(device.lower()) for d in info["devices"]):
+            continue
+        r.append(name)
+    return r
+
+def vendors():
+    """Return the sorted vendors of the platforms."""
+    return sorted(set(info["vendor"] for info in _index.values() if info["vendor"] is not None))
+
+def devices(vendor=None):
+    """Return the sorted FPGA devices of the platforms, optionally filtered by vendor."""
+    return sorted(set(d for name in boards(vendor=vendor) for d in _index[name]["devices"]))
+
+def variants(name):
+    """Return the variants of a platform as a dict: parameter -> possible values."""
+    return {k: list(v) for k, v in info(name)["variants"].items()}
+
+def info(name):
+    """Return the indexed information of a platform (vendor, devices, variants, default clock)."""
+    if name not in _index:
+        raise ValueError("Unknown platform {}, available: {}.".format(name, ", ".join(boards())))
+    return dict(_index[name])
+
+def get(name):
+    """Import and return the module of a platform."""
+    info(name)
+    return importlib.import_module(__name__ + "." + name)
@@ -0,0 +1,359 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Generated by litex_boards/tools/generate_index.py, do not edit.
+
+index = {   'ac701': {   'default_clk_name': 'clk156',
+                 'default_clk_period': 6.389776357827476,
+                 'devices': ['xc7a200t-fbg676-2'],
+                 'variants': {},
+                 'vendor': 'xilinx'},
+    'acorn_cle_215': {   'default_clk_name': 'clk200',
+                         'default_clk_period': 5.0,
+                         'devices': ['xc7a200t-fbg484-2'],
+                         'variants': {},
+                         'vendor': 'xilinx'},
+    'aller': {   'default_clk_name': 'clk100',
+                 'default_clk_period': 10.0,
+                 'devices': ['xc7a200t-fbg484-2'],
+                 'variants': {},
+                 'vendor': 'xilinx'},
+    'alveo_u250': {   'default_clk_name': 'clk300',
+                      'default_clk_period': 3.3333333333333335,
+                      'devices': ['xcu250-figd2104-2L-e'],
+                      'variants': {},
+                      'vendor': 'xilinx'},
+    'arrow_sockit': {   'default_clk_name': 'clk50',
+                        'default_clk_period': 20.0,
+                        'devices': ['5CSXFC6D6F31C8', '5CSXFC6D6F31C8ES'],
+                        'variants': {'revision': ['revb', 'revc', 'revd']},
+                        'vendor': 'intel'},
+    'arty': {   'default_clk_name': 'clk100',
+                'default_clk_period': 10.0,
+                'devices': ['xc7a100tcsg324-1', 'xc7a35ticsg324-1L'],
+                'toolchain': 'vivado',
+                'variants': {'variant': ['a7-35', 'a7-100']},
+                'vendor': 'xilinx'},
+    'arty_s7': {   'default_clk_name': 'clk100',
+                   'default_clk_period': 10.0,
+                   'devices': ['xc7s25csga324-1', 'xc7s50csga324-1'],
+                   'variants': {'variant': ['s7-25', 's7-50']},
+                   'vendor': 'xilinx'},
+    'avalanche': {   'default_clk_name': 'clk50',
+                     'default_clk_period': 20.0,
+                     'devices': ['MPF300TS_ES-FCG484-1'],
+                     'variants': {},
+                     'vendor': 'microsemi'},
+    'c10lprefkit': {   'default_clk_name': 'clk12',
+                       'default_clk_period': 83.33333333333333,
+                       'devices': ['10CL055YU484A7G'],
+                       'variants': {},
+                       'vendor': 'intel'},
+    'camlink_4k': {   'default_clk_name': 'clk27',
+                      'default_clk_period': 37.03703703703704,
+                      'devices': ['LFE5U-25F-8BG381C'],
+                      'toolchain': 'trellis',
+                      'variants': {},
+                      'vendor': 'lattice'},
+    'colorlight_5a_75b': {   'default_clk_name': 'clk25',
+                             'default_clk_period': 40.0,
+                             'devices': ['LFE5U-25F-6BG256C', 'LFE5U-25F-6BG381C'],
+                             'toolchain': 'trellis',
+                             'variants': {'revision': ['6.1', '7.0', '8.0']},
+                             'vendor': 'lattice'},
+    'colorlight_5a_75e': {   'default_clk_name': 'clk25',
+                             'default_clk_period': 40.0,
+                             'devices': ['LFE5U-25F-6BG256C'],
+                             'toolchain': 'trellis',
+                             'variants': {'revision': ['6.0', '7.1']},
+                             'vendor': 'lattice'},
+    'colorlight_i5': {   'default_clk_name': 'clk25',
+                         'default_clk_period': 40.0,
+                         'devices': ['LFE5U-25F-6BG381C'],
+                         'toolchain': 'trellis',
+                         'variants': {'revision': ['7.0']},
+                         'vendor': 'lattice'},
+    'crosslink_nx_evn': {   'default_clk_name': 'clk12',
+                            'default_clk_period': 83.33333333333333,
+                            'devices': ['LIFCL-40-9BG400C'],
+                            'toolchain': 'radiant',
+                            'variants': {'device': ['LIFCL']},
+                            'vendor': 'lattice'},
+    'crosslink_nx_vip': {   'default_clk_name': 'clk12',
+                            'default_clk_period': 83.33333333333333,
+                            'devices': ['LIFCL-40-9BG400C'],
+                            'toolchain': 'radiant',
+                            'variants': {'device': ['LIFCL']},
+                            'vendor': 'lattice'},
+    'de0nano': {   'default_clk_name': 'clk50',
+                   'default_clk_period': 20.0,
+                   'devices': ['EP4CE22F17C6'],
+                   'variants': {},
+                   'vendor': 'intel'},
+    'de10lite': {   'default_clk_name': 'clk50',
+                    'default_clk_period': 20.0,
+                    'devices': ['10M50DAF484C7G'],
+                    'variants': {},
+                    'vendor': 'intel'},
+    'de10nano': {   'default_clk_name': 'clk50',
+                    'default_clk_period': 20.0,
+                    'devices': ['5CSEBA6U23I7'],
+                    'variants': {},
+                    'vendor': 'intel'},
+    'de1soc': {   'default_clk_name': 'clk50',
+                  'default_clk_period': 20.0,
+                  'devices': ['5CSEMA5F31C6'],
+                  'variants': {},
+                  'vendor': 'intel'},
+    'de2_115': {   'default_clk_name': 'clk50',
+                   'default_clk_period': 20.0,
+                   'devices': ['EP4CE115F29C7'],
+                   'variants': {},
+                   'vendor': 'intel'},
+    'ecp5_evn': {   'default_clk_name': 'clk12',
+                    'default_clk_period': 83.33333333333333,
+                    'devices': ['LFE5UM5G-85F-8BG381'],
+                    'toolchain': 'trellis',
+                    'variants': {},
+                    'vendor': 'lattice'},
+    'ecpix5': {   'default_clk_name': 'clk100',
+                  'default_clk_period': 10.0,
+                  'devices': ['LFE5UM5G-85F-8BG554I'],
+                  'toolchain': 'trellis',
+                  'variants': {'device': ['85F']},
+                  'vendor': 'lattice'},
+    'fk33': {   'default_clk_name': 'clk200',
+                'default_clk_period': 5.0,
+                'devices': ['xcvu33p-fsvh2104-2L-e-es1'],
+                'variants': {},
+                'vendor': 'xilinx'},
+    'fomu_evt': {   'default_clk_name': 'clk48',
+                    'default_clk_period': 20.833333333333332,
+                    'devices': ['ice40-up5k-sg48'],
+                    'toolchain': 'icestorm',
+                    'variants': {},
+                    'vendor': 'lattice'},
+    'fomu_hacker': {   'default_clk_name': 'clk48',
+                       'default_clk_period': 20.833333333333332,
+                       'devices': ['ice40-up5k-uwg30'],
+                       'toolchain': 'icestorm',
+                       'variants': {},
+                       'vendor': 'lattice'},
+    'fomu_pvt': {   'default_clk_name': 'clk48',
+                    'default_clk_period': 20.833333333333332,
+                    'devices': ['ice40-up5k-uwg30'],
+                    'toolchain': 'icestorm',
+                    'variants': {},
+                    'vendor': 'lattice'},
+    'fpc_iii': {   'default_clk_name': 'clk25',
+                   'default_clk_period': 40.0,
+                   'devices': ['LFE5U-85F-8BG381'],
+                   'toolchain': 'trellis',
+                   'variants': {},
+                   'vendor': 'lattice'},
+    'genesys2': {   'default_clk_name': 'clk200',
+                    'default_clk_period': 5.0,
+                    'devices': ['xc7k325t-ffg900-2'],
+                    'variants': {},
+                    'vendor': 'xilinx'},
+    'hadbadge': {   'default_clk_name': 'clk8',
+                    'default_clk_period': 125.0,
+                    'devices': ['LFE5U-45F-8CABGA381'],
+                    'toolchain': 'trellis',
+                    'variants': {},
+                    'vendor': 'lattice'},
+    'icebreaker': {   'default_clk_name': 'clk12',
+                      'default_clk_period': 83.33333333333333,
+                      'devices': ['ice40-up5k-sg48'],
+                      'toolchain': 'icestorm',
+                      'variants': {},
+                      'vendor': 'lattice'},
+    'kc705': {   'default_clk_name': 'clk156',
+                 'default_clk_period': 6.389776357827476,
+                 'devices': ['xc7k325t-ffg900-2'],
+                 'variants': {},
+                 'vendor': 'xilinx'},
+    'kcu105': {   'default_clk_name': 'clk125',
+                  'default_clk_period': 8.0,
+                  'devices': ['xcku040-ffva1156-2-e'],
+                  'variants': {},
+                  'vendor': 'xilinx'},
+    'kx2': {   'default_clk_name': 'clk200',
+               'default_clk_period': 5.0,
+               'devices': ['xc7k160tffg676-2'],
+               'variants': {},
+               'vendor': 'xilinx'},
+    'linsn_rv901t': {   'default_clk_name': 'clk25',
+                        'default_clk_period': 40.0,
+                        'devices': ['xc6slx16-2-ftg256'],
+                        'variants': {},
+                        'vendor': 'xilinx'},
+    'litefury': {   'default_clk_name': 'clk200',
+                    'default_clk_period': 5.0,
+                    'devices': ['xc7a100t-fgg484-2l'],
+                    'variants': {},
+                    'vendor': 'xilinx'},
+    'logicbone': {   'default_clk_name': 'clk25',
+                     'default_clk_period': 40.0,
+                     'devices': ['LFE5UM5G-45F-8BG381C'],
+                     'toolchain': 'trellis',
+                     'variants': {'device': ['45F'], 'revision': ['rev0']},
+                     'vendor': 'lattice'},
+    'machxo3': {   'default_clk_name': 'clk12',
+                   'default_clk_period': 83.33333333333333,
+                   'devices': ['LCMXO3L-6900C-5BG256C'],
+                   'variants': {},
+                   'vendor': 'lattice'},
+    'marblemini': {   'default_clk_name': 'clk20_vcxo',
+                      'default_clk_period': 50.0,
+                      'devices': ['xc7a100t-2fgg484'],
+                      'variants': {},
+                      'vendor': 'xilinx'},
+    'mercury_xu5': {   'default_clk_name': 'clk100',
+                       'default_clk_period': 10.0,
+                       'devices': ['xczu2eg-sfvc784-1-i'],
+                       'variants': {},
+                       'vendor': 'xilinx'},
+    'mimas_a7': {   'default_clk_name': 'clk100',
+                    'default_clk_period': 10.0,
+                    'devices': ['xc7a50tfgg484-1'],
+                    'variants': {},
+                    'vendor': 'xilinx'},
+    'minispartan6': {   'default_clk_name': 'clk32',
+                        'default_clk_period': 31.25,
+                        'devices': ['xc6slx25-3-ftg256'],
+                        'variants': {'device': ['xc6slx25']},
+                        'vendor': 'xilinx'},
+    'mist': {   'default_clk_name': 'clk27',
+                'default_clk_period': 37.03703703703704,
+                'devices': ['EP3C25E144C8'],
+                'variants': {},
+                'vendor': 'intel'},
+    'nereid': {   'default_clk_name': 'clk100',
+                  'default_clk_period': 10.0,
+                  'devices': ['xc7k160t-fbg676-1'],
+                  'toolchain': 'vivado',
+                  'variants': {},
+                  'vendor': 'xilinx'},
+    'netv2': {   'default_clk_name': 'clk50',
+                 'default_clk_period': 20.0,
+                 'devices': ['xc7a100t-fgg484-2', 'xc7a35t-fgg484-2'],
+                 'variants': {'variant': ['a7-35', 'a7-100']},
+                 'vendor': 'xilinx'},
+    'nexys4ddr': {   'default_clk_name': 'clk100',
+                     'default_clk_period': 10.0,
+                     'devices': ['xc7a100t-CSG324-1'],
+                     'variants': {},
+                     'vendor': 'xilinx'},
+    'nexys_video': {   'default_clk_name': 'clk100',
+                       'default_clk_period': 10.0,
+                       'devices': ['xc7a200t-sbg484-1'],
+                       'toolchain': 'vivado',
+                       'variants': {},
+                       'vendor': 'xilinx'},
+    'orangecrab': {   'default_clk_name': 'clk48',
+                      'default_clk_period': 20.833333333333332,
+                      'devices': ['LFE5U-25F-8MG285C'],
+                      'toolchain': 'trellis',
+                      'variants': {'device': ['25F'], 'revision': ['0.1', '0.2']},
+                      'vendor': 'lattice'},
+    'pano_logic_g2': {   'default_clk_name': 'clk125',
+                         'default_clk_period': 8.0,
+                         'devices': ['xc6slx100-2-fgg484', 'xc6slx150-2-fgg484'],
+                         'variants': {'revision': ['b', 'c']},
+                         'vendor': 'xilinx'},
+    'pipistrello': {   'default_clk_name': 'clk50',
+                       'default_clk_period': 20.0,
+                       'devices': ['xc6slx45-csg324-3'],
+                       'variants': {},
+                       'vendor': 'xilinx'},
+    'qmtech_ep4ce15': {   'default_clk_name': 'clk50',
+                          'default_clk_period': 20.0,
+                          'devices': ['EP4CE15F23C8'],
+                          'variants': {},
+                          'vendor': 'intel'},
+    'qmtech_wukong': {   'default_clk_name': 'clk50',
+                         'default_clk_period': 20.0,
+                         'devices': ['xc7a100t-2fgg676'],
+                         'variants': {},
+                         'vendor': 'xilinx'},
+    'redpitaya': {   'devices': ['xc7z010clg400-1', 'xc7z020clg400-1'],
+                     'variants': {'board': ['redpitaya14']},
+                     'vendor': 'xilinx'},
+    'sds1104xe': {'devices': ['xc7z020-clg484-1'], 'variants': {}, 'vendor': 'xilinx'},
+    'sp605': {   'default_clk_name': 'clk200',
+                 'default_clk_period': 5.0,
+                 'devices': ['xc6slx45t-fgg484-3'],
+                 'variants': {},
+                 'vendor': 'xilinx'},
+    'tagus': {   'default_clk_name': 'clk100',
+                 'default_clk_period': 10.0,
+                 'devices': ['xc7a200t-fbg484-2'],
+                 'variants': {},
+                 'vendor': 'xilinx'},
+    'tec0117': {   'default_clk_name': 'clk12',
+                   'default_clk_period': 83.33333333333333,
+                   'devices': ['GW1NR-LV9QN88C6/I5'],
+                   'variants': {},
+                   'vendor': 'gowin'},
+    'tinyfpga_bx': {   'default_clk_name': 'clk16',
+                       'default_clk_period': 62.5,
+                       'devices': ['ice40-lp8k-cm81'],
+                       'toolchain': 'icestorm',
+                       'variants': {},
+                       'vendor': 'lattice'},
+    'trellisboard': {   'default_clk_name': 'clk12',
+                        'default_clk_period': 83.33333333333333,
+                        'devices': ['LFE5UM5G-85F-8BG756C'],
+                        'toolchain': 'trellis',
+                        'variants': {},
+                        'vendor': 'lattice'},
+    'ulx3s': {   'default_clk_name': 'clk25',
+                 'default_clk_period': 40.0,
+                 'devices': ['LFE5U-45F-6BG381C'],
+                 'toolchain': 'trellis',
+                 'variants': {'device': ['LFE5U-45F'], 'revision': ['2.0']},
+                 'vendor': 'lattice'},
+    'vc707': {   'default_clk_name': 'clk156',
+                 'default_clk_period': 6.389776357827476,
+                 'devices': ['xc7vx485tffg1761-2'],
+                 'variants': {},
+                 'vendor': 'xilinx'},
+    'vcu118': {   'default_clk_name': 'clk125',
+                  'default_clk_period': 8.0,
+                  'devices': ['xcvu9p-flga2104-2-e'],
+                  'variants': {},
+                  'vendor': 'xilinx'},
+    'versa_ecp5': {   'default_clk_name': 'clk100',
+                      'default_clk_period': 10.0,
+                      'devices': ['LFE5UM5G-45F-8BG381C'],
+                      'toolchain': 'trellis',
+                      'variants': {'device': ['LFE5UM5G']},
+                      'vendor': 'lattice'},
+    'xcu1525': {   'default_clk_name': 'clk300',
+                   'default_clk_period': 3.3333333333333335,
+                   'devices': ['xcvu9p-fsgd2104-2l-e'],
+                   'variants': {},
+                   'vendor': 'xilinx'},
+    'zcu104': {   'default_clk_name': 'clk125',
+                  'default_clk_period': 8.0,
+                  'devices': ['xczu7ev-ffvc1156-2-i'],
+                  'variants': {},
+                  'vendor': 'xilinx'},
+    'zedboard': {   'default_clk_name': 'clk100',
+                    'default_clk_period': 10.0,
+                    'devices': ['xc7z020clg484-1'],
+                    'variants': {},
+                    'vendor': 'xilinx'},
+    'ztex213': {   'default_clk_name': 'clk48',
+                   'default_clk_period': 20.833333333333332,
+                   'devices': ['xc7a35tcsg324-1'],
+                   'variants': {'expansion': ['debug'], 'variant': ['ztex2.13a']},
+                   'vendor': 'xilinx'},
+    'zybo_z7': {   'default_clk_name': 'clk125',
+                   'default_clk_period': 8.0,
+                   'devices': ['xc7z010-clg400-1'],
+                   'variants': {},
+                   'vendor': 'xilinx'}}
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -230,7 +232,7 @@ _connectors = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(IndexedPlatform, XilinxPlatform):
     default_clk_name   = "clk156"
     default_clk_period = 1e9/156.5e6
 
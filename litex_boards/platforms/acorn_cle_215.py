@@ -11,6 +11,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -101,7 +103,7 @@ _sdcard_io = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(IndexedPlatform, XilinxPlatform):
     default_clk_name   = "clk200"
     default_clk_period = 1e9/200e6
 
@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -104,7 +106,7 @@ _io = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(IndexedPlatform, XilinxPlatform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
 
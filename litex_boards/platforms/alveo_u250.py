@@ -11,6 +11,8 @@
 from litex.build.generic_platform import Pins, Subsignal, IOStandard, Misc
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs (initially auto-generated by extract_xdc_pins.py) ---------------------------------------------
 
 _io = [
@@ -192,7 +194,7 @@ _io = [
         Subsignal("we_n", Pins("A35"), IOStandard("SSTL12_DCI")),
         Misc("SLEW=FAST")
     ),
-    ("ddram", 4,
+    ("ddram", 3,
         Subsignal("a", Pins(
             "K15 B15 F14 A15 C14 A14 B14 E13",
             "F13 A13 D14 C13 B13 K16"),
@@ -328,7 +330,7 @@ _connectors = []
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(IndexedPlatform, XilinxPlatform):
     default_clk_name   = "clk300"
     default_clk_period = 1e9/300e6
 
@@ -9,6 +9,8 @@ from litex.build.altera            import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 from litex.build.generic_platform  import Pins, IOStandard, Subsignal, Misc
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -177,7 +179,7 @@ _device_map = {
     "revd" : "5CSXFC6D6F31C8",
 }
 
-class Platform(AlteraPlatform):
+class Platform(IndexedPlatform, AlteraPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
 
@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.microsemi import MicrosemiPlatform
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -95,7 +97,7 @@ _io = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(MicrosemiPlatform):
+class Platform(IndexedPlatform, MicrosemiPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
 
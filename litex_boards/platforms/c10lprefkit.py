@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -122,7 +124,7 @@ _io = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(AlteraPlatform):
+class Platform(IndexedPlatform, AlteraPlatform):
     default_clk_name   = "clk12"
     default_clk_period = 1e9/12e6
 
@@ -13,6 +13,8 @@
 from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -61,7 +63,7 @@ _io = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name   = "clk27"
     default_clk_period = 1e9/27e6
 
@@ -11,6 +11,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io_v6_1 = [ # Documented by @smunaut
@@ -307,7 +309,7 @@ _connectors_v8_0 = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name   = "clk25"
     default_clk_period = 1e9/25e6
 
@@ -12,6 +12,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 # Documented by @derekmulcahy
@@ -218,7 +220,7 @@ _connectors_v6_0 = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name = "clk25"
     default_clk_period = 1e9/25e6
 
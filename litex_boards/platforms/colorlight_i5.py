@@ -11,6 +11,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import EcpDapProgrammer
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io_v7_0 = [ # Documented by @smunaut
@@ -131,7 +133,7 @@ _sdcard_pmod_io = sdcard_pmod_io("pmode") # SDCARD PMOD on P3.
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name   = "clk25"
     default_clk_period = 1e9/25e6
 
@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import LatticeProgrammer
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -245,7 +247,7 @@ serial_pmods = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name   = "clk12"
     default_clk_period = 1e9/12e6
 
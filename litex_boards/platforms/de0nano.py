@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -128,7 +130,7 @@ _connectors = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(AlteraPlatform):
+class Platform(IndexedPlatform, AlteraPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
 
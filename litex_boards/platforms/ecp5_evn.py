@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 import os
 
 # IOs ----------------------------------------------------------------------------------------------
@@ -132,7 +134,7 @@ _connectors = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name   = "clk12"
     default_clk_period = 1e9/12e6
 
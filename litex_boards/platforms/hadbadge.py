@@ -10,6 +10,8 @@
 from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -221,7 +223,7 @@ _genio_gpio = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(LatticePlatform):
+class Platform(IndexedPlatform, LatticePlatform):
     default_clk_name   = "clk8"
     default_clk_period = 1e9/8e6
 
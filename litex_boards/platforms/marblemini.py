@@ -12,6 +12,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 from litex.build.openocd import OpenOCD
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # TODO:
 # - Add the TMDS lanes for the HDMI connector.
 # - Populate the SFPs.
@@ -246,7 +248,7 @@ break_off_pmod = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(IndexedPlatform, XilinxPlatform):
     default_clk_name   = "clk20_vcxo"
     default_clk_period = 1e9/20e6
 
@@ -11,6 +11,8 @@ from litex.build.generic_platform import *
 from litex.build.gowin.platform import GowinPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.build.generic_platform import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -80,7 +82,7 @@ _connectors = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(GowinPlatform):
+class Platform(IndexedPlatform, GowinPlatform):
     default_clk_name   = "clk12"
     default_clk_period = 1e9/12e6
 
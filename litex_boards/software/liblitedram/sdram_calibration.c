@@ -0,0 +1,232 @@
+// This file is part of LiteX-Boards.
+//
+// Copyright (c) 2021 LiteX-Hub community
+// SPDX-License-Identifier: BSD-2-Clause
+
+// SDRAM calibration stored in SPI Flash (see litex_boards/integration/sdram_calibration.py).
+//
+// Wraps sdram_init() of LiteX's liblitedram (compiled as sdram_init_sweep()) in
+// sdram_init_calibration(), called by sdram_init() (sdram_channels.c): the calibration stored in the
+// SPI Flash sector at SDRAM_CALIBRATION_FLASH_OFFSET is replayed when valid and passing the memtest,
+// otherwise the full calibration is run and its result stored.
+
+#include <generated/csr.h>
+#include <generated/mem.h>
+#include <generated/soc.h>
+
+#include <stdio.h>
+#include <stddef.h>
+#include <string.h>
+
+#include <libbase/crc.h>
+#include <libbase/memtest.h>
+#include <libbase/spiflash.h>
+#include <system.h>
+
+#if defined(CSR_SDRAM_BASE) && defined(CSR_SDRAM_CALIBRATION_BASE) && defined(SDRAM_CALIBRATION_FLASH_OFFSET)
+
+#include <generated/sdram_phy.h>
+#include <liblitedram/sdram.h>
+
+#define SDRAM_CALIBRATION_MAGIC 0x4c414344 /* "DCAL" */
+
+int sdram_init_sweep(void);
+int sdram_init_calibration(void);
+
+/*-----------------------------------------------------------------------*/
+/* Delays                                                                */
+/*-----------------------------------------------------------------------*/
+
+struct sdram_calibration_delay {
+	unsigned long count;
+	unsigned long rst;
+	unsigned long inc;
+	int per_module;
+};
+
+static const struct sdram_calibration_delay delays[] = {
+#ifdef CSR_SDRAM_CALIBRATION_RDLY_DQ_ADDR
+	{CSR_SDRAM_CALIBRATION_RDLY_DQ_ADDR,         CSR_DDRPHY_RDLY_DQ_RST_ADDR,         CSR_DDRPHY_RDLY_DQ_INC_ADDR,     1},
+#endif
+#ifdef CSR_SDRAM_CALIBRATION_RDLY_DQ_BITSLIP_ADDR
+	{CSR_SDRAM_CALIBRATION_RDLY_DQ_BITSLIP_ADDR, CSR_DDRPHY_RDLY_DQ_BITSLIP_RST_ADDR, CSR_DDRPHY_RDLY_DQ_BITSLIP_ADDR, 1},
+#endif
+#ifdef CSR_SDRAM_CALIBRATION_WDLY_DQ_ADDR
+	{CSR_SDRAM_CALIBRATION_WDLY_DQ_ADDR,         CSR_DDRPHY_WDLY_DQ_RST_ADDR,         CSR_DDRPHY_WDLY_DQ_INC_ADDR,     1},
+#endif
+#ifdef CSR_SDRAM_CALIBRATION_WDLY_DQS_ADDR
+	{CSR_SDRAM_CALIBRATION_WDLY_DQS_ADDR,        CSR_DDRPHY_WDLY_DQS_RST_ADDR,        CSR_DDRPHY_WDLY_DQS_INC_ADDR,    1},
+#endif
+#ifdef CSR_SDRAM_CALIBRATION_WDLY_DQ_BITSLIP_ADDR
+	{CSR_SDRAM_CALIBRATION_WDLY_DQ_BITSLIP_ADDR, CSR_DDRPHY_WDLY_DQ_BITSLIP_RST_ADDR, CSR_DDRPHY_WDLY_DQ_BITSLIP_ADDR, 1},
+#endif
+#ifdef CSR_SDRAM_CALIBRATION_CDLY_ADDR
+	{CSR_SDRAM_CALIBRATION_CDLY_ADDR,            CSR_DDRPHY_CDLY_RST_ADDR,            CSR_DDRPHY_CDLY_INC_ADDR,        0},
+#endif
+};
+
+#define SDRAM_CALIBRATION_DELAYS (sizeof(delays)/sizeof(delays[0]))
+
+struct sdram_calibration {
+	unsigned int magic;
+	unsigned int id;
+	unsigned short counts[SDRAM_CALIBRATION_DELAYS][SDRAM_PHY_MODULES];
+	unsigned int crc;
+};
+
+/*-----------------------------------------------------------------------*/
+/* Capture/Replay                                                        */
+/*-----------------------------------------------------------------------*/
+
+static void sdram_calibration_capture(struct sdram_calibration *cal)
+{
+	unsigned int i;
+	int module;
+
+	memset(cal, 0, sizeof(*cal));
+	cal->magic = SDRAM_CALIBRATION_MAGIC;
+	cal->id    = SDRAM_CALIBRATION_ID;
+	for (i=0; i<SDRAM_CALIBRATION_DELAYS; i++) {
+		for (module=0; module<(delays[i].per_module ? SDRAM_PHY_MODULES : 1); module++) {
+			sdram_calibration_sel_write(module);
+			cal->counts[i][module] = csr_read_simple(delays[i].count);
+		}
+	}
+	cal->crc = crc32((unsigned char *) cal, offsetof(struct sdram_calibration, crc));
+}
+
+static void sdram_calibration_replay(const struct sdram_calibration *cal)
+{
+	unsigned int i, n;
+	int module;
+
+#ifdef CSR_DDRPHY_EN_VTC_ADDR
+	/* Disable Voltage/Temperature compensation */
+	ddrphy_en_vtc_write(0);
+#endif
+	for (i=0; i<SDRAM_CALIBRATION_DELAYS; i++) {
+		for (module=0; module<(delays[i].per_module ? SDRAM_PHY_MODULES : 1); module++) {
+			/* Select module */
+			if (delays[i].per_module)
+				ddrphy_dly_sel_write(1 << module);
+
+			/* Reset delay, then increment it as the calibration did */
+			csr_write_simple(1, delays[i].rst);
+			for (n=0; n<cal->counts[i][module]; n++)
+				csr_write_simple(1, delays[i].inc);
+
+			/* Un-select module */
+			ddrphy_dly_sel_write(0);
+		}
+	}
+#ifdef CSR_DDRPHY_EN_VTC_ADDR
+	/* Enable Voltage/Temperature compensation */
+	ddrphy_en_vtc_write(1);
+#endif
+#if defined(SDRAM_PHY_ECP5DDRPHY) || defined(SDRAM_PHY_GW2DDRPHY)
+	/* Sync all DQSBUFM's, By toggling all dly_sel (DQSBUFM.PAUSE) lines. */
+	ddrphy_dly_sel_write(0xff);
+	ddrphy_dly_sel_write(0);
+#endif
+}
+
+/*-----------------------------------------------------------------------*/
+/* SPI Flash                                                             */
+/*-----------------------------------------------------------------------*/
+
+static int sdram_calibration_load(struct sdram_calibration *cal)
+{
+	memcpy(cal, (void *) (SPIFLASH_BASE + SDRAM_CALIBRATION_FLASH_OFFSET), sizeof(*cal));
+	if (cal->magic != SDRAM_CALIBRATION_MAGIC || cal->id != SDRAM_CALIBRATION_ID)
+		return 0;
+	return cal->crc == crc32((unsigned char *) cal, offsetof(struct sdram_calibration, crc));
+}
+
+static void sdram_calibration_save(const struct sdram_calibration *cal)
+{
+	printf("Storing SDRAM calibration to SPI Flash @0x%08x...\n", SDRAM_CALIBRATION_FLASH_OFFSET);
+	erase_flash_sector(SDRAM_CALIBRATION_FLASH_OFFSET);
+	write_to_flash(SDRAM_CALIBRATION_FLASH_OFFSET, (const unsigned char *) cal, sizeof(*cal));
+	flush_cpu_dcache();
+}
+
+/*-----------------------------------------------------------------------*/
+/* Initialization                                                        */
+/*-----------------------------------------------------------------------*/
+
+static int sdram_init_replay(const struct sdram_calibration *cal)
+{
+	/* Same sequence as sdram_init(), with the leveling replayed */
+
+	/* Reset Read/Write phases */
+#ifdef CSR_DDRPHY_RDPHASE_ADDR
+	ddrphy_rdphase_write(SDRAM_PHY_RDPHASE);
+#endif
+#ifdef CSR_DDRPHY_WRPHASE_ADDR
+	ddrphy_wrphase_write(SDRAM_PHY_WRPHASE);
+#endif
+
+	printf("Initializing SDRAM @0x%08lx (calibration from SPI Flash @0x%08x)...\n",
+		MAIN_RAM_BASE, SDRAM_CALIBRATION_FLASH_OFFSET);
+	sdram_software_control_on();
+
+#if CSR_DDRPHY_RST_ADDR
+	ddrphy_rst_write(1);
+	cdelay(1000);
+	ddrphy_rst_write(0);
+	cdelay(1000);
+#endif
+
+#ifdef CSR_DDRCTRL_BASE
+	ddrctrl_init_done_write(0);
+	ddrctrl_init_error_write(0);
+#endif
+
+	init_sequence();
+	sdram_calibration_replay(cal);
+	sdram_software_control_off();
+
+	if (!memtest((unsigned int *) MAIN_RAM_BASE, MEMTEST_DATA_SIZE))
+		return 0;
+
+#ifdef CSR_DDRCTRL_BASE
+	ddrctrl_init_done_write(1);
+#endif
+
+	return 1;
+}
+
+int sdram_init_calibration(void)
+{
+	struct sdram_calibration cal;
+	struct sdram_calibration stored;
+	int loaded;
+
+	loaded = sdram_calibration_load(&stored);
+	if (loaded) {
+		if (sdram_init_replay(&stored))
+			return 1;
+		printf("Stored SDRAM calibration failed, re-calibrating...\n");
+	}
+
+	if (!sdram_init_sweep())
+		return 0;
+
+	sdram_calibration_capture(&cal);
+	if (!loaded || memcmp(&cal, &stored, sizeof(cal)) != 0)
+		sdram_calibration_save(&cal);
+
+	return 1;
+}
+
+#elif defined(CSR_SDRAM_BASE)
+
+int sdram_init_sweep(void);
+int sdram_init_calibration(void);
+
+int sdram_init_calibration(void)
+{
+	return sdram_init_sweep();
+}
+
+#endif
@@ -0,0 +1,28 @@
+// This file is part of LiteX-Boards.
+//
+// Copyright (c) 2021 LiteX-Hub community
+// SPDX-License-Identifier: BSD-2-Clause
+
+// LiteX's sdram.c for an extra SDRAM channel (see litex_boards/integration/sdram.py).
+//
+// Compiled by the Makefile for each channel SDRAM_CHANNEL (sdram<n> core, with its PHY): the CSRs
+// of the channel being located at the same offset from the ones of sdram/ddrphy, CSR_BASE is moved
+// to SDRAM<n>_CSR_BASE and sdram_init() renamed to sdram<n>_init(), the other symbols being made
+// local by the Makefile. Interleaved channels are not directly accessible: they are tested with
+// main_ram once all the channels are initialized.
+
+#include <generated/soc.h>
+
+#define _SDRAM_CHANNEL_NAME(prefix, n, suffix) prefix ## n ## suffix
+#define SDRAM_CHANNEL_NAME(prefix, n, suffix) _SDRAM_CHANNEL_NAME(prefix, n, suffix)
+
+#define CSR_BASE   SDRAM_CHANNEL_NAME(SDRAM, SDRAM_CHANNEL, _CSR_BASE)
+#define sdram_init SDRAM_CHANNEL_NAME(sdram, SDRAM_CHANNEL, _init)
+
+#ifdef SDRAM_CHANNELS_INTERLEAVED
+#define SDRAM_TEST_DISABLE
+#else
+#define MAIN_RAM_BASE SDRAM_CHANNEL_NAME(MAIN_RAM, SDRAM_CHANNEL, _BASE)
+#endif
+
+#include <sdram.c>
@@ -0,0 +1,90 @@
+// This file is part of LiteX-Boards.
+//
+// Copyright (c) 2021 LiteX-Hub community
+// SPDX-License-Identifier: BSD-2-Clause
+
+// Initialization of the SDRAM channels (see litex_boards/integration/sdram.py).
+//
+// The extra channels (sdram1, sdram2..., sdram_channel.c) are initialized/calibrated first, then
+// the first one (sdram, sdram_calibration.c): with interleaving, main_ram is only tested once all
+// the channels are initialized.
+
+#include <generated/csr.h>
+#include <generated/soc.h>
+
+#include <stdio.h>
+
+#ifdef CSR_SDRAM_BASE
+
+#ifndef SDRAM_CHANNELS
+#define SDRAM_CHANNELS 1
+#endif
+
+int sdram_init_calibration(void);
+int sdram_init(void);
+
+#if SDRAM_CHANNELS > 1
+int sdram1_init(void);
+#endif
+#if SDRAM_CHANNELS > 2
+int sdram2_init(void);
+#endif
+#if SDRAM_CHANNELS > 3
+int sdram3_init(void);
+#endif
+#if SDRAM_CHANNELS > 4
+int sdram4_init(void);
+#endif
+#if SDRAM_CHANNELS > 5
+int sdram5_init(void);
+#endif
+#if SDRAM_CHANNELS > 6
+int sdram6_init(void);
+#endif
+#if SDRAM_CHANNELS > 7
+int sdram7_init(void);
+#endif
+
+static int (* const sdram_channels_init[SDRAM_CHANNELS])(void) = {
+	sdram_init_calibration,
+#if SDRAM_CHANNELS > 1
+	sdram1_init,
+#endif
+#if SDRAM_CHANNELS > 2
+	sdram2_init,
+#endif
+#if SDRAM_CHANNELS > 3
+	sdram3_init,
+#endif
+#if SDRAM_CHANNELS > 4
+	sdram4_init,
+#endif
+#if SDRAM_CHANNELS > 5
+	sdram5_init,
+#endif
+#if SDRAM_CHANNELS > 6
+	sdram6_init,
+#endif
+#if SDRAM_CHANNELS > 7
+	sdram7_init,
+#endif
+};
+
+int sdram_init(void)
+{
+	int n;
+	int ok = 1;
+
+	for (n=1; n<SDRAM_CHANNELS; n++) {
+		printf("SDRAM channel %d:\n", n);
+		if (!sdram_channels_init[n]()) {
+			printf("SDRAM channel %d initialization failed.\n", n);
+			ok = 0;
+		}
+	}
+	if (SDRAM_CHANNELS > 1)
+		printf("SDRAM channel 0:\n");
+	return sdram_channels_init[0]() && ok;
+}
+
+#endif
@@ -0,0 +1,42 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""LiteX-Boards targets.
+
+Targets can be listed and described from a precomputed index (see tools/generate_index.py) without
+importing their modules; a target module is only imported when requested with get():
+
+    >>> from litex_boards import targets
+    >>> targets.boards(platform="colorlight_5a_75b")
+    >>> targets.info("arty")["options"]
+    >>> targets.get("arty").main()
+"""
+
+import importlib
+
+from litex_boards.targets._index import index as _index
+
+def boards(platform=None, option=None):
+    """Return the sorted names of the targets, optionally filtered by platform/command-line option."""
+    r = []
+    for name, info in sorted(_index.items()):
+        if platform is not None and platform not in info["platforms"]:
+            continue
+        if option is not None and option not in info["options"]:
+            continue
+        r.append(name)
+    return r
+
+def info(name):
+    """Return the indexed information of a target (platforms, options, sys_clk_freq...)."""
+    if name not in _index:
+        raise ValueError("Unknown target {}, available: {}.".format(name, ", ".join(boards())))
+    return dict(_index[name])
+
+def get(name):
+    """Import and return the module of a target."""
+    info(name)
+    return importlib.import_module(__name__ + "." + name)
@@ -0,0 +1,728 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Generated by litex_boards/tools/generate_index.py, do not edit.
+
+index = {   'ac701': {   'description': 'LiteX SoC on AC701',
+                 'exclusive': [],
+                 'flags': ['--build', '--load', '--with-ethernet', '--with-pcie', '--driver'],
+                 'options': [   '--build',
+                                '--load',
+                                '--sys-clk-freq',
+                                '--with-ethernet',
+                                '--eth-phy',
+                                '--with-pcie',
+                                '--pcie-dmas',
+                                '--driver'],
+                 'platforms': ['ac701'],
+                 'sys_clk_freq': 100000000.0},
+    'acorn_cle_215': {   'description': 'LiteX SoC on Acorn CLE 215+',
+                         'exclusive': [['--with-pcie', '--with-sata']],
+                         'flags': [   '--build',
+                                      '--load',
+                                      '--flash',
+                                      '--with-pcie',
+                                      '--driver',
+                                      '--with-spi-sdcard',
+                                      '--with-sata'],
+                         'options': [   '--build',
+                                        '--load',
+                                        '--flash',
+                                        '--sys-clk-freq',
+                                        '--with-pcie',
+                                        '--driver',
+                                        '--with-spi-sdcard',
+                                        '--with-sata',
+                                        '--pcie-dmas'],
+                         'platforms': ['acorn_cle_215'],
+                         'sys_clk_freq': 100000000.0},
+    'aller': {   'description': 'LiteX SoC on Aller',
+                 'exclusive': [],
+                 'flags': ['--build', '--load', '--with-pcie', '--driver'],
+                 'options': [   '--build',
+                                '--load',
+                                '--sys-clk-freq',
+                                '--with-pcie',
+                                '--pcie-dmas',
+                                '--driver'],
+                 'platforms': ['aller'],
+                 'sys_clk_freq': 100000000.0},
+    'alveo_u250': {   'description': 'LiteX SoC on Alveo U250',
+                      'exclusive': [],
+                      'flags': [   '--build',
+                                   '--load',
+                                   '--ddram-interleave',
+                                   '--with-pcie',
+                                   '--driver'],
+                      'options': [   '--build',
+                                     '--load',
+                                     '--sys-clk-freq',
+                                     '--ddram-channels',
+                                     '--ddram-interleave',
+                                     '--with-pcie',
+                                     '--pcie-dmas',
+                                     '--driver',
+                                     '--sdram-spd'],
+                      'platforms': ['alveo_u250'],
+                      'sys_clk_freq': 125000000.0},
+    'arrow_sockit': {   'description': 'LiteX SoC on SoCKit',
+                        'exclusive': [],
+                        'flags': [   '--single-rate-sdram',
+                                     '--mister-sdram-xs-v22',
+                                     '--mister-sdram-xs-v24',
+                                     '--build',
+                                     '--load'],
+                        'options': [   '--single-rate-sdram',
+                                       '--mister-sdram-xs-v22',
+                                       '--mister-sdram-xs-v24',
+                                       '--build',
+                                       '--load',
+                                       '--revision',
+                                       '--sys-clk-freq'],
+                        'platforms': ['arrow_sockit'],
+                        'sys_clk_freq': 50000000.0},
+    'arty': {   'description': 'LiteX SoC on Arty A7',
+                'exclusive': [   ['--with-ethernet', '--with-etherbone'],
+                                 ['--with-spi-sdcard', '--with-sdcard']],
+                'flags': [   '--build',
+                             '--load',
+                             '--with-ethernet',
+                             '--with-etherbone',
+                             '--with-spi-sdcard',
+                             '--with-sdcard'],
+                'options': [   '--toolchain',
+                               '--build',
+                               '--load',
+                               '--variant',
+                               '--sys-clk-freq',
+                               '--with-ethernet',
+                               '--with-etherbone',
+                               '--eth-ip',
+                               '--with-spi-sdcard',
+                               '--with-sdcard',
+                               '--no-ident-version'],
+                'platforms': ['arty'],
+                'sys_clk_freq': 100000000.0},
+    'arty_s7': {   'description': 'LiteX SoC on Arty S7',
+                   'exclusive': [],
+                   'flags': ['--build', '--load'],
+                   'options': ['--build', '--load', '--variant', '--sys-clk-freq'],
+                   'platforms': ['arty_s7'],
+                   'sys_clk_freq': 100000000.0},
+    'c10lprefkit': {   'description': 'LiteX SoC on C10 LP RefKit',
+                       'exclusive': [],
+                       'flags': ['--build', '--load', '--with-ethernet'],
+                       'options': [   '--build',
+                                      '--load',
+                                      '--sys-clk-freq',
+                                      '--sdram-rate',
+                                      '--with-ethernet'],
+                       'platforms': ['c10lprefkit'],
+                       'sys_clk_freq': 50000000.0},
+    'camlink_4k': {   'description': 'LiteX SoC on Cam Link 4K',
+                      'exclusive': [],
+                      'flags': ['--build', '--load'],
+                      'options': ['--build', '--load', '--sys-clk-freq', '--toolchain'],
+                      'platforms': ['camlink_4k'],
+                      'sys_clk_freq': 81000000.0},
+    'colorlight_5a_75x': {   'description': 'LiteX SoC on Colorlight 5A-75X',
+                             'exclusive': [['--with-ethernet', '--with-etherbone']],
+                             'flags': [   '--build',
+                                          '--load',
+                                          '--with-ethernet',
+                                          '--with-etherbone',
+                                          '--use-internal-osc'],
+                             'options': [   '--build',
+                                            '--load',
+                                            '--board',
+                                            '--revision',
+                                            '--sys-clk-freq',
+                                            '--with-ethernet',
+                                            '--with-etherbone',
+                                            '--eth-ip',
+                                            '--eth-phy',
+                                            '--use-internal-osc',
+                                            '--sdram-rate'],
+                             'platforms': ['colorlight_5a_75b', 'colorlight_5a_75e'],
+                             'sys_clk_freq': 60000000.0},
+    'colorlight_i5': {   'description': 'LiteX SoC on Colorlight i5',
+                         'exclusive': [   ['--with-ethernet', '--with-etherbone'],
+                                          ['--with-spi-sdcard', '--with-sdcard']],
+                         'flags': [   '--build',
+                                      '--load',
+                                      '--with-ethernet',
+                                      '--with-etherbone',
+                                      '--with-spi-sdcard',
+                                      '--with-sdcard',
+                                      '--use-internal-osc',
+                                      '--with-prbs'],
+                         'options': [   '--build',
+                                        '--load',
+                                        '--board',
+                                        '--revision',
+                                        '--sys-clk-freq',
+                                        '--with-ethernet',
+                                        '--with-etherbone',
+                                        '--remote-ip',
+                                        '--local-ip',
+                                        '--with-spi-sdcard',
+                                        '--with-sdcard',
+                                        '--eth-phy',
+                                        '--use-internal-osc',
+                                        '--sdram-rate',
+                                        '--l2-size',
+                                        '--with-prbs'],
+                         'platforms': ['colorlight_i5'],
+                         'sys_clk_freq': 60000000.0},
+    'crosslink_nx_evn': {   'description': 'LiteX SoC on Crosslink-NX Eval Board',
+                            'exclusive': [],
+                            'flags': ['--build', '--load'],
+                            'options': [   '--build',
+                                           '--load',
+                                           '--toolchain',
+                                           '--sys-clk-freq',
+                                           '--serial',
+                                           '--prog-target'],
+                            'platforms': ['crosslink_nx_evn'],
+                            'sys_clk_freq': 75000000.0},
+    'crosslink_nx_vip': {   'description': 'LiteX SoC on Crosslink-NX VIP Board',
+                            'exclusive': [],
+                            'flags': ['--build', '--load'],
+                            'options': [   '--build',
+                                           '--load',
+                                           '--toolchain',
+                                           '--sys-clk-freq',
+                                           '--with-hyperram',
+                                           '--prog-target'],
+                            'platforms': ['crosslink_nx_vip'],
+                            'sys_clk_freq': 75000000.0},
+    'de0nano': {   'description': 'LiteX SoC on DE0-Nano',
+                   'exclusive': [],
+                   'flags': ['--build', '--load'],
+                   'options': ['--build', '--load', '--sys-clk-freq', '--sdram-rate'],
+                   'platforms': ['de0nano'],
+                   'sys_clk_freq': 50000000.0},
+    'de10lite': {   'description': 'LiteX SoC on DE10-Lite',
+                    'exclusive': [],
+                    'flags': ['--build', '--load', '--with-vga'],
+                    'options': [   '--build',
+                                   '--load',
+                                   '--sys-clk-freq',
+                                   '--sdram-rate',
+                                   '--with-vga'],
+                    'platforms': ['de10lite'],
+                    'sys_clk_freq': 50000000.0},
+    'de10nano': {   'description': 'LiteX SoC on DE10-Nano',
+                    'exclusive': [],
+                    'flags': ['--build', '--load', '--with-mister-sdram', '--with-mister-vga'],
+                    'options': [   '--build',
+                                   '--load',
+                                   '--sys-clk-freq',
+                                   '--with-mister-sdram',
+                                   '--with-mister-vga',
+                                   '--sdram-rate'],
+                    'platforms': ['de10nano'],
+                    'sys_clk_freq': 50000000.0},
+    'de1soc': {   'description': 'LiteX SoC on DE1-SoC',
+                  'exclusive': [],
+                  'flags': ['--build', '--load'],
+                  'options': ['--build', '--load', '--sys-clk-freq', '--sdram-rate'],
+                  'platforms': ['de1soc'],
+                  'sys_clk_freq': 50000000.0},
+    'de2_115': {   'description': 'LiteX SoC on DE2-115',
+                   'exclusive': [],
+                   'flags': ['--build', '--load'],
+                   'options': ['--build', '--load', '--sys-clk-freq', '--sdram-rate'],
+                   'platforms': ['de2_115'],
+                   'sys_clk_freq': 50000000.0},
+    'ecp5_evn': {   'description': 'LiteX SoC on ECP5 Evaluation Board',
+                    'exclusive': [],
+                    'flags': ['--build', '--load'],
+                    'options': [   '--build',
+                                   '--load',
+                                   '--toolchain',
+                                   '--sys-clk-freq',
+                                   '--x5-clk-freq'],
+                    'platforms': ['ecp5_evn'],
+                    'sys_clk_freq': 60000000.0},
+    'ecpix5': {   'description': 'LiteX SoC on ECPIX-5',
+                  'exclusive': [],
+                  'flags': ['--build', '--load', '--flash', '--with-sdcard', '--with-ethernet'],
+                  'options': [   '--build',
+                                 '--load',
+                                 '--flash',
+                                 '--device',
+                                 '--sys-clk-freq',
+                                 '--with-sdcard',
+                                 '--with-ethernet'],
+                  'platforms': ['ecpix5'],
+                  'sys_clk_freq': 75000000.0},
+    'fk33': {   'description': 'LiteX SoC on FK33',
+                'exclusive': [],
+                'flags': ['--build', '--load', '--with-pcie', '--driver'],
+                'options': [   '--build',
+                               '--load',
+                               '--sys-clk-freq',
+                               '--with-pcie',
+                               '--pcie-dmas',
+                               '--driver'],
+                'platforms': ['fk33'],
+                'sys_clk_freq': 125000000.0},
+    'fomu': {   'description': 'LiteX SoC on Fomu',
+                'exclusive': [],
+                'flags': ['--build', '--flash'],
+                'options': ['--build', '--sys-clk-freq', '--bios-flash-offset', '--flash'],
+                'platforms': ['fomu_pvt'],
+                'sys_clk_freq': 12000000.0},
+    'fpc_iii': {   'description': 'LiteX SoC on FPC-III',
+                   'exclusive': [   ['--with-ethernet', '--with-etherbone'],
+                                    ['--with-spi-sdcard', '--with-sdcard']],
+                   'flags': [   '--build',
+                                '--load',
+                                '--with-ethernet',
+                                '--with-etherbone',
+                                '--with-spi-sdcard',
+                                '--with-sdcard'],
+                   'options': [   '--build',
+                                  '--load',
+                                  '--toolchain',
+                                  '--sys-clk-freq',
+                                  '--with-ethernet',
+                                  '--with-etherbone',
+                                  '--with-spi-sdcard',
+                                  '--with-sdcard'],
+                   'platforms': ['fpc_iii'],
+                   'sys_clk_freq': 80000000.0},
+    'genesys2': {   'description': 'LiteX SoC on Genesys2',
+                    'exclusive': [   ['--with-ethernet', '--with-etherbone'],
+                                     ['--with-spi-sdcard', '--with-sdcard']],
+                    'flags': [   '--build',
+                                 '--load',
+                                 '--with-ethernet',
+                                 '--with-etherbone',
+                                 '--with-spi-sdcard',
+                                 '--with-sdcard'],
+                    'options': [   '--build',
+                                   '--load',
+                                   '--sys-clk-freq',
+                                   '--with-ethernet',
+                                   '--with-etherbone',
+                                   '--with-spi-sdcard',
+                                   '--with-sdcard'],
+                    'platforms': ['genesys2'],
+                    'sys_clk_freq': 100000000.0},
+    'hadbadge': {   'description': 'LiteX SoC on Hackaday Badge',
+                    'exclusive': [],
+                    'flags': ['--build'],
+                    'options': ['--build', '--toolchain', '--sys-clk-freq'],
+                    'platforms': ['hadbadge'],
+                    'sys_clk_freq': 48000000.0},
+    'icebreaker': {   'description': 'LiteX SoC on iCEBreaker',
+                      'exclusive': [],
+                      'flags': ['--build', '--load', '--flash'],
+                      'options': [   '--build',
+                                     '--load',
+                                     '--flash',
+                                     '--sys-clk-freq',
+                                     '--bios-flash-offset'],
+                      'platforms': ['icebreaker'],
+                      'sys_clk_freq': 24000000.0},
+    'kc705': {   'description': 'LiteX SoC on KC705',
+                 'exclusive': [],
+                 'flags': [   '--build',
+                              '--load',
+                              '--with-ethernet',
+                              '--with-pcie',
+                              '--driver',
+                              '--with-sata',
+                              '--with-i2c'],
+                 'options': [   '--build',
+                                '--load',
+                                '--sys-clk-freq',
+                                '--with-ethernet',
+                                '--with-pcie',
+                                '--pcie-dmas',
+                                '--driver',
+                                '--with-sata',
+                                '--sdram-spd',
+                                '--with-i2c'],
+                 'platforms': ['kc705'],
+                 'sys_clk_freq': 125000000.0},
+    'kcu105': {   'description': 'LiteX SoC on KCU105',
+                  'exclusive': [['--with-ethernet', '--with-etherbone']],
+                  'flags': [   '--build',
+                               '--load',
+                               '--with-ethernet',
+                               '--with-etherbone',
+                               '--with-pcie',
+                               '--driver',
+                               '--with-sata'],
+                  'options': [   '--build',
+                                 '--load',
+                                 '--sys-clk-freq',
+                                 '--with-ethernet',
+                                 '--with-etherbone',
+                                 '--eth-ip',
+                                 '--with-pcie',
+                                 '--pcie-dmas',
+                                 '--driver',
+                                 '--with-sata'],
+                  'platforms': ['kcu105'],
+                  'sys_clk_freq': 125000000.0},
+    'kx2': {   'description': 'LiteX SoC on KX2',
+               'exclusive': [],
+               'flags': ['--build', '--load'],
+               'options': ['--build', '--load', '--sys-clk-freq'],
+               'platforms': ['kx2'],
+               'sys_clk_freq': 100000000.0},
+    'linsn_rv901t': {   'description': 'LiteX SoC on Linsn RV901T',
+                        'exclusive': [],
+                        'flags': ['--build', '--load', '--with-ethernet'],
+                        'options': [   '--build',
+                                       '--load',
+                                       '--sys-clk-freq',
+                                       '--sdram-rate',
+                                       '--with-ethernet',
+                                       '--eth-phy'],
+                        'platforms': ['linsn_rv901t'],
+                        'sys_clk_freq': 75000000.0},
+    'litefury': {   'description': 'LiteX SoC on Aller',
+                    'exclusive': [],
+                    'flags': ['--build', '--with-pcie', '--driver'],
+                    'options': [   '--build',
+                                   '--sys-clk-freq',
+                                   '--with-pcie',
+                                   '--pcie-dmas',
+                                   '--driver'],
+                    'platforms': ['litefury'],
+                    'sys_clk_freq': 100000000.0},
+    'logicbone': {   'description': 'LiteX SoC on Logicbone',
+                     'exclusive': [],
+                     'flags': ['--build', '--load', '--with-ethernet', '--with-sdcard'],
+                     'options': [   '--build',
+                                    '--load',
+                                    '--toolchain',
+                                    '--sys-clk-freq',
+                                    '--device',
+                                    '--sdram-device',
+                                    '--with-ethernet',
+                                    '--with-sdcard'],
+                     'platforms': ['logicbone'],
+                     'sys_clk_freq': 75000000.0},
+    'mercury_xu5': {   'description': 'LiteX SoC on Mercury XU5',
+                       'exclusive': [],
+                       'flags': ['--build', '--load'],
+                       'options': ['--build', '--load', '--sys-clk-freq'],
+                       'platforms': ['mercury_xu5'],
+                       'sys_clk_freq': 125000000.0},
+    'mimas_a7': {   'description': 'LiteX SoC on Mimas A7',
+                    'exclusive': [],
+                    'flags': ['--build', '--load', '--with-ethernet'],
+                    'options': ['--build', '--load', '--sys-clk-freq', '--with-ethernet'],
+                    'platforms': ['mimas_a7'],
+                    'sys_clk_freq': 100000000.0},
+    'minispartan6': {   'description': 'LiteX SoC on MiniSpartan6',
+                        'exclusive': [],
+                        'flags': ['--build', '--load'],
+                        'options': ['--build', '--load', '--sys-clk-freq', '--sdram-rate'],
+                        'platforms': ['minispartan6'],
+                        'sys_clk_freq': 80000000.0},
+    'mist': {   'description': 'LiteX SoC on MIST',
+                'exclusive': [],
+                'flags': ['--build', '--load', '--with-vga'],
+                'options': ['--build', '--load', '--sys-clk-freq', '--sdram-rate', '--with-vga'],
+                'platforms': ['mist'],
+                'sys_clk_freq': 50000000.0},
+    'nereid': {   'description': 'LiteX SoC on Nereid',
+                  'exclusive': [],
+                  'flags': ['--build', '--load', '--with-pcie', '--driver'],
+                  'options': [   '--build',
+                                 '--load',
+                                 '--sys-clk-freq',
+                                 '--with-pcie',
+                                 '--pcie-dmas',
+                                 '--driver'],
+                  'platforms': ['nereid'],
+                  'sys_clk_freq': 100000000.0},
+    'netv2': {   'description': 'LiteX SoC on NeTV2',
+                 'exclusive': [['--with-spi-sdcard', '--with-sdcard']],
+                 'flags': [   '--build',
+                              '--load',
+                              '--with-ethernet',
+                              '--with-pcie',
+                              '--driver',
+                              '--with-spi-sdcard',
+                              '--with-sdcard'],
+                 'options': [   '--build',
+                                '--load',
+                                '--variant',
+                                '--sys-clk-freq',
+                                '--with-ethernet',
+                                '--with-pcie',
+                                '--pcie-dmas',
+                                '--driver',
+                                '--with-spi-sdcard',
+                                '--with-sdcard'],
+                 'platforms': ['netv2'],
+                 'sys_clk_freq': 100000000.0},
+    'nexys4ddr': {   'description': 'LiteX SoC on Nexys4DDR',
+                     'exclusive': [   ['--with-ethernet', '--with-etherbone'],
+                                      ['--with-spi-sdcard', '--with-sdcard']],
+                     'flags': [   '--build',
+                                  '--load',
+                                  '--with-ethernet',
+                                  '--with-etherbone',
+                                  '--with-spi-sdcard',
+                                  '--with-sdcard',
+                                  '--with-vga'],
+                     'options': [   '--build',
+                                    '--load',
+                                    '--sys-clk-freq',
+                                    '--with-ethernet',
+                                    '--with-etherbone',
+                                    '--with-spi-sdcard',
+                                    '--with-sdcard',
+                                    '--with-vga'],
+                     'platforms': ['nexys4ddr'],
+                     'sys_clk_freq': 75000000.0},
+    'nexys_video': {   'description': 'LiteX SoC on Nexys Video',
+                       'exclusive': [['--with-spi-sdcard', '--with-sdcard']],
+                       'flags': [   '--build',
+                                    '--load',
+                                    '--with-ethernet',
+                                    '--with-spi-sdcard',
+                                    '--with-sdcard',
+                                    '--with-sata'],
+                       'options': [   '--toolchain',
+                                      '--build',
+                                      '--load',
+                                      '--sys-clk-freq',
+                                      '--with-ethernet',
+                                      '--with-spi-sdcard',
+                                      '--with-sdcard',
+                                      '--with-sata'],
+                       'platforms': ['nexys_video'],
+                       'sys_clk_freq': 100000000.0},
+    'orangecrab': {   'description': 'LiteX SoC on OrangeCrab',
+                      'exclusive': [],
+                      'flags': ['--build', '--load', '--with-spi-sdcard'],
+                      'options': [   '--build',
+                                     '--load',
+                                     '--toolchain',
+                                     '--sys-clk-freq',
+                                     '--revision',
+                                     '--device',
+                                     '--sdram-device',
+                                     '--with-spi-sdcard'],
+                      'platforms': ['orangecrab'],
+                      'sys_clk_freq': 48000000.0},
+    'pano_logic_g2': {   'description': 'LiteX SoC on Pano Logic G2',
+                         'exclusive': [['--with-ethernet', '--with-etherbone']],
+                         'flags': ['--build', '--load', '--with-ethernet', '--with-etherbone'],
+                         'options': [   '--build',
+                                        '--load',
+                                        '--revision',
+                                        '--sys-clk-freq',
+                                        '--with-ethernet',
+                                        '--with-etherbone',
+                                        '--eth-ip'],
+                         'platforms': ['pano_logic_g2'],
+                         'sys_clk_freq': 50000000.0},
+    'pipistrello': {   'description': 'LiteX SoC on Pipistrello',
+                       'exclusive': [],
+                       'flags': ['--build', '--load'],
+                       'options': ['--build', '--load'],
+                       'platforms': ['pipistrello'],
+                       'sys_clk_freq': None},
+    'qmtech_ep4ce15': {   'description': 'LiteX SoC on QMTECH EP4CE15',
+                          'exclusive': [],
+                          'flags': ['--build', '--load'],
+                          'options': ['--build', '--load', '--sys-clk-freq', '--sdram-rate'],
+                          'platforms': ['qmtech_ep4ce15'],
+                          'sys_clk_freq': 50000000.0},
+    'qmtech_wukong': {   'description': 'LiteX SoC on QMTECH Wukong Board',
+                         'exclusive': [   ['--with-ethernet', '--with-etherbone'],
+                                          ['--with-spi-sdcard', '--with-sdcard']],
+                         'flags': [   '--build',
+                                      '--load',
+                                      '--with-ethernet',
+                                      '--with-etherbone',
+                                      '--with-spi-sdcard',
+                                      '--with-sdcard'],
+                         'options': [   '--build',
+                                        '--load',
+                                        '--sys-clk-freq',
+                                        '--with-ethernet',
+                                        '--with-etherbone',
+                                        '--eth-ip',
+                                        '--with-spi-sdcard',
+                                        '--with-sdcard'],
+                         'platforms': ['qmtech_wukong'],
+                         'sys_clk_freq': 100000000.0},
+    'redpitaya': {   'description': 'LiteX SoC on Zedboard',
+                     'exclusive': [],
+                     'flags': ['--build', '--load'],
+                     'options': ['--build', '--load', '--sys-clk-freq', '--board'],
+                     'platforms': ['redpitaya'],
+                     'sys_clk_freq': 100000000.0},
+    'sds1104xe': {   'description': 'LiteX SoC on SDS1104X-E',
+                     'exclusive': [],
+                     'flags': ['--build', '--load', '--with-etherbone'],
+                     'options': [   '--build',
+                                    '--load',
+                                    '--sys-clk-freq',
+                                    '--with-etherbone',
+                                    '--eth-ip'],
+                     'platforms': ['sds1104xe'],
+                     'sys_clk_freq': 100000000.0},
+    'simple': {   'description': 'Generic LiteX SoC',
+                  'exclusive': [],
+                  'flags': ['--build', '--load'],
+                  'options': ['--build', '--load', '--toolchain'],
+                  'platforms': [],
+                  'sys_clk_freq': None},
+    'tagus': {   'description': 'LiteX SoC on Tagus',
+                 'exclusive': [],
+                 'flags': ['--build', '--load', '--with-pcie', '--driver'],
+                 'options': [   '--build',
+                                '--load',
+                                '--sys-clk-freq',
+                                '--with-pcie',
+                                '--pcie-dmas',
+                                '--driver'],
+                 'platforms': ['tagus'],
+                 'sys_clk_freq': 100000000.0},
+    'tec0117': {   'description': 'LiteX SoC on TEC0117',
+                   'exclusive': [],
+                   'flags': ['--build', '--load', '--flash'],
+                   'options': [   '--build',
+                                  '--load',
+                                  '--bios-flash-offset',
+                                  '--flash',
+                                  '--sys-clk-freq',
+                                  '--sdram-rate'],
+                   'platforms': ['tec0117'],
+                   'sys_clk_freq': 25000000.0},
+    'tinyfpga_bx': {   'description': 'LiteX SoC on TinyFPGA BX',
+                       'exclusive': [],
+                       'flags': ['--build'],
+                       'options': ['--build', '--bios-flash-offset', '--sys-clk-freq'],
+                       'platforms': ['tinyfpga_bx'],
+                       'sys_clk_freq': 16000000.0},
+    'trellisboard': {   'description': 'LiteX SoC on Trellis Board',
+                        'exclusive': [['--with-spi-sdcard', '--with-sdcard']],
+                        'flags': [   '--build',
+                                     '--load',
+                                     '--with-ethernet',
+                                     '--with-spi-sdcard',
+                                     '--with-sdcard'],
+                        'options': [   '--build',
+                                       '--load',
+                                       '--toolchain',
+                                       '--sys-clk-freq',
+                                       '--with-ethernet',
+                                       '--with-spi-sdcard',
+                                       '--with-sdcard'],
+                        'platforms': ['trellisboard'],
+                        'sys_clk_freq': 75000000.0},
+    'ulx3s': {   'description': 'LiteX SoC on ULX3S',
+                 'exclusive': [['--with-spi-sdcard', '--with-sdcard']],
+                 'flags': [   '--build',
+                              '--load',
+                              '--with-spiflash',
+                              '--with-spi-sdcard',
+                              '--with-sdcard',
+                              '--with-oled'],
+                 'options': [   '--build',
+                                '--load',
+                                '--toolchain',
+                                '--device',
+                                '--revision',
+                                '--sys-clk-freq',
+                                '--sdram-module',
+                                '--with-spiflash',
+                                '--flash-boot-adr',
+                                '--with-spi-sdcard',
+                                '--with-sdcard',
+                                '--with-oled',
+                                '--sdram-rate'],
+                 'platforms': ['ulx3s'],
+                 'sys_clk_freq': 50000000.0},
+    'vc707': {   'description': 'LiteX SoC on VC707',
+                 'exclusive': [],
+                 'flags': ['--build', '--load', '--with-pcie', '--driver', '--with-i2c'],
+                 'options': [   '--build',
+                                '--load',
+                                '--sys-clk-freq',
+                                '--with-pcie',
+                                '--pcie-dmas',
+                                '--driver',
+                                '--sdram-spd',
+                                '--with-i2c'],
+                 'platforms': ['vc707'],
+                 'sys_clk_freq': 125000000.0},
+    'vcu118': {   'description': 'LiteX SoC on VCU118',
+                  'exclusive': [],
+                  'flags': ['--build', '--load'],
+                  'options': ['--build', '--load', '--sys-clk-freq'],
+                  'platforms': ['vcu118'],
+                  'sys_clk_freq': 125000000.0},
+    'versa_ecp5': {   'description': 'LiteX SoC on Versa ECP5',
+                      'exclusive': [['--with-ethernet', '--with-etherbone']],
+                      'flags': ['--build', '--load', '--with-ethernet', '--with-etherbone'],
+                      'options': [   '--build',
+                                     '--load',
+                                     '--toolchain',
+                                     '--sys-clk-freq',
+                                     '--device',
+                                     '--with-ethernet',
+                                     '--with-etherbone',
+                                     '--eth-ip',
+                                     '--eth-phy'],
+                      'platforms': ['versa_ecp5'],
+                      'sys_clk_freq': 75000000.0},
+    'xcu1525': {   'description': 'LiteX SoC on XCU1525',
+                   'exclusive': [],
+                   'flags': [   '--build',
+                                '--load',
+                                '--ddram-interleave',
+                                '--with-pcie',
+                                '--driver',
+                                '--with-sata'],
+                   'options': [   '--build',
+                                  '--load',
+                                  '--sys-clk-freq',
+                                  '--ddram-channel',
+                                  '--ddram-channels',
+                                  '--ddram-interleave',
+                                  '--with-pcie',
+                                  '--pcie-dmas',
+                                  '--driver',
+                                  '--with-sata'],
+                   'platforms': ['xcu1525'],
+                   'sys_clk_freq': 125000000.0},
+    'zcu104': {   'description': 'LiteX SoC on ZCU104',
+                  'exclusive': [],
+                  'flags': ['--build', '--load'],
+                  'options': ['--build', '--load', '--sys-clk-freq'],
+                  'platforms': ['zcu104'],
+                  'sys_clk_freq': 125000000.0},
+    'ztex213': {   'description': 'LiteX SoC on Ztex 2.13',
+                   'exclusive': [],
+                   'flags': ['--build', '--load', '--with-spi-sdcard', '--with-sdcard'],
+                   'options': [   '--build',
+                                  '--load',
+                                  '--expansion',
+                                  '--sys-clk-freq',
+                                  '--with-spi-sdcard',
+                                  '--with-sdcard'],
+                   'platforms': ['ztex213'],
+                   'sys_clk_freq': 100000000.0},
+    'zybo_z7': {   'description': 'LiteX SoC on Zybo Z7',
+                   'exclusive': [],
+                   'flags': ['--build', '--load'],
+                   'options': ['--build', '--load', '--sys-clk-freq'],
+                   'platforms': ['zybo_z7'],
+                   'sys_clk_freq': 100000000.0}}
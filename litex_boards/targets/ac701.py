@@ -17,7 +17,9 @@ from litex_boards.platforms import ac701
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
 from litex.soc.cores.led import LedChaser
 
 from litedram.common import PHYPadsReducer
@@ -57,7 +59,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, eth_phy="rgmii", with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, eth_phy="rgmii", with_pcie=False, pcie_dmas=1, **kwargs):
         platform = ac701.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -127,11 +129,12 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # Leds -------------------------------------------------------------------------------------
         self.submodules.leds = LedChaser(
@@ -143,6 +146,7 @@ class BaseSoC(SoCCore):
 def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on AC701")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     parser.add_argument("--build",         action="store_true", help="Build bitstream")
     parser.add_argument("--load",          action="store_true", help="Load bitstream")
@@ -150,6 +154,7 @@ def main():
     parser.add_argument("--with-ethernet", action="store_true", help="Enable Ethernet support")
     parser.add_argument("--eth-phy",       default="rgmii",     help="Select Ethernet PHY: rgmii (default) or 1000basex")
     parser.add_argument("--with-pcie",     action="store_true", help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",     default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
     parser.add_argument("--driver",        action="store_true", help="Generate PCIe driver")
     args = parser.parse_args()
 
@@ -158,8 +163,10 @@ def main():
         with_ethernet = args.with_ethernet,
         eth_phy       = args.eth_phy,
         with_pcie     = args.with_pcie,
+        pcie_dmas     = args.pcie_dmas,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
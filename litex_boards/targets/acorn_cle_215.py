@@ -34,7 +34,9 @@ from litex_boards.platforms import acorn_cle_215
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
@@ -73,7 +75,7 @@ class CRG(Module):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False, with_sata=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False, pcie_dmas=1, with_sata=False, **kwargs):
         platform = acorn_cle_215.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -105,11 +107,12 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -165,19 +168,23 @@ def main():
     parser.add_argument("--driver",          action="store_true", help="Generate PCIe driver")
     parser.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support (requires SDCard adapter on P2)")
     pcieopts.add_argument("--with-sata",     action="store_true", help="Enable SATA support (over PCIe2SATA)")
+    parser.add_argument("--pcie-dmas",       default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
         with_pcie    = args.with_pcie,
+        pcie_dmas    = args.pcie_dmas,
         with_sata    = args.with_sata,
         **soc_sdram_argdict(args)
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
 
+    add_target_options(soc, **target_argdict(args))
     builder  = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -189,8 +196,9 @@ def main():
         prog.load_bitstream(os.path.join(builder.gateware_dir, soc.build_name + ".bit"))
 
     if args.flash:
+        from litex_boards.build.spiflash import flash_openocd
         prog = soc.platform.create_programmer()
-        prog.load_bitstream(os.path.join(builder.gateware_dir, soc.build_name + ".bin"))
+        flash_openocd(prog, 0, os.path.join(builder.gateware_dir, soc.build_name + ".bin"))
 
 if __name__ == "__main__":
     main()
@@ -18,7 +18,9 @@ from litex_boards.platforms import aller
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
@@ -57,7 +59,7 @@ class CRG(Module):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False, pcie_dmas=1, **kwargs):
         platform = aller.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -89,11 +91,12 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # Leds -------------------------------------------------------------------------------------
         self.submodules.leds = LedChaser(
@@ -109,16 +112,20 @@ def main():
     parser.add_argument("--load",         action="store_true", help="Load bitstream")
     parser.add_argument("--sys-clk-freq", default=100e6,       help="System clock frequency (default: 100MHz)")
     parser.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",    default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
     parser.add_argument("--driver",       action="store_true", help="Generate LitePCIe driver")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
         with_pcie    = args.with_pcie,
+        pcie_dmas    = args.pcie_dmas,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -18,7 +18,11 @@ from litex_boards.platforms import alveo_u250
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
+from litex_boards.integration.spd import sdram_module
+from litex_boards.integration.sdram import add_sdram_channels
 
 from litex.soc.cores.led import LedChaser
 from litedram.modules import MTA18ASF2G72PZ
@@ -60,7 +64,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), ddram_channels=(0,), ddram_interleave=False, with_pcie=False, pcie_dmas=1, sdram_spd=None, **kwargs):
         platform = alveo_u250.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -74,17 +78,23 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.submodules.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
-                memtype          = "DDR4",
-                sys_clk_freq     = sys_clk_freq,
-                iodelay_clk_freq = 500e6,
-                is_rdimm         = True)
-            self.add_csr("ddrphy")
-            self.add_sdram("sdram",
-                phy                     = self.ddrphy,
-                module                  = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
+            ddrphys = []
+            for n, channel in enumerate(ddram_channels):
+                name   = "ddrphy" if n == 0 else "ddrphy{}".format(n)
+                ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", channel),
+                    memtype          = "DDR4",
+                    sys_clk_freq     = sys_clk_freq,
+                    iodelay_clk_freq = 500e6,
+                    is_rdimm         = True)
+                setattr(self.submodules, name, ddrphy)
+                self.add_csr(name)
+                ddrphys.append(ddrphy)
+            add_sdram_channels(self,
+                phys                    = ddrphys,
+                module                  = sdram_module(MTA18ASF2G72PZ, sys_clk_freq, "1:4", sdram_spd),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
+                interleave              = ddram_interleave,
                 l2_cache_size           = kwargs.get("l2_size", 8192),
                 l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
                 l2_cache_reverse        = True
@@ -95,11 +105,12 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # Leds -------------------------------------------------------------------------------------
         self.submodules.leds = LedChaser(
@@ -111,20 +122,30 @@ class BaseSoC(SoCCore):
 
 def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on Alveo U250")
-    parser.add_argument("--build",        action="store_true", help="Build bitstream")
-    parser.add_argument("--load",         action="store_true", help="Load bitstream")
-    parser.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency (default: 125MHz)")
-    parser.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support")
-    parser.add_argument("--driver",       action="store_true", help="Generate PCIe driver")
+    parser.add_argument("--build",            action="store_true", help="Build bitstream")
+    parser.add_argument("--load",             action="store_true", help="Load bitstream")
+    parser.add_argument("--sys-clk-freq",     default=125e6,       help="System clock frequency (default: 125MHz)")
+    parser.add_argument("--ddram-channels",   default="0",         help="DDRAM channels to use, ex: 0,1,2,3 (default: 0)")
+    parser.add_argument("--ddram-interleave", action="store_true", help="Interleave the DDRAM channels (2**n) in main_ram, with --max-sdram-size per channel (default: separate regions)")
+    parser.add_argument("--with-pcie",        action="store_true", help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",        default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
+    parser.add_argument("--driver",           action="store_true", help="Generate PCIe driver")
+    parser.add_argument("--sdram-spd",        default=None,        help="SPD dump (binary or BIOS sdram_spd output) of the DDR4 RDIMMs, all channels (default: MTA18ASF2G72PZ)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie,
+        sys_clk_freq     = int(float(args.sys_clk_freq)),
+        ddram_channels   = [int(c, 0) for c in args.ddram_channels.split(",")],
+        ddram_interleave = args.ddram_interleave,
+        with_pcie        = args.with_pcie,
+        pcie_dmas        = args.pcie_dmas,
+        sdram_spd        = args.sdram_spd,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
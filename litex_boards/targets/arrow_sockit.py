@@ -22,7 +22,8 @@ from migen.fhdl.structure   import Signal, ClockDomain, ClockSignal
 from migen.genlib.resetsync import AsyncResetSynchronizer
 
 from litex.soc.cores.clock           import CycloneVPLL
-from litex.soc.integration.builder   import Builder, builder_args, builder_argdict
+from litex_boards.integration.builder import Builder, builder_args, builder_argdict
+from litex_boards.integration.target import add_target_options, target_args, target_argdict
 from litex.soc.integration.soc_core  import SoCCore
 from litex.soc.integration.soc_sdram import soc_sdram_argdict, soc_sdram_args
 from litex.soc.cores.led             import LedChaser
@@ -169,6 +170,7 @@ def main():
     parser.add_argument("--revision",            default="revd",      help="Board revision: revb (default), revc or revd")
     parser.add_argument("--sys-clk-freq",        default=50e6,       help="System clock frequency (default: 50MHz)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
@@ -179,6 +181,7 @@ def main():
         mister_sdram        = "xs_v22" if args.mister_sdram_xs_v22 else "xs_v24" if args.mister_sdram_xs_v24 else None,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
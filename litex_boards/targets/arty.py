@@ -18,7 +18,8 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K128M16
@@ -120,6 +121,7 @@ def main():
     sdopts.add_argument("--with-sdcard",      action="store_true",              help="Enable SDCard support")
     parser.add_argument("--no-ident-version", action="store_false",             help="Disable build time output")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
@@ -139,6 +141,7 @@ def main():
         soc.add_spi_sdcard()
     if args.with_sdcard:
         soc.add_sdcard()
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args) if args.toolchain == "vivado" else {}
     builder.build(**builder_kwargs, run=args.build)
@@ -18,7 +18,8 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K128M16
@@ -96,6 +97,7 @@ def main():
     parser.add_argument("--variant",      default="s7-50",     help="Board variant: s7-50 (default) or s7-25")
     parser.add_argument("--sys-clk-freq", default=100e6,       help="System clock frequency (default: 100MHz)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
@@ -105,6 +107,7 @@ def main():
         sys_clk_freq = int(float(args.sys_clk_freq)),
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(**vivado_build_argdict(args), run=args.build)
 
@@ -19,7 +19,8 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K64M16
@@ -119,6 +120,7 @@ def main():
     parser.add_argument("--sys-clk-freq", default=81e6,        help="System clock frequency (default: 81MHz)")
     parser.add_argument("--toolchain",    default="trellis",   help="FPGA toolchain: trellis (default) or diamond")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
@@ -128,6 +130,7 @@ def main():
         toolchain    = args.toolchain,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     builder.build(**builder_kargs, run=args.build)
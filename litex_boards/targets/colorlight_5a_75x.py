@@ -55,7 +55,8 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import M12L16161A, M12L64322A
@@ -197,6 +198,7 @@ def main():
     parser.add_argument("--use-internal-osc",  action="store_true",              help="Use internal oscillator")
     parser.add_argument("--sdram-rate",        default="1:1",                    help="SDRAM Rate: 1:1 Full Rate (default), 1:2 Half Rate")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
@@ -211,6 +213,7 @@ def main():
         sdram_rate       = args.sdram_rate,
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(**trellis_argdict(args), run=args.build)
 
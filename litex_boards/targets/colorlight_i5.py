@@ -24,7 +24,8 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.spi_flash import SpiFlash
 from litex.soc.cores.spi import SPIMaster
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 
 from litex.soc.cores.led import LedChaser
 
@@ -199,6 +200,7 @@ def main():
     parser.add_argument("--l2-size",          default=8192, type=int,   help="L2 cache size")
     parser.add_argument("--with-prbs",        action="store_true",      help="Enable PRBS support")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
@@ -222,6 +224,7 @@ def main():
     if args.with_sdcard:
         soc.add_sdcard()
 
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
 
     builder.build(**trellis_argdict(args), run=args.build)
@@ -23,7 +23,8 @@ from litex.build.generic_platform import *
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litex.build.lattice.oxide import oxide_args, oxide_argdict
@@ -110,6 +111,7 @@ def main():
     parser.add_argument("--serial",        default="serial",    help="UART Pins: serial (default, requires R15 and R17 to be soldered) or serial_pmod[0-2]")
     parser.add_argument("--prog-target",   default="direct",    help="Programming Target: direct or flash")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     oxide_args(parser)
     args = parser.parse_args()
@@ -119,6 +121,7 @@ def main():
         toolchain    = args.toolchain,
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = oxide_argdict(args) if args.toolchain == "oxide" else {}
     builder.build(**builder_kargs, run=args.build)
@@ -28,7 +28,8 @@ from litex.build.generic_platform import *
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litex.build.lattice.oxide import oxide_args, oxide_argdict
@@ -115,6 +116,7 @@ def main():
     parser.add_argument("--with-hyperram", default="none",      help="Enable use of HyperRAM chip: none (default), 0 or 1")
     parser.add_argument("--prog-target",   default="direct",    help="Programming Target: direct (default) or flash")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     oxide_args(parser)
     args = parser.parse_args()
@@ -125,6 +127,7 @@ def main():
         toolchain    = args.toolchain,
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = oxide_argdict(args) if args.toolchain == "oxide" else {}
     builder.build(**builder_kargs, run=args.build)
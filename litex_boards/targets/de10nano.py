@@ -20,7 +20,8 @@ from litex.soc.cores.clock import CycloneVPLL
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import AS4C32M16
@@ -122,6 +123,7 @@ def main():
     parser.add_argument("--with-mister-vga",   action="store_true", help="Enable VGA with Mister expansion board")
     parser.add_argument("--sdram-rate",        default="1:1",       help="SDRAM Rate: 1:1 Full Rate (default), 1:2 Half Rate")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
@@ -132,6 +134,7 @@ def main():
         sdram_rate        = args.sdram_rate,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -16,7 +16,8 @@ from litex_boards.platforms import ecp5_evn
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -74,6 +75,7 @@ def main():
     parser.add_argument("--sys-clk-freq", default=60e6,        help="System clock frequency (default: 60MHz)")
     parser.add_argument("--x5-clk-freq",  type=int,            help="Use X5 oscillator as system clock at the specified frequency")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
@@ -81,6 +83,7 @@ def main():
         sys_clk_freq = int(float(args.sys_clk_freq)),
         x5_clk_freq  = args.x5_clk_freq,
         **soc_core_argdict(args))
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
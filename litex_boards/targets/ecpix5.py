@@ -19,7 +19,8 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K256M16
@@ -140,6 +141,7 @@ def main():
     parser.add_argument("--with-sdcard",   action="store_true", help="Enable SDCard support")
     parser.add_argument("--with-ethernet", action="store_true", help="Enable Ethernet support")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
@@ -152,6 +154,7 @@ def main():
     )
     if args.with_sdcard:
         soc.add_sdcard()
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(**trellis_argdict(args), run=args.build)
 
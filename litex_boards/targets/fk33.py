@@ -15,7 +15,9 @@ from litex_boards.platforms import fk33
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
 from litex.soc.cores.led import LedChaser
 
 
@@ -43,7 +45,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, pcie_dmas=1, **kwargs):
         platform = fk33.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -57,6 +59,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             assert self.csr_data_width == 32
             # PHY
             self.submodules.pcie_phy = USPHBMPCIEPHY(platform, platform.request("pcie_x4"),
@@ -73,22 +76,25 @@ class BaseSoC(SoCCore):
                 base_address = self.mem_map["csr"])
             self.add_wb_master(self.pcie_bridge.wishbone)
 
-            # DMA0
-            self.submodules.pcie_dma0 = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
-                with_buffering = True, buffering_depth=1024,
-                with_loopback  = True)
-            self.add_csr("pcie_dma0")
+            # DMAs
+            for i in range(pcie_dmas):
+                pcie_dma = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
+                    with_buffering = True, buffering_depth=1024,
+                    with_loopback  = True)
+                setattr(self.submodules, "pcie_dma" + str(i), pcie_dma)
+                self.add_csr("pcie_dma" + str(i))
 
-            self.add_constant("DMA_CHANNELS", 1)
+            self.add_constant("DMA_CHANNELS", pcie_dmas)
 
             # MSI
             self.submodules.pcie_msi = LitePCIeMSI()
             self.add_csr("pcie_msi")
             self.comb += self.pcie_msi.source.connect(self.pcie_phy.msi)
-            self.interrupts = {
-                "PCIE_DMA0_WRITER":    self.pcie_dma0.writer.irq,
-                "PCIE_DMA0_READER":    self.pcie_dma0.reader.irq,
-            }
+            self.interrupts = {}
+            for i in range(pcie_dmas):
+                pcie_dma = getattr(self, "pcie_dma" + str(i))
+                self.interrupts["PCIE_DMA{}_WRITER".format(i)] = pcie_dma.writer.irq
+                self.interrupts["PCIE_DMA{}_READER".format(i)] = pcie_dma.reader.irq
             for i, (k, v) in enumerate(sorted(self.interrupts.items())):
                 self.comb += self.pcie_msi.irqs[i].eq(v)
                 self.add_constant(k + "_INTERRUPT", i)
@@ -107,16 +113,20 @@ def main():
     parser.add_argument("--load",         action="store_true", help="Load bitstream")
     parser.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency (default: 125MHz)")
     parser.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",    default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
     parser.add_argument("--driver",       action="store_true", help="Generate PCIe driver")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
         with_pcie=args.with_pcie,
+        pcie_dmas=args.pcie_dmas,
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
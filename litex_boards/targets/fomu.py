@@ -22,7 +22,9 @@ from litex.soc.cores.spi_flash import SpiFlash
 from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.image import FlashImage
 from litex.soc.cores.led import LedChaser
 
 kB = 1024
@@ -119,27 +121,11 @@ class BaseSoC(SoCCore):
 
 def flash(bios_flash_offset):
     from litex.build.dfu import DFUProg
-    prog = DFUProg(vid="1209", pid="5bf0")
-    bitstream  = open("build/fomu_pvt/gateware/fomu_pvt.bin",  "rb")
-    bios       = open("build/fomu_pvt/software/bios/bios.bin", "rb")
-    image      = open("build/fomu_pvt/image.bin", "wb")
-    # Copy bitstream at 0x00000000
-    for i in range(0x00000000, 0x0020000):
-        b = bitstream.read(1)
-        if not b:
-            image.write(0xff.to_bytes(1, "big"))
-        else:
-            image.write(b)
-    # Copy bios at 0x00020000
-    for i in range(0x00000000, 0x00010000):
-        b = bios.read(1)
-        if not b:
-            image.write(0xff.to_bytes(1, "big"))
-        else:
-            image.write(b)
-    bitstream.close()
-    bios.close()
-    image.close()
+    prog  = DFUProg(vid="1209", pid="5bf0")
+    image = FlashImage(fill=0xff)
+    image.add("bitstream", "build/fomu_pvt/gateware/fomu_pvt.bin",  0x00000000, size=0x00020000)
+    image.add("bios",      "build/fomu_pvt/software/bios/bios.bin", 0x00020000, size=0x00010000)
+    image.build("build/fomu_pvt/image.bin")
     prog.load_bitstream("build/fomu_pvt/image.bin")
 
 # Build --------------------------------------------------------------------------------------------
@@ -151,6 +137,7 @@ def main():
     parser.add_argument("--bios-flash-offset", default=0x60000,     help="BIOS offset in SPI Flash (default: 0x60000)")
     parser.add_argument("--flash",             action="store_true", help="Flash Bitstream")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
@@ -159,6 +146,7 @@ def main():
         sys_clk_freq      = int(float(args.sys_clk_freq)),
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -25,7 +25,8 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 
 from litedram import modules as litedram_modules
 from litedram.phy import GENSDRPHY
@@ -90,6 +91,7 @@ def main():
     parser.add_argument("--toolchain",    default="trellis",   help="FPGA toolchain: trellis (default) or diamond")
     parser.add_argument("--sys-clk-freq", default=48e6,        help="System clock frequency (default: 48MHz)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
@@ -98,6 +100,7 @@ def main():
         toolchain    = args.toolchain,
         sys_clk_freq = int(float(args.sys_clk_freq)),
         **soc_sdram_argdict(args))
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     builder.build(**builder_kargs, run=args.build)
@@ -18,8 +18,12 @@ from litex_boards.platforms import kc705
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
+from litex_boards.integration.spd import sdram_module
 from litex.soc.cores.led import LedChaser
+from litex.soc.cores.bitbang import I2CMaster
 
 from litedram.modules import MT8JTF12864
 from litedram.phy import s7ddrphy
@@ -53,7 +57,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_pcie=False, with_sata=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_pcie=False, pcie_dmas=1, with_sata=False, sdram_spd=None, with_i2c=False, **kwargs):
         platform = kc705.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -74,7 +78,7 @@ class BaseSoC(SoCCore):
             self.add_csr("ddrphy")
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
-                module                  = MT8JTF12864(sys_clk_freq, "1:4"),
+                module                  = sdram_module(MT8JTF12864, sys_clk_freq, "1:4", sdram_spd),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
                 l2_cache_size           = kwargs.get("l2_size", 8192),
@@ -82,6 +86,11 @@ class BaseSoC(SoCCore):
                 l2_cache_reverse        = True
             )
 
+        # I2C (SPD of the DDR3 SODIMM on channel 6 of the I2C mux) ---------------------------------
+        if with_i2c:
+            self.submodules.i2c = I2CMaster(platform.request("i2c"))
+            self.add_csr("i2c")
+
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             self.submodules.ethphy = LiteEthPHY(
@@ -93,11 +102,12 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -149,9 +159,13 @@ def main():
     parser.add_argument("--sys-clk-freq",  default=125e6,       help="System clock frequency (default: 125MHz)")
     parser.add_argument("--with-ethernet", action="store_true", help="Enable Ethernet support")
     parser.add_argument("--with-pcie",     action="store_true", help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",     default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
     parser.add_argument("--driver",        action="store_true", help="Generate PCIe driver")
     parser.add_argument("--with-sata",     action="store_true", help="Enable SATA support (over SFP2SATA)")
+    parser.add_argument("--sdram-spd",     default=None,        help="SPD dump (binary or BIOS sdram_spd output) of the DDR3 SODIMM (default: MT8JTF12864)")
+    parser.add_argument("--with-i2c",      action="store_true", help="Enable I2C Master (BIOS access to the SPD EEPROM of the DDR3 SODIMM)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
@@ -159,9 +173,13 @@ def main():
         sys_clk_freq  = int(float(args.sys_clk_freq)),
         with_ethernet = args.with_ethernet,
         with_pcie     = args.with_pcie,
+        pcie_dmas     = args.pcie_dmas,
         with_sata     = args.with_sata,
+        sdram_spd     = args.sdram_spd,
+        with_i2c      = args.with_i2c,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -17,7 +17,9 @@ from litex_boards.platforms import kcu105
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import EDY4016A
@@ -63,7 +65,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50", with_pcie=False, with_sata=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50", with_pcie=False, pcie_dmas=1, with_sata=False, **kwargs):
         platform = kcu105.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -107,11 +109,12 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = USPCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -166,9 +169,11 @@ def main():
     ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support")
     parser.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address")
     parser.add_argument("--with-pcie",       action="store_true",              help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",       default=1, type=int,              help="Number of PCIe DMA channels (default: 1)")
     parser.add_argument("--driver",          action="store_true",              help="Generate PCIe driver")
     parser.add_argument("--with-sata",       action="store_true",              help="Enable SATA support (over SFP2SATA)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
@@ -178,9 +183,11 @@ def main():
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
         with_pcie      = args.with_pcie,
+        pcie_dmas      = args.pcie_dmas,
         with_sata      = args.with_sata,
         **soc_sdram_argdict(args)
 	)
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
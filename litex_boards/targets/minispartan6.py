@@ -22,7 +22,8 @@ from litex_boards.platforms import minispartan6
 from litex.soc.cores.clock import S6PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import AS4C16M16
@@ -105,6 +106,7 @@ def main():
     parser.add_argument("--sys-clk-freq", default=80e6,        help="System clock frequency (default: 80MHz)")
     parser.add_argument("--sdram-rate",   default="1:1",       help="SDRAM Rate: 1:1 Full Rate (default) or 1:2 Half Rate")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
@@ -113,6 +115,7 @@ def main():
         sdram_rate   = args.sdram_rate,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -16,7 +16,8 @@ from litex_boards.platforms import pano_logic_g2
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 from litex.soc.cores.led import LedChaser
 
 from liteeth.phy import LiteEthPHY
@@ -90,6 +91,7 @@ def main():
     ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support")
     parser.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
@@ -101,6 +103,7 @@ def main():
         eth_ip         = args.eth_ip,
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -16,7 +16,8 @@ from migen import *
 from litex.build.io import CRG
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
 
 from litex.soc.cores.led import LedChaser
 
@@ -53,6 +54,7 @@ def main():
     parser.add_argument("--load",          action="store_true", help="Load bitstream")
     parser.add_argument("--toolchain",     default=None,        help="FPGA toolchain (None default)")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
@@ -62,6 +64,7 @@ def main():
         platform_kwargs["toolchain"] = args.toolchain
     platform = platform_module.Platform(**platform_kwargs)
     soc = BaseSoC(platform,**soc_core_argdict(args))
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -17,7 +17,9 @@ from litex.build.io import CRG
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.image import FlashImage
 from litex.soc.cores.led import LedChaser
 
 from litex_boards.platforms import tec0117
@@ -31,7 +33,7 @@ mB = 1024*kB
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
         self.rst = Signal()
         self.clock_domains.cd_sys = ClockDomain()
 
@@ -51,6 +53,10 @@ class _CRG(Module):
         clk25 = count[1]
         self.comb += self.cd_sys.clk.eq(clk25)
         self.comb += self.cd_sys.rst.eq(~rst_n | self.rst) # FIXME: use AsyncResetSynchronizer
+        if sdram_rate == "1:2":
+            self.clock_domains.cd_sys2x = ClockDomain()
+            self.comb += self.cd_sys2x.clk.eq(~clk50) # Rising edges aligned with sys_clk.
+            self.comb += self.cd_sys2x.rst.eq(self.cd_sys.rst)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -75,7 +81,7 @@ class BaseSoC(SoCCore):
             **kwargs)
 
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = _CRG(platform, sys_clk_freq)
+        self.submodules.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SPI Flash --------------------------------------------------------------------------------
         self.add_spi_flash(mode="1x", dummy_cycles=8)
@@ -104,7 +110,8 @@ class BaseSoC(SoCCore):
                     self.dq    = platform.request("IO_sdram_dq")
             sdram_pads = SDRAMPads()
 
-            self.comb += sdram_pads.clk.eq(~ClockSignal("sys")) # FIXME: use phase shift from PLL.
+            sdram_clk = ClockSignal("sys2x" if sdram_rate == "1:2" else "sys")
+            self.comb += sdram_pads.clk.eq(~sdram_clk) # FIXME: use phase shift from PLL.
 
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.submodules.sdrphy = sdrphy_cls(sdram_pads, sys_clk_freq)
@@ -127,31 +134,11 @@ class BaseSoC(SoCCore):
 def flash(bios_flash_offset):
     # Prepare Flash image.
     # --------------------
-    bitstream  = open("build/tec0117/gateware/impl/pnr/project.bin",  "rb")
-    bios       = open("build/tec0117/software/bios/bios.bin", "rb")
-    image      = open("build/tec0117/image.bin", "wb")
-    # Copy Bitstream at 0.
-    blength = 0
-    while True:
-        b = bitstream.read(1)
-        if not b:
-            break
-        else:
-           image.write(b)
-           blength += 1
-    # Check Bitstream/BIOS overlap.
-    if blength > bios_flash_offset:
-        raise ValueError(f"Bitstream/BIOS overlap 0x{blength:08x} vs 0x{bios_flash_offset:08x}, increase BIOS Flash offset.")
-    # Fill Gap between Bitstream/BIOS with zeroes.
-    for i in range(bios_flash_offset - blength):
-         image.write(0x00.to_bytes(1, "big"))
-    # Copy BIOS at bios_flash_offset
-    while True:
-        b = bios.read(1)
-        if not b:
-            break
-        else:
-           image.write(b)
+    # Bitstream at 0, BIOS at bios_flash_offset, gap filled with zeroes.
+    image = FlashImage(fill=0x00)
+    image.add("bitstream", "build/tec0117/gateware/impl/pnr/project.bin", 0)
+    image.add("bios",      "build/tec0117/software/bios/bios.bin",        bios_flash_offset)
+    image.build("build/tec0117/image.bin")
 
     # Create FTDI <--> SPI Flash proxy bitstream and load it.
     # -------------------------------------------------------
@@ -171,15 +158,11 @@ def flash(bios_flash_offset):
 
     # Flash Image through proxy Bitstream.
     # ------------------------------------
+    # Only the sectors differing from the current Flash content are erased/programmed.
     from spiflash.serialflash import SerialFlashManager
+    from litex_boards.build.spiflash import PySPIFlash, program_file
     dev = SerialFlashManager.get_flash_device("ftdi://ftdi:2232/2")
-    dev.TIMINGS["chip"] = (4, 60) # Chip is too slow
-    print("Erasing flash...")
-    dev.erase(0, -1)
-    with open("build/tec0117/image.bin", "rb") as f:
-        image = f.read()
-    print("Programming flash...")
-    dev.write(0, image)
+    program_file(PySPIFlash(dev), 0, "build/tec0117/image.bin")
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -190,15 +173,19 @@ def main():
     parser.add_argument("--bios-flash-offset", default=0x80000,     help="BIOS offset in SPI Flash (0x00000 default)")
     parser.add_argument("--flash",             action="store_true", help="Flash Bitstream and BIOS")
     parser.add_argument("--sys-clk-freq",      default=25e6,        help="System clock frequency (default: 12MHz)")
+    parser.add_argument("--sdram-rate",        default="1:1",       help="SDRAM Rate: 1:1 Full Rate (default), 1:2 Half Rate")
     builder_args(parser)
+    target_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset = args.bios_flash_offset,
         sys_clk_freq      = int(float(args.sys_clk_freq)),
+        sdram_rate        = args.sdram_rate,
         **soc_core_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args), bios_options=["TERM_MINI"])
     builder.build(run=args.build)
 
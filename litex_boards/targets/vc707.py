@@ -15,8 +15,12 @@ from litex_boards.platforms import vc707
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.target import *
+from litex_boards.integration.pcie import check_pcie_dmas
+from litex_boards.integration.spd import sdram_module
 from litex.soc.cores.led import LedChaser
+from litex.soc.cores.bitbang import I2CMaster
 
 from litedram.modules import MT8JTF12864
 from litedram.phy import s7ddrphy
@@ -49,7 +53,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, pcie_dmas=1, sdram_spd=None, with_i2c=False, **kwargs):
         platform = vc707.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -70,7 +74,7 @@ class BaseSoC(SoCCore):
             self.add_csr("ddrphy")
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
-                module                  = MT8JTF12864(sys_clk_freq, "1:4"),
+                module                  = sdram_module(MT8JTF12864, sys_clk_freq, "1:4", sdram_spd),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
                 l2_cache_size           = kwargs.get("l2_size", 8192),
@@ -78,13 +82,20 @@ class BaseSoC(SoCCore):
                 l2_cache_reverse        = True
             )
 
+        # I2C (SPD of the DDR3 SODIMM on channel 6 of the I2C mux) ---------------------------------
+        if with_i2c:
+            self.submodules.i2c = I2CMaster(platform.request("i2c"))
+            self.add_csr("i2c")
+            self.comb += platform.request("i2c_mux_reset").eq(1)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            check_pcie_dmas(pcie_dmas)
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
             self.add_csr("pcie_phy")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # Leds -------------------------------------------------------------------------------------
         self.submodules.leds = LedChaser(
@@ -100,16 +111,24 @@ def main():
     parser.add_argument("--load",         action="store_true", help="Load bitstream")
     parser.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency (default: 125MHz)")
     parser.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support")
+    parser.add_argument("--pcie-dmas",    default=1, type=int, help="Number of PCIe DMA channels (default: 1)")
     parser.add_argument("--driver",       action="store_true", help="Generate PCIe driver")
+    parser.add_argument("--sdram-spd",    default=None,        help="SPD dump (binary or BIOS sdram_spd output) of the DDR3 SODIMM (default: MT8JTF12864)")
+    parser.add_argument("--with-i2c",     action="store_true", help="Enable I2C Master (BIOS access to the SPD EEPROM of the DDR3 SODIMM)")
     builder_args(parser)
+    target_args(parser)
     soc_sdram_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie_   = args.with_pcie,
+        with_pcie    = args.with_pcie,
+        pcie_dmas    = args.pcie_dmas,
+        sdram_spd    = args.sdram_spd,
+        with_i2c     = args.with_i2c,
         **soc_sdram_argdict(args)
     )
+    add_target_options(soc, **target_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(run=args.build)
 
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Local build farm for the LiteX-Boards targets.
+
+A daemon accepts build jobs (target + arguments) from clients over a Unix socket and runs them
+(python3 -m litex_boards.targets.<target> --build <arguments>) when enough memory and threads are
+available, from the footprint of the target's toolchain. Identical jobs submitted while queued or
+running are merged: all their clients follow the same build. Builds share a build cache, logs are
+streamed to the clients and the client copies the build directory to its --output-dir.
+
+    $ python3 -m litex_boards.tools.build_farm serve --memory 64e9 --threads 32 &
+    $ python3 -m litex_boards.tools.build_farm submit arty --output-dir build/arty --with-ethernet
+    $ python3 -m litex_boards.tools.build_farm status
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import argparse
+import threading
+import subprocess
+import socketserver
+
+from litex_boards import targets, platforms
+
+farm_dir = os.path.join(os.path.expanduser("~"), ".cache", "litex_boards", "farm")
+
+# Footprints ---------------------------------------------------------------------------------------
+
+# Memory (GB) and threads used by the toolchains on a typical build.
+footprints = {
+    "vivado"        : (8, 4),
+    "ise"           : (2, 1),
+    "symbiflow"     : (4, 1),
+    "yosys+nextpnr" : (4, 1),
+    "quartus"       : (6, 2),
+    "trellis"       : (2, 1),
+    "icestorm"      : (1, 1),
+    "oxide"         : (2, 1),
+    "diamond"       : (2, 1),
+    "radiant"       : (3, 1),
+    "gowin"         : (2, 1),
+    "libero"        : (6, 2),
+}
+
+# Default toolchain of each vendor (when not set by the platform).
+vendor_toolchains = {
+    "xilinx"    : "vivado",
+    "intel"     : "quartus",
+    "lattice"   : "diamond",
+    "gowin"     : "gowin",
+    "microsemi" : "libero",
+}
+
+# Large devices (UltraScale/UltraScale+): memory footprint multiplied by 3.
+large_devices = ["xcku", "xcvu", "xczu", "xcu", "xcau"]
+
+def _option(args, name, default=None):
+    for n, arg in enumerate(args):
+        if arg == name and n + 1 < len(args):
+            return args[n + 1]
+        if arg.startswith(name + "="):
+            return arg[len(name) + 1:]
+    return default
+
+def toolchain(target, args=[]):
+    """Return the toolchain used by a target build (--toolchain or platform/vendor default)."""
+    r = _option(args, "--toolchain")
+    if r is not None:
+        return r
+    for platform in targets.info(target)["platforms"]:
+        info = platforms.info(platform)
+        if info.get("toolchain") is not None:
+            return info["toolchain"]
+        if info["vendor"] == "xilinx" and any(d.startswith(("xc6", "xc3")) for d in info["devices"]):
+            return "ise"
+        if info["vendor"] in vendor_toolchains:
+            return vendor_toolchains[info["vendor"]]
+    return None
+
+def footprint(target, args=[]):
+    """Return the (memory in bytes, threads) footprint of a target build."""
+    memory, threads = footprints.get(toolchain(target, args), (4, 1))
+    for platform in targets.info(target)["platforms"]:
+        if any(d.lower().startswith(tuple(large_devices)) for d in platforms.info(platform)["devices"]):
+            memory *= 3
+            break
+    threads = int(_option(args, "--max-threads", _option(args, "--vivado-max-threads", threads)))
+    # Parallel place-and-route seeds (see integration/seeds.py).
+    seeds   = int(_option(args, "--seeds", 1))
+    jobs    = min(int(_option(args, "--jobs", seeds)), seeds)
+    return int(memory*1e9*jobs), threads*jobs
+
+# Jobs ---------------------------------------------------------------------------------------------
+
+class Job:
+    def __init__(self, id, target, args, directory, footprint):
+        self.id         = id
+        self.target     = target
+        self.args       = args
+        self.directory  = directory
+        self.memory, self.threads = footprint
+        self.state      = "queued"
+        self.returncode = None
+        self.clients    = 1
+        self.skipped    = 0
+        self.submitted  = time.time()
+        self.started    = None
+        self.finished   = None
+        self.lines      = []
+        self.condition  = threading.Condition()
+
+    @property
+    def key(self):
+        return (self.target, tuple(self.args))
+
+    def log(self, line):
+        with self.condition:
+            self.lines.append(line)
+            self.condition.notify_all()
+
+    def finish(self, returncode):
+        with self.condition:
+            self.state      = "done" if returncode == 0 else "failed"
+            self.returncode = returncode
+            self.finished   = time.time()
+            self.condition.notify_all()
+
+    def follow(self):
+        """Yield the log lines of the job (from the start) until it is finished."""
+        n = 0
+        while True:
+            with self.condition:
+                while n >= len(self.lines) and self.state in ["queued", "running"]:
+                    self.condition.wait()
+                lines    = self.lines[n:]
+                finished = self.state not in ["queued", "running"]
+            n += len(lines)
+            yield from lines
+            if finished and n >= len(self.lines):
+                return
+
+    def info(self):
+        return {
+            "id"        : self.id,
+            "target"    : self.target,
+            "args"      : self.args,
+            "state"     : self.state,
+            "clients"   : self.clients,
+            "memory"    : self.memory,
+            "threads"   : self.threads,
+            "submitted" : self.submitted,
+            "started"   : self.started,
+            "finished"  : self.finished,
+            "directory" : self.directory,
+        }
+
+# Build Farm ---------------------------------------------------------------------------------------
+
+class BuildFarm:
+    """Schedules the jobs in submission order on the available memory/threads.
+
+    Smaller jobs can start before a queued job waiting for resources (backfill) but only backfill
+    times, so that large jobs are not starved.
+    """
+    def __init__(self, directory=farm_dir, memory=None, threads=None, backfill=8, keep=100, run=True):
+        self.directory = os.path.abspath(directory)
+        self.memory    = memory  or os.sysconf("SC_PAGE_SIZE")*os.sysconf("SC_PHYS_PAGES")
+        self.threads   = threads or os.cpu_count()
+        self.backfill  = backfill
+        self.keep      = keep
+        self.run       = run
+        self.lock      = threading.Lock()
+        self.queue     = []
+        self.running   = []
+        self.finished  = []
+        self.next_id   = 0
+
+    def submit(self, target, args=[]):
+        """Submit a job, return (job, merged) with merged True when merged with an identical job."""
+        targets.info(target) # Check target.
+        args = list(args)
+        if "--build" not in args:
+            args = ["--build"] + args
+        with self.lock:
+            for job in self.queue + self.running:
+                if job.key == (target, tuple(args)):
+                    job.clients += 1
+                    return job, True
+            memory, threads = footprint(target, args)
+            # A job larger than the farm runs alone.
+            job = Job(self.next_id, target, args,
+                directory = os.path.join(self.directory, "jobs", str(self.next_id)),
+                footprint = (min(memory, self.memory), min(threads, self.threads)))
+            self.next_id += 1
+            self.queue.append(job)
+            self._schedule()
+        return job, False
+
+    def _available(self):
+        return (self.memory  - sum(job.memory  for job in self.running),
+                self.threads - sum(job.threads for job in self.running))
+
+    def _schedule(self):
+        # Called with the lock held.
+        blocked = None # First job waiting for resources.
+        for job in list(self.queue):
+            memory, threads = self._available()
+            if job.memory > memory or job.threads > threads:
+                blocked = blocked or job
+                continue
+            if blocked is not None:
+                if blocked.skipped >= self.backfill:
+                    break
+                blocked.skipped += 1
+            self.queue.remove(job)
+            self.running.append(job)
+            job.state   = "running"
+            job.started = time.time()
+            if self.run:
+                threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def command(self, job):
+        """Return the target command of a job."""
+        command = [sys.executable, "-m", "litex_boards.targets." + job.target,
+            "--output-dir",  job.directory,
+            "--build-cache", os.path.join(self.directory, "cache")] + job.args
+        # Vivado limited to the threads of the job (--max-threads is a builder argument: all targets).
+        limited = any(_option(job.args, name) is not None for name in ["--max-threads", "--vivado-max-threads"])
+        if toolchain(job.target, job.args) == "vivado" and not limited:
+            command += ["--max-threads", str(job.threads)]
+        return command
+
+    def _run(self, job):
+        os.makedirs(job.directory, exist_ok=True)
+        command = self.command(job)
+        try:
+            with open(os.path.join(job.directory, "build.log"), "w") as log:
+                process = subprocess.Popen(command,
+                    cwd                = job.directory,
+                    stdout             = subprocess.PIPE,
+                    stderr             = subprocess.STDOUT,
+                    universal_newlines = True,
+                    errors             = "replace")
+                for line in process.stdout:
+                    log.write(line)
+                    job.log(line)
+                returncode = process.wait()
+        except OSError as e:
+            job.log("{}\n".format(e))
+            returncode = -1
+        self.done(job, returncode)
+
+    def done(self, job, returncode):
+        job.finish(returncode)
+        with self.lock:
+            self.running.remove(job)
+            self.finished.append(job)
+            # Remove the directories of the oldest finished jobs.
+            while len(self.finished) > self.keep:
+                shutil.rmtree(self.finished.pop(0).directory, ignore_errors=True)
+            self._schedule()
+
+    def status(self):
+        with self.lock:
+            memory, threads = self._available()
+            return {
+                "memory"   : {"total": self.memory,  "available": memory},
+                "threads"  : {"total": self.threads, "available": threads},
+                "running"  : [job.info() for job in self.running],
+                "queued"   : [job.info() for job in self.queue],
+                "finished" : [job.info() for job in self.finished[-10:]],
+            }
+
+# Server -------------------------------------------------------------------------------------------
+
+class _Handler(socketserver.StreamRequestHandler):
+    def send(self, message):
+        self.wfile.write((json.dumps(message) + "\n").encode())
+        self.wfile.flush()
+
+    def handle(self):
+        farm = self.server.farm
+        try:
+            request = json.loads(self.rfile.readline().decode())
+            if request["command"] == "status":
+                self.send(farm.status())
+            elif request["command"] == "submit":
+                job, merged = farm.submit(request["target"], request.get("args", []))
+                self.send({"job": job.id, "merged": merged, "memory": job.memory, "threads": job.threads})
+                for line in job.follow():
+                    self.send({"log": line})
+                self.send({"state": job.state, "returncode": job.returncode, "directory": job.directory})
+            else:
+                self.send({"error": "Unknown command {}.".format(request["command"])})
+        except (ValueError, KeyError) as e:
+            self.send({"error": str(e)})
+        except (BrokenPipeError, ConnectionResetError):
+            pass # Client gone, the job continues.
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path, farm):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+    server = _Server(socket_path, _Handler)
+    server.farm = farm
+    print("Build farm listening on {} ({:.1f}GB, {} threads).".format(socket_path, farm.memory/1e9, farm.threads))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.remove(socket_path)
+
+# Client -------------------------------------------------------------------------------------------
+
+def copy_tree(src, dst):
+    """Copy the src directory over dst (shutil.copytree with dirs_exist_ok, Python 3.6)."""
+    for root, dirs, files in os.walk(src):
+        directory = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(directory, exist_ok=True)
+        for name in files:
+            shutil.copy2(os.path.join(root, name), os.path.join(directory, name))
+
+def request(socket_path, message):
+    """Send a request to the daemon, yield its responses."""
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.connect(socket_path)
+    with s, s.makefile("rb") as f:
+        s.sendall((json.dumps(message) + "\n").encode())
+        for line in f:
+            yield json.loads(line.decode())
+
+def submit(socket_path, target, args=[], output_dir=None, quiet=False):
+    """Submit a build and follow its log, copy the build directory to output_dir, return the returncode."""
+    for response in request(socket_path, {"command": "submit", "target": target, "args": args}):
+        if "error" in response:
+            raise ValueError(response["error"])
+        if "job" in response:
+            print("Job {}{} ({:.1f}GB, {} threads).".format(response["job"],
+                " (merged with an identical job)" if response["merged"] else "",
+                response["memory"]/1e9, response["threads"]))
+        elif "log" in response:
+            if not quiet:
+                sys.stdout.write(response["log"])
+                sys.stdout.flush()
+        else:
+            if response["state"] == "done" and output_dir is not None:
+                copy_tree(response["directory"], output_dir)
+                print("Build copied to {}.".format(output_dir))
+            print("Job {}.".format(response["state"]))
+            return response["returncode"]
+    raise OSError("Connection to the build farm lost.")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards local build farm")
+    parser.add_argument("--socket", default=os.path.join(farm_dir, "farm.sock"), help="Unix socket of the daemon")
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve_parser = subparsers.add_parser("serve", help="Run the daemon")
+    serve_parser.add_argument("--dir",      default=farm_dir,         help="Build directory of the jobs (and build cache)")
+    serve_parser.add_argument("--memory",   default=None, type=float, help="Memory available for the builds in bytes (default: all)")
+    serve_parser.add_argument("--threads",  default=None, type=int,   help="Threads available for the builds (default: all)")
+    serve_parser.add_argument("--backfill", default=8,    type=int,   help="Number of times a waiting job can be overtaken by smaller ones")
+    serve_parser.add_argument("--keep",     default=100,  type=int,   help="Number of finished job directories kept")
+
+    submit_parser = subparsers.add_parser("submit", help="Submit a build and follow it (other arguments are passed to the target)")
+    submit_parser.add_argument("target",                            help="Target to build")
+    submit_parser.add_argument("--output-dir", default=None,        help="Copy the build directory to this directory")
+    submit_parser.add_argument("--quiet",      action="store_true", help="Don't display the build log")
+
+    subparsers.add_parser("status", help="Display the jobs of the daemon")
+    args, target_args = parser.parse_known_args()
+    target_args = [a for a in target_args if a != "--"]
+
+    if args.command == "serve":
+        farm = BuildFarm(args.dir,
+            memory   = None if args.memory is None else int(args.memory),
+            threads  = args.threads,
+            backfill = args.backfill,
+            keep     = args.keep)
+        serve(args.socket, farm)
+    elif args.command == "submit":
+        output_dir = None if args.output_dir is None else os.path.abspath(args.output_dir)
+        raise SystemExit(submit(args.socket, args.target, target_args, output_dir, args.quiet))
+    elif args.command == "status":
+        for status in request(args.socket, {"command": "status"}):
+            print(json.dumps(status, indent=4))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+DRAM bandwidth/latency benchmark.
+
+Measures what the DRAM of a board delivers with the LiteDRAM BIST ports added by --with-dram-bench,
+accessed over a host bridge (UARTBone, Etherbone, JTAGBone) through litex_server:
+
+    $ ./digilent_arty.py --uart-name=uartbone --with-dram-bench --build --load
+    $ litex_server --uart --uart-port=/dev/ttyUSB1
+    $ python3 -m litex_boards.tools.dram_bench --csr-csv build/digilent_arty/csr.csv
+
+Sequential and random write (generator) and read (checker) bandwidths are measured over the tested
+region, latencies are the average durations of single-word accesses (the write latency being the
+time to get the write accepted by the controller). Random accesses are bursts of random data at
+random bases chosen by the host, as done by the sdram_bist command of the BIOS (the random
+addresses of the BIST being masked with the byte size of the region on word addresses, they would
+go out of the region). The DRAM content of the tested region is overwritten: by default the upper
+half of the memory is tested to preserve the firmware.
+"""
+
+import json
+import time
+import random
+import argparse
+
+# DRAM Benchmark -----------------------------------------------------------------------------------
+
+class BIST:
+    """LiteDRAM BIST generator/checker (<core>_generator/<core>_checker CSRs)."""
+    def __init__(self, bus, name):
+        self.bus  = bus
+        self.name = name
+
+    def _reg(self, reg):
+        return getattr(self.bus.regs, "{}_{}".format(self.name, reg))
+
+    def run(self, base, length, random_data=False, timeout=60.0):
+        """Run on the length bytes at base, return (ticks, errors)."""
+        self._reg("reset").write(1)
+        self._reg("base").write(base)
+        self._reg("end").write(base + length)
+        self._reg("length").write(length)
+        self._reg("random").write(0b01 if random_data else 0b00) # Random data, sequential addresses.
+        self._reg("start").write(1)
+        start = time.time()
+        while not self._reg("done").read():
+            if time.time() - start > timeout:
+                raise TimeoutError("{} not done after {:.0f}s.".format(self.name, timeout))
+        errors = self._reg("errors").read() if hasattr(self.bus.regs, self.name + "_errors") else 0
+        return self._reg("ticks").read(), errors
+
+
+class DRAMBench:
+    def __init__(self, bus, core="sdram"):
+        constants       = bus.constants.d
+        self.clk_freq   = constants["config_clock_frequency"]
+        self.word       = constants["{}_bench_data_width".format(core)]//8
+        self.size       = constants["{}_bench_size".format(core)]
+        self.generator  = BIST(bus, core + "_generator")
+        self.checker    = BIST(bus, core + "_checker")
+
+    def bandwidth(self, length, ticks):
+        return length*self.clk_freq/max(ticks, 1)
+
+    def bases(self, base, length, burst, n, seed=0):
+        """Return n random bases of bursts of burst bytes in the length bytes at base."""
+        rng = random.Random(seed)
+        return [base + self.word*rng.randrange((length - burst)//self.word + 1) for i in range(n)]
+
+    def latency(self, bist, bases):
+        ticks = [bist.run(base, self.word)[0] for base in bases]
+        return sum(ticks)/len(ticks)/self.clk_freq
+
+    def run(self, base=None, length=None, latency_runs=16, random_runs=64, random_burst=256):
+        """Return the results of the benchmark of length bytes at base (default: upper half).
+
+        The random pattern writes/checks random_runs bursts of random_burst bytes of random data at
+        random bases of the region.
+        """
+        base   = self.size//2 if base is None else base
+        length = self.size - base if length is None else length
+        length = length - length%self.word
+        burst  = min(max(random_burst - random_burst%self.word, self.word), length)
+        r      = {"base": base, "length": length, "word": self.word, "clk_freq": self.clk_freq, "errors": 0}
+        # Sequential.
+        write_ticks, _     = self.generator.run(base, length)
+        read_ticks, errors = self.checker.run(base, length)
+        r["errors"]       += errors
+        bases = [base + (self.word*i)%length for i in range(latency_runs)]
+        r["sequential"] = {
+            "write_bandwidth" : self.bandwidth(length, write_ticks),
+            "read_bandwidth"  : self.bandwidth(length, read_ticks),
+            "write_latency"   : self.latency(self.generator, bases),
+            "read_latency"    : self.latency(self.checker,   bases),
+        }
+        # Random: each burst is checked before the next one overwrites it.
+        write_ticks = read_ticks = 0
+        for burst_base in self.bases(base, length, burst, random_runs, seed=1):
+            ticks, _      = self.generator.run(burst_base, burst, random_data=True)
+            write_ticks  += ticks
+            ticks, errors = self.checker.run(burst_base, burst, random_data=True)
+            read_ticks   += ticks
+            r["errors"]  += errors
+        bases = self.bases(base, length, self.word, latency_runs, seed=2)
+        r["random"] = {
+            "write_bandwidth" : self.bandwidth(random_runs*burst, write_ticks),
+            "read_bandwidth"  : self.bandwidth(random_runs*burst, read_ticks),
+            "write_latency"   : self.latency(self.generator, bases),
+            "read_latency"    : self.latency(self.checker,   bases),
+        }
+        return r
+
+def print_results(name, r):
+    print("{}: {} MiB at 0x{:08x}, {}-bit port, {:.1f}MHz, {} errors.".format(
+        name, r["length"]//2**20, r["base"], 8*r["word"], r["clk_freq"]/1e6, r["errors"]))
+    print("{:<12} {:>12} {:>12} {:>12} {:>12}".format("", "Write MB/s", "Read MB/s", "Write ns", "Read ns"))
+    for pattern in ["sequential", "random"]:
+        p = r[pattern]
+        print("{:<12} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.1f}".format(pattern,
+            p["write_bandwidth"]/1e6, p["read_bandwidth"]/1e6, p["write_latency"]*1e9, p["read_latency"]*1e9))
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="DRAM bandwidth/latency benchmark (--with-dram-bench SoCs)")
+    parser.add_argument("--csr-csv",      default="csr.csv",   help="CSR configuration file of the SoC")
+    parser.add_argument("--host",         default="localhost", help="litex_server host")
+    parser.add_argument("--port",         default=1234,        help="litex_server port")
+    parser.add_argument("--core",         default=None,        help="LiteDRAM core(s) to test (default: all)", nargs="+")
+    parser.add_argument("--base",         default=None,        help="Base address of the tested region (default: half of the memory)")
+    parser.add_argument("--length",       default=None,        help="Length of the tested region (default: up to the end of the memory)")
+    parser.add_argument("--latency-runs", default=16,          help="Number of single-word accesses averaged for the latencies", type=int)
+    parser.add_argument("--random-runs",  default=64,          help="Number of bursts of the random pattern", type=int)
+    parser.add_argument("--random-burst", default=256,         help="Length of the bursts of the random pattern (bytes)", type=int)
+    parser.add_argument("--json",         default=None,        help="Write the results to a JSON file")
+    args = parser.parse_args()
+
+    from litex import RemoteClient
+    bus = RemoteClient(host=args.host, port=int(args.port), csr_csv=args.csr_csv)
+    bus.open()
+    cores = args.core or [k[:-len("_bench_size")] for k in bus.constants.d if k.endswith("_bench_size")]
+    if not cores:
+        parser.error("No BIST ports in {}, build the SoC with --with-dram-bench.".format(args.csr_csv))
+    results = {}
+    try:
+        for core in cores:
+            bench = DRAMBench(bus, core)
+            results[core] = bench.run(
+                base         = None if args.base   is None else int(args.base,   0),
+                length       = None if args.length is None else int(args.length, 0),
+                latency_runs = args.latency_runs,
+                random_runs  = args.random_runs,
+                random_burst = args.random_burst)
+            print_results(core, results[core])
+    finally:
+        bus.close()
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+    if any(r["errors"] for r in results.values()):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,16 @@
 
 import re, sys
 
+from litex_boards.tools.import_constraints import SKIP, NameMapper, import_constraints, write_io
+
 """
 This is a script to parse a Xilinx XDC file and produce a LiteX board Python file.
 
 It has been tested on the Alveo U250 XDC file from
 https://www.xilinx.com/member/forms/download/design-license.html?cid=41a21059-3945-404a-a349-35140c65291a&filename=xtp573-alveo-u250-xdc.zip
 
-The "extras" section and name parsing rules will need modification to support other boards.
+It provides the Alveo U250 name-mapping rules and extras for litex_boards.tools.import_constraints,
+see this tool to import other boards and constraint formats.
 """
 
 extras = {
@@ -61,8 +64,6 @@ extras = {
 	("user_si570_clock", "*"): [("IOStandard", "DIFF_SSTL12")],
 }
 
-groups = {}
-
 
 ddr4_re = re.compile(r'DDR4_C(\d)_(.*)')
 
@@ -204,62 +205,19 @@ def parse_port(port):
 		assert False, port
 	return None
 
-with open(sys.argv[1], "r") as xf:
-	for line in xf:
-		if "PACKAGE_PIN" not in line:
-			continue
-		sl = [x.strip() for x in re.split(r'\s|\[', line.strip(), )]
-		sl = [x for x in sl if x != ""]
-		pin = sl[sl.index("PACKAGE_PIN") + 1]
-		port = sl[sl.index("get_ports") + 1]
-		rs = parse_port(port)
-		if rs is None:
-			continue
-		res, sig = rs
+# U250 rules for the constraints importer: DDR4 channels 1-3 are exported as ddram_ch2-4.
+def u250_rule(port):
+	rs = parse_port(port)
+	if rs is None:
+		return SKIP
+	(name, number), sig = rs
+	if name == "ddram" and number > 0:
+		name, number = "ddram_ch{}".format(number + 1), 0
+	return (name, number, sig[0], sig[1] if len(sig) == 2 else None)
 
-		if sig is None:
-			groups[res] = pin
-		else:
-			if res not in groups:
-				groups[res] = {}
-		if len(sig) == 2:
-			if sig[0] not in groups[res]:
-				groups[res][sig[0]] = {}
-			groups[res][sig[0]][sig[1]] = pin
-		else:
-			groups[res][sig[0]] = {0: pin}
+for ch in range(2, 5):
+	extras.update({("ddram_ch{}".format(ch), ) + k[1:]: v for k, v in list(extras.items()) if k[0] == "ddram"})
 
-def format_extras(items, force_newline = False, indent="            ", lcomma=","):
-	extra = "{} \n{}".format(lcomma, indent) if force_newline else "{} ".format(lcomma)
-	extra += (", \n{}".format(indent)).join(['{}("{}")'.format(i[0], i[1]) for i in items])
-	return extra
-print("_io = [")
-for res, sigs in sorted(groups.items(), key=lambda x: x[0]):
-	res_name = res[0]
-	res_index = res[1]
-	if res_name == "ddram" and res_index > 0:
-		res_name = "ddram_ch{}".format(res_index + 1)
-		res_index = 0
-	print('    ("{}", {}, '.format(res_name, res_index), end='\n' if len(sigs) > 1 else '')
-	for sig, pins in sorted(sigs.items(), key=lambda x: x[0]):
-		max_idx = max(pins.keys())
-		if len(pins) > 8:
-			p = ""
-			for j in range((len(pins) + 7) // 8):
-				p += '\n            "{}"{}'.format(" ".join([pins[i] for i in range(j * 8,
-					min((j + 1) * 8, max_idx+1))]), "," if j < ((len(pins) + 7) // 8 - 1) else "")
-		else:
-			p = '"{}"'.format(" ".join([pins[i] for i in range(max_idx+1)]))
-		extra = ""
-		if (res[0], sig) in extras:
-			extra = format_extras(extras[res[0], sig], len(pins) > 8)
-		elif (res[0], "*") in extras:
-			extra = format_extras(extras[res[0], "*"], len(pins) > 8)
-		if len(sigs) == 1:
-			print('Pins({}){}'.format(p, extra), end='')
-		else:
-			print('        Subsignal("{}", Pins({}){}),'.format(sig, p, extra))
-	if (res[0], ) in extras:
-		print(format_extras(extras[res[0], ], False, "        ", "       "))
-	print('    ),' if len(sigs) > 1 else '),')
-print("]")
+if __name__ == "__main__":
+	resources = import_constraints([sys.argv[1]], "xdc", NameMapper([u250_rule], strict=True))
+	write_io(resources, sys.stdout, extras=extras, attributes=False)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Load a bitstream (or flash an image) on several identical boards in parallel.
+
+The boards are selected by the serial numbers of their JTAG adapters: the OpenOCD configuration of
+the platform's programmer is copied for each board with the adapter serial set, and OpenOCD is run
+for all the boards in parallel. Logs are written to --log-dir/<serial>.log and the result of each
+board reported:
+
+    $ python3 -m litex_boards.tools.fleet_load colorlight_5a_75b colorlight.bit --serials FT1 FT2 FT3
+    $ python3 -m litex_boards.tools.fleet_load arty arty.bit --serials-file rack0.txt
+    $ python3 -m litex_boards.tools.fleet_load arty arty.bin --flash --serials-file rack0.txt
+"""
+
+import argparse
+
+from litex_boards import platforms
+from litex_boards.build.openocd import FleetProgrammer
+
+def read_serials(filename):
+    # One serial per line, # comments.
+    serials = []
+    with open(filename, "r") as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if line:
+                serials.append(line)
+    return serials
+
+def main():
+    parser = argparse.ArgumentParser(description="Load a bitstream on several identical boards in parallel")
+    parser.add_argument("platform",                                   help="Platform of the boards")
+    parser.add_argument("bitstream",                                  help="Bitstream to load (image to flash with --flash)")
+    parser.add_argument("--serials",      nargs="+", default=[],      help="Serial numbers of the JTAG adapters")
+    parser.add_argument("--serials-file", default=None,               help="File with the serial numbers of the JTAG adapters (one per line)")
+    parser.add_argument("--variant",      default=None,               help="Platform variant")
+    parser.add_argument("--flash",        action="store_true",        help="Flash the image instead of loading the bitstream")
+    parser.add_argument("--address",      default="0",                help="Flash address (with --flash)")
+    parser.add_argument("-j", "--jobs",   default=None, type=int,     help="Number of boards programmed in parallel (default: all)")
+    parser.add_argument("--log-dir",      default="build/fleet",      help="Directory of the configurations/logs of the boards")
+    args = parser.parse_args()
+
+    serials = args.serials + (read_serials(args.serials_file) if args.serials_file else [])
+    if not serials:
+        parser.error("No serial numbers, use --serials or --serials-file.")
+    if len(set(serials)) != len(serials):
+        parser.error("Duplicated serial numbers.")
+
+    kwargs   = {} if args.variant is None else {"variant": args.variant}
+    platform = platforms.get(args.platform).Platform(**kwargs)
+    fleet    = FleetProgrammer(platform.create_programmer(), serials, directory=args.log_dir, jobs=args.jobs)
+    if args.flash:
+        results = fleet.flash(int(args.address, 0), args.bitstream)
+    else:
+        results = fleet.load_bitstream(args.bitstream)
+
+    failed = [serial for serial, r in results.items() if not r["ok"]]
+    for serial, r in results.items():
+        print("{:<24} {:<6} {:6.1f}s {}".format(serial, "OK" if r["ok"] else "FAILED", r["time"], r["log"]))
+    print("{}/{} boards programmed.".format(len(results) - len(failed), len(results)))
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Search the highest sys_clk_freq closing timing on a target.
+
+The target is built at several candidate frequencies in parallel and the search interval is
+narrowed around the highest frequency closing timing (WNS >= 0 in the build report written by the
+Builder) until it is smaller than --step. The frequencies derived from sys_clk_freq by the CRG (ex:
+4*sys_clk_freq for the DDR PHYs) are accounted for in two ways: frequencies the CRG can't generate
+fail at elaboration (no PLL/MMCM configuration) and the timing of all the clock domains is checked.
+
+Extra arguments are passed to the target, each set of arguments being a configuration of the
+table of results (build/fmax/fmax.json by default, updated on each run):
+
+    $ python3 -m litex_boards.tools.fmax_search arty -j 4
+    $ python3 -m litex_boards.tools.fmax_search arty --min 100e6 --max 200e6 -j 4 --with-ethernet
+    $ python3 -m litex_boards.tools.fmax_search --table
+"""
+
+import os
+import sys
+import glob
+import json
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from litex_boards import targets
+
+# Build --------------------------------------------------------------------------------------------
+
+def _report(output_dir):
+    reports = glob.glob(os.path.join(output_dir, "gateware", "*_report.json"))
+    if not reports:
+        return None
+    with open(reports[0]) as f:
+        return json.load(f)
+
+def build(name, freq, args=[], output_dir="build"):
+    """Build a target at freq, return {"status": "pass"/"fail"/"crg"/"error", ...}."""
+    command = [sys.executable, "-m", "litex_boards.targets." + name,
+        "--build",
+        "--sys-clk-freq", str(freq),
+        "--output-dir",   output_dir] + args
+    os.makedirs(output_dir, exist_ok=True)
+    # Remove the report of a previous search: the status is only given by this build.
+    for report in glob.glob(os.path.join(output_dir, "gateware", "*_report.json")):
+        os.remove(report)
+    with open(os.path.join(output_dir, "fmax_search.log"), "w") as log:
+        subprocess.run(command, stdout=log, stderr=subprocess.STDOUT)
+    return result(output_dir)
+
+def result(output_dir):
+    """Return the result of the build done in output_dir, from the report written by the Builder."""
+    report = _report(output_dir)
+    if report is None:
+        # No Verilog: elaboration failed, the CRG generally can't generate the clocks at freq.
+        verilog = glob.glob(os.path.join(output_dir, "gateware", "*.v"))
+        return {"status": "error" if verilog else "crg"}
+    sys_fmax = report["domains"].get("sys", {}).get("fmax")
+    return {
+        "status"   : "pass" if report["wns"] is not None and report["wns"] >= 0 else "fail",
+        "wns"      : report["wns"],
+        "sys_fmax" : sys_fmax,
+    }
+
+# Search -------------------------------------------------------------------------------------------
+
+def _candidates(low, high, n, step):
+    # n frequencies evenly spaced over [low, high], rounded to step.
+    r = [round((low + i*(high - low)/(n - 1))/step)*step for i in range(n)]
+    return sorted(set(r))
+
+def search(evaluate, fmin, fmax, step=1e6, jobs=1):
+    """Return (highest frequency passing or None, {freq: result}).
+
+    evaluate is called with a list of frequencies (built in parallel) and returns their results.
+    Builds closing timing are not strictly monotonic with the frequency: the search keeps the
+    highest passing frequency below the lowest failing one.
+    """
+    results = {}
+
+    def bounds():
+        failing = [f for f, r in results.items() if r["status"] != "pass"]
+        hi      = min(failing, default=None)
+        passing = [f for f, r in results.items() if r["status"] == "pass" and (hi is None or f < hi)]
+        return max(passing, default=None), hi
+
+    freqs = _candidates(fmin, fmax, max(jobs, 2), step)
+    while freqs:
+        results.update(zip(freqs, evaluate(freqs)))
+        lo, hi = bounds()
+        if lo is None or hi is None or hi - lo <= step:
+            break
+        # Interior points of the ]lo, hi[ interval not built yet.
+        freqs = [f for f in _candidates(lo, hi, jobs + 2, step)[1:-1] if f not in results and lo < f < hi]
+        if not freqs:
+            break
+    return bounds()[0], results
+
+# Table --------------------------------------------------------------------------------------------
+
+def load(filename):
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        return json.load(f)
+
+def print_table(table):
+    print("{:<24} {:<40} {:>10} {:>10} {:>9}".format("Target", "Configuration", "Default", "Fmax", "Headroom"))
+    for name, configs in sorted(table.items()):
+        for config, r in sorted(configs.items()):
+            default  = "-" if r["default"] is None else "{:.2f}".format(r["default"]/1e6)
+            fmax     = "-" if r["fmax"]    is None else "{:.2f}".format(r["fmax"]/1e6)
+            headroom = "-"
+            if r["default"] and r["fmax"]:
+                headroom = "{:+.1f}%".format(100*(r["fmax"] - r["default"])/r["default"])
+            print("{:<24} {:<40} {:>10} {:>10} {:>9}".format(name, config, default, fmax, headroom))
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Search the highest sys_clk_freq closing timing on a target",
+        epilog="Other arguments are passed to the target.")
+    parser.add_argument("target",       nargs="?",                             help="Target to build")
+    parser.add_argument("--min",        default=None, type=float,              help="Lowest frequency (default: target's default sys_clk_freq)")
+    parser.add_argument("--max",        default=None, type=float,              help="Highest frequency (default: 2 x --min)")
+    parser.add_argument("--step",       default=1e6,  type=float,              help="Search resolution (default: 1MHz)")
+    parser.add_argument("-j", "--jobs", default=1,    type=int,                help="Number of parallel builds")
+    parser.add_argument("--build-dir",  default="build/fmax",                  help="Base directory of the builds")
+    parser.add_argument("--results",    default="build/fmax/fmax.json",        help="Table of results")
+    parser.add_argument("--table",      action="store_true",                   help="Only print the table of results")
+    args, target_args = parser.parse_known_args()
+
+    table = load(args.results)
+    if args.table or args.target is None:
+        print_table(table)
+        return
+
+    default = targets.info(args.target)["sys_clk_freq"]
+    fmin    = args.min or default
+    if fmin is None:
+        parser.error("{} has no default sys_clk_freq, --min is required.".format(args.target))
+    fmax    = args.max or 2*fmin
+    config     = " ".join(target_args) or "default"
+    config_dir = os.path.join(args.build_dir, args.target, "_".join(a.strip("-") for a in target_args) or "default")
+
+    def evaluate(freqs):
+        def run(freq):
+            output_dir = os.path.join(config_dir, "{:.2f}MHz".format(freq/1e6))
+            result     = build(args.target, freq, target_args, output_dir)
+            print("{} ({}) @ {:.2f}MHz: {}".format(args.target, config, freq/1e6, result))
+            return result
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            return list(executor.map(run, freqs))
+
+    best, results = search(evaluate, fmin, fmax, step=args.step, jobs=args.jobs)
+
+    table.setdefault(args.target, {})[config] = {
+        "default" : default,
+        "fmax"    : best,
+        "limit"   : best is not None and best >= fmax, # Search bounded by --max.
+        "builds"  : {"{:.0f}".format(f): r for f, r in sorted(results.items())},
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+    with open(args.results, "w") as f:
+        json.dump(table, f, indent=4, sort_keys=True)
+    print_table({args.target: {config: table[args.target][config]}})
+    if best is None:
+        print("No frequency closing timing in [{:.2f}MHz, {:.2f}MHz].".format(fmin/1e6, fmax/1e6))
+        raise SystemExit(1)
+    if best >= fmax:
+        print("Timing closed at --max, increase it to continue the search.")
+
+if __name__ == "__main__":
+    main()
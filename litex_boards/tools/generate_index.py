@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Generate the board indexes used by litex_boards.platforms and litex_boards.targets.
+
+The platform and target modules are parsed (not imported, so neither Migen nor LiteX are needed)
+to extract the vendor, devices, variants and options of each board. Run this script after adding
+or modifying a platform/target:
+
+    $ python3 -m litex_boards.tools.generate_index
+"""
+
+import os
+import ast
+import pprint
+import argparse
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Vendor of each LiteX base platform.
+vendors = {
+    "XilinxPlatform"    : "xilinx",
+    "AlteraPlatform"    : "intel",
+    "LatticePlatform"   : "lattice",
+    "GowinPlatform"     : "gowin",
+    "MicrosemiPlatform" : "microsemi",
+}
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _modules(directory):
+    for f in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(f)
+        if ext == ".py" and not name.startswith("_"):
+            yield name, os.path.join(directory, f)
+
+def _parse(filename):
+    with open(filename, "r") as f:
+        return ast.parse(f.read(), filename)
+
+def _constant(node):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        # Simple arithmetic on constants (ex: default_clk_period = 1e9/100e6).
+        if isinstance(node, ast.BinOp):
+            l, r = _constant(node.left), _constant(node.right)
+            if isinstance(l, (int, float)) and isinstance(r, (int, float)):
+                op = {ast.Add: l.__add__, ast.Sub: l.__sub__, ast.Mult: l.__mul__, ast.Div: l.__truediv__}
+                if type(node.op) in op:
+                    return op[type(node.op)](r)
+        return None
+
+def _format(node, params):
+    # Evaluate a string expression built from constants and parameters (default values).
+    if isinstance(node, ast.Name):
+        return params.get(node.id)
+    if isinstance(node, ast.JoinedStr):
+        r = ""
+        for value in node.values:
+            v = _format(value.value if isinstance(value, ast.FormattedValue) else value, params)
+            if not isinstance(v, str):
+                return None
+            r += v
+        return r
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        l, r = _format(node.left, params), _format(node.right, params)
+        return l + r if isinstance(l, str) and isinstance(r, str) else None
+    v = _constant(node)
+    return v if isinstance(v, str) else None
+
+# Platforms ----------------------------------------------------------------------------------------
+
+def _platform_info(tree):
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Platform":
+            break
+    else:
+        return None
+    bases = [b.id for b in node.bases if isinstance(b, ast.Name)]
+    info  = {
+        "vendor"   : next((vendors[b] for b in bases if b in vendors), None), # After the mixins.
+        "devices"  : [],
+        "variants" : {},
+    }
+
+    # Class attributes.
+    for item in node.body:
+        if isinstance(item, ast.Assign) and isinstance(item.targets[0], ast.Name):
+            if item.targets[0].id in ["default_clk_name", "default_clk_period"]:
+                info[item.targets[0].id] = _constant(item.value)
+
+    # Constructor: parameters, variants and devices.
+    init = [item for item in node.body if isinstance(item, ast.FunctionDef) and item.name == "__init__"]
+    if not init:
+        return info
+    init     = init[0]
+    args     = init.args.args[1:]
+    defaults = [None]*(len(args) - len(init.args.defaults)) + init.args.defaults
+    params   = {a.arg: _constant(d) for a, d in zip(args, defaults)}
+    if "toolchain" in params:
+        info["toolchain"] = params.pop("toolchain")
+
+    # Module-level dicts (ex: _device_map = {"revd": "5CSXFC6D6F31C6"}).
+    dicts = {}
+    for item in tree.body:
+        if isinstance(item, ast.Assign) and isinstance(item.targets[0], ast.Name):
+            if isinstance(item.value, ast.Dict):
+                dicts[item.targets[0].id] = item.value
+
+    def choices(value):
+        # {"variant": "device", ...}[param] or _map[param] with a module-level dict.
+        if not isinstance(value, ast.Subscript):
+            return None
+        index = getattr(value.slice, "value", value.slice) # Python < 3.9.
+        table = value.value
+        if isinstance(table, ast.Name):
+            table = dicts.get(table.id)
+        if isinstance(table, ast.Dict) and isinstance(index, ast.Name) and index.id in params:
+            info["variants"].setdefault(index.id, [_constant(k) for k in table.keys])
+            return [v for v in map(_constant, table.values) if isinstance(v, str)]
+        return None
+
+    # Local string variables: name = "device" or name = {...}[param].
+    locals_ = {}
+    for n in ast.walk(init):
+        if isinstance(n, ast.Assign) and isinstance(n.targets[0], ast.Name):
+            values = choices(n.value)
+            if values is None and isinstance(_constant(n.value), str):
+                values = [_constant(n.value)]
+            if values is not None:
+                locals_.setdefault(n.targets[0].id, []).extend(values)
+
+    # Vendor constructor call: XilinxPlatform.__init__(self, device, ...).
+    for n in ast.walk(init):
+        if (isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute) and n.func.attr == "__init__" and
+            isinstance(n.func.value, ast.Name) and n.func.value.id in bases and len(n.args) >= 2):
+            device  = n.args[1]
+            devices = choices(device)
+            if devices is None and isinstance(device, ast.Name) and device.id in locals_:
+                devices = locals_[device.id]
+            if devices is None:
+                device  = _format(device, params)
+                devices = [] if device is None else [device]
+            info["devices"] = sorted(set(d.strip() for d in devices))
+
+    # Remaining string parameters are variants with a free value (default only known).
+    for name, default in params.items():
+        if name not in info["variants"] and isinstance(default, str):
+            info["variants"][name] = [default]
+    return info
+
+def platforms_index(directory=os.path.join(root_dir, "platforms")):
+    index = {}
+    for name, filename in _modules(directory):
+        info = _platform_info(_parse(filename))
+        if info is not None:
+            index[name] = info
+    return index
+
+# Targets ------------------------------------------------------------------------------------------
+
+def _target_info(tree):
+    info = {
+        "platforms"    : [],
+        "description"  : None,
+        "options"      : [],
+        "flags"        : [],
+        "exclusive"    : [],
+        "sys_clk_freq" : None,
+    }
+    # Mutually exclusive groups (name = parser.add_mutually_exclusive_group()).
+    groups = {}
+    for n in ast.walk(tree):
+        if (isinstance(n, ast.Assign) and isinstance(n.targets[0], ast.Name) and
+            isinstance(n.value, ast.Call) and isinstance(n.value.func, ast.Attribute) and
+            n.value.func.attr == "add_mutually_exclusive_group"):
+            groups[n.targets[0].id] = []
+    for n in ast.walk(tree):
+        # from litex_boards.platforms import board[, board]
+        if isinstance(n, ast.ImportFrom) and n.module == "litex_boards.platforms":
+            for alias in n.names:
+                if alias.name not in info["platforms"]:
+                    info["platforms"].append(alias.name)
+        if not isinstance(n, ast.Call) or not isinstance(n.func, ast.Attribute):
+            continue
+        # argparse.ArgumentParser(description="...")
+        if n.func.attr == "ArgumentParser":
+            for kw in n.keywords:
+                if kw.arg == "description":
+                    info["description"] = _constant(kw.value)
+        # parser.add_argument("--option", ...) / group.add_argument("--option", ...)
+        if n.func.attr == "add_argument" and n.args:
+            option = _constant(n.args[0])
+            if isinstance(option, str) and option.startswith("--"):
+                info["options"].append(option)
+                for kw in n.keywords:
+                    if kw.arg == "action" and _constant(kw.value) == "store_true":
+                        info["flags"].append(option)
+                    if kw.arg == "default" and option == "--sys-clk-freq":
+                        info["sys_clk_freq"] = _constant(kw.value)
+                owner = n.func.value
+                if isinstance(owner, ast.Name) and owner.id in groups:
+                    groups[owner.id].append(option)
+    info["exclusive"] = [options for name, options in sorted(groups.items()) if options]
+    return info
+
+def targets_index(directory=os.path.join(root_dir, "targets")):
+    return {name: _target_info(_parse(filename)) for name, filename in _modules(directory)}
+
+# Index --------------------------------------------------------------------------------------------
+
+def generate(index):
+    r  = "#\n"
+    r += "# This file is part of LiteX-Boards.\n"
+    r += "#\n"
+    r += "# SPDX-License-Identifier: BSD-2-Clause\n"
+    r += "\n"
+    r += "# Generated by litex_boards/tools/generate_index.py, do not edit.\n"
+    r += "\n"
+    r += "index = " + pprint.pformat(index, indent=4, width=100) + "\n"
+    return r
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate LiteX-Boards platforms/targets indexes")
+    parser.add_argument("--check", action="store_true", help="Only check that the indexes are up to date")
+    args = parser.parse_args()
+
+    outdated = []
+    for package, index in [("platforms", platforms_index()), ("targets", targets_index())]:
+        filename = os.path.join(root_dir, package, "_index.py")
+        content  = generate(index)
+        current  = open(filename).read() if os.path.exists(filename) else None
+        if content != current:
+            outdated.append(filename)
+            if not args.check:
+                with open(filename, "w") as f:
+                    f.write(content)
+    for filename in outdated:
+        print("{} {}".format("Outdated:" if args.check else "Updated:", filename))
+    if args.check and outdated:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
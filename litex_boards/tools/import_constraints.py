@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2020 David Shah <dave@ds0.me>
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Import vendor constraint files into LiteX-Boards IOs.
+
+Supported formats: Xilinx XDC, Intel/Altera QSF, Lattice LPF, iCE40 PCF and Gowin CST. Files are
+streamed line by line, so large vendor files can be imported; ports are then mapped to LiteX
+resources/subsignals by pluggable rules and the result is written as a Python _io list or as JSON.
+
+Rules are provided as a Python file defining a `rules` list (Rule objects or callables taking a
+port name and returning (resource, number, subsignal, index), SKIP or None when not handled) and
+optionally an `extras` dict ((resource, subsignal) / (resource, "*") / (resource,) -> constraints,
+as (name, value) tuples, ex: ("IOStandard", "LVCMOS33")). Ports not handled by any rule are mapped
+to a resource named after the lowercased port, bus ports (ex: LED[3]) giving multi-pins resources.
+
+    $ python3 -m litex_boards.tools.import_constraints board.qsf --rules board_rules.py -o io.py
+"""
+
+import re
+import sys
+import json
+import runpy
+import argparse
+
+# Parsers ------------------------------------------------------------------------------------------
+#
+# Each parser takes an iterable of lines and yields (port, pin, attributes) tuples, pin being None
+# for lines only setting attributes. Attributes are (name, value) tuples in LiteX form, ex:
+# ("IOStandard", "LVCMOS33") or ("Misc", "SLEW=FAST").
+
+def _strip_comment(line, comment):
+    return line.split(comment, 1)[0].strip()
+
+def _logical_lines(lines, comment="#"):
+    # Join lines ending with a backslash continuation, strip comments.
+    current = ""
+    for line in lines:
+        line = _strip_comment(line, comment)
+        if line.endswith("\\"):
+            current += line[:-1] + " "
+            continue
+        line = current + line
+        current = ""
+        if line:
+            yield line
+
+def _attribute(name, value, iostandard_names):
+    value = value.strip("\"{}")
+    if name.upper() in iostandard_names:
+        return ("IOStandard", value)
+    return ("Misc", "{}={}".format(name.upper(), value))
+
+_xdc_ports_re = re.compile(r"\[\s*get_ports\s+(\{[^\}]*\}|\"[^\"]*\"|[^\]]+?)\s*\]")
+
+def parse_xdc(lines):
+    for line in _logical_lines(lines):
+        if not line.startswith("set_property"):
+            continue
+        m = _xdc_ports_re.search(line)
+        if m is None:
+            continue
+        ports  = m.group(1).strip("\"{}").split()
+        props  = line[len("set_property"):m.start()]
+        tokens = props.replace("{", " ").replace("}", " ").split()
+        if tokens[:1] == ["-dict"]:
+            tokens = tokens[1:]
+        pairs = list(zip(tokens[0::2], tokens[1::2]))
+        pin   = None
+        attrs = []
+        for name, value in pairs:
+            if name.upper() == "PACKAGE_PIN":
+                pin = value
+            else:
+                attrs.append(_attribute(name, value, ["IOSTANDARD"]))
+        for port in ports:
+            yield port.strip("\"{}"), pin, attrs
+
+_qsf_location_re = re.compile(r"set_location_assignment\s+(?:PIN_)?(\S+)\s+-to\s+(\S+)")
+_qsf_instance_re = re.compile(r"set_instance_assignment\s+-name\s+(\S+)\s+(\"[^\"]*\"|\S+)\s+-to\s+(\S+)")
+
+def parse_qsf(lines):
+    for line in _logical_lines(lines):
+        m = _qsf_location_re.search(line)
+        if m is not None:
+            yield m.group(2).strip("\"{}"), m.group(1), []
+            continue
+        m = _qsf_instance_re.search(line)
+        if m is not None:
+            yield m.group(3).strip("\"{}"), None, [_attribute(m.group(1), m.group(2), ["IO_STANDARD"])]
+
+_lpf_locate_re = re.compile(r"LOCATE\s+COMP\s+\"([^\"]+)\"\s+SITE\s+\"([^\"]+)\"", re.IGNORECASE)
+_lpf_iobuf_re  = re.compile(r"IOBUF\s+PORT\s+\"([^\"]+)\"\s+(.*)", re.IGNORECASE)
+
+def parse_lpf(lines):
+    for line in _logical_lines(lines):
+        for statement in line.split(";"):
+            m = _lpf_locate_re.search(statement)
+            if m is not None:
+                yield m.group(1), m.group(2), []
+                continue
+            m = _lpf_iobuf_re.search(statement)
+            if m is not None:
+                attrs = [_attribute(*kv.split("=", 1), ["IO_TYPE"]) for kv in m.group(2).split() if "=" in kv]
+                yield m.group(1), None, attrs
+
+def parse_pcf(lines):
+    for line in _logical_lines(lines):
+        tokens = line.split()
+        if tokens[:1] != ["set_io"]:
+            continue
+        tokens = [t for t in tokens[1:] if not t.startswith("-")]
+        if len(tokens) >= 2:
+            yield tokens[0], tokens[1], []
+
+_cst_loc_re  = re.compile(r"IO_LOC\s+\"([^\"]+)\"\s+([^;\s]+)")
+_cst_port_re = re.compile(r"IO_PORT\s+\"([^\"]+)\"\s+([^;]*)")
+
+def parse_cst(lines):
+    for line in _logical_lines(lines, comment="//"):
+        for statement in line.split(";"):
+            m = _cst_loc_re.search(statement)
+            if m is not None:
+                yield m.group(1), m.group(2), []
+                continue
+            m = _cst_port_re.search(statement)
+            if m is not None:
+                attrs = [_attribute(*kv.split("=", 1), ["IO_TYPE"]) for kv in m.group(2).split() if "=" in kv]
+                yield m.group(1), None, attrs
+
+parsers = {
+    "xdc": parse_xdc,
+    "qsf": parse_qsf,
+    "lpf": parse_lpf,
+    "pcf": parse_pcf,
+    "cst": parse_cst,
+}
+
+# Name Mapping -------------------------------------------------------------------------------------
+
+SKIP = object() # Returned by rules for ports that must not be imported.
+
+_bus_re = re.compile(r"^(.*?)[\[\(<](\d+)[\]\)>]$")
+
+def split_bus(port):
+    """Split a bus port name (ex: LED[3], LED(3), LED<3>) into (name, index), index None if scalar."""
+    m = _bus_re.match(port)
+    if m is None:
+        return port, None
+    return m.group(1), int(m.group(2))
+
+class Rule:
+    """Map the ports matching a regular expression to a LiteX resource.
+
+    resource, number, subsignal and index are format strings expanded with the groups of the match
+    (ex: Rule(r"LED(\\d)", "user_led", number="{0}")). When index is None, the bus index of the port
+    is used. A Rule with resource=None skips the matching ports.
+    """
+    def __init__(self, pattern, resource, number="0", subsignal=None, index=None):
+        self.pattern   = re.compile(pattern)
+        self.resource  = resource
+        self.number    = number
+        self.subsignal = subsignal
+        self.index     = index
+
+    def __call__(self, port):
+        m = self.pattern.fullmatch(port)
+        if m is None:
+            return None
+        if self.resource is None:
+            return SKIP
+        def expand(fmt):
+            return fmt.format(*m.groups(), **m.groupdict())
+        index = split_bus(port)[1] if self.index is None else int(expand(self.index))
+        return (
+            expand(self.resource),
+            int(expand(self.number)),
+            None if self.subsignal is None else expand(self.subsignal),
+            index)
+
+class NameMapper:
+    """Map port names to (resource, number, subsignal, index) with rules tried in order."""
+    def __init__(self, rules=[], strict=False):
+        self.rules  = list(rules)
+        self.strict = strict
+
+    def __call__(self, port):
+        for rule in self.rules:
+            r = rule(port)
+            if r is SKIP:
+                return None
+            if r is not None:
+                return r
+        if self.strict:
+            raise ValueError("No rule for port {}.".format(port))
+        name, index = split_bus(port)
+        return (re.sub(r"\W", "_", name).lower(), 0, None, index)
+
+# Import -------------------------------------------------------------------------------------------
+
+class Resources:
+    """Resources imported from constraint files: (name, number) -> subsignal -> pins/attributes."""
+    def __init__(self):
+        self.pins  = {} # (name, number) -> {subsignal: {index: pin}}
+        self.attrs = {} # (name, number) -> {subsignal: set of attributes}
+        self._port_attrs = {}
+        self._port_map   = {}
+
+    def add(self, port, pin, attrs, mapper):
+        if port not in self._port_map:
+            self._port_map[port] = mapper(port)
+        mapping = self._port_map[port]
+        if mapping is None:
+            return
+        name, number, subsignal, index = mapping
+        key   = (name, number)
+        index = 0 if index is None else index
+        if pin is not None:
+            self.pins.setdefault(key, {}).setdefault(subsignal, {})[index] = pin
+        if attrs:
+            attributes = self.attrs.setdefault(key, {}).setdefault(subsignal, {})
+            for attr in attrs:
+                attributes.setdefault(attr[0], {})[(port, attr[1])] = attr
+
+    def attributes(self, key, subsignal):
+        # Attributes shared by all the ports of a subsignal.
+        r = []
+        for name, values in sorted(self.attrs.get(key, {}).get(subsignal, {}).items()):
+            if name == "IOStandard":
+                unique = set(v for v in values.values())
+                if len(unique) == 1:
+                    r.extend(unique)
+            else:
+                r.extend(sorted(set(values.values())))
+        return r
+
+def import_constraints(files, fmt=None, mapper=None):
+    """Stream the constraint files and return the imported Resources."""
+    mapper    = NameMapper() if mapper is None else mapper
+    resources = Resources()
+    for filename in files:
+        parser = parsers[fmt or filename.rsplit(".", 1)[-1].lower()]
+        with open(filename, "r", errors="replace") as f:
+            for port, pin, attrs in parser(f):
+                resources.add(port, pin, attrs, mapper)
+    return resources
+
+# Writers ------------------------------------------------------------------------------------------
+
+def _extras(extras, name, subsignal):
+    for key in [(name, subsignal), (name, "*")]:
+        if key in extras:
+            return extras[key]
+    return None
+
+def _pins_list(key, subsignal, pins):
+    max_idx = max(pins.keys())
+    missing = [i for i in range(max_idx + 1) if i not in pins]
+    if missing:
+        raise ValueError("Missing pins {} for {}:{}:{}.".format(missing, key[0], key[1], subsignal))
+    return [pins[i] for i in range(max_idx + 1)]
+
+def _format_extras(items, force_newline=False, indent="            ", lcomma=","):
+    extra = "{} \n{}".format(lcomma, indent) if force_newline else "{} ".format(lcomma)
+    extra += (", \n{}".format(indent)).join(['{}("{}")'.format(i[0], i[1]) for i in items])
+    return extra
+
+def write_io(resources, f=sys.stdout, extras={}, attributes=True):
+    """Write the resources as a LiteX-Boards _io list."""
+    def emit(s, end="\n"):
+        f.write(s + end)
+    emit("_io = [")
+    for key, sigs in sorted(resources.pins.items(), key=lambda x: (x[0][0], x[0][1])):
+        name, number = key
+        emit('    ("{}", {}, '.format(name, number), end="\n" if len(sigs) > 1 else "")
+        for sig, pins in sorted(sigs.items(), key=lambda x: (x[0] is not None, x[0] or "")):
+            pins = _pins_list(key, sig, pins)
+            if len(pins) > 8:
+                p = ""
+                for j in range((len(pins) + 7) // 8):
+                    p += '\n            "{}"{}'.format(" ".join(pins[j*8:(j + 1)*8]),
+                        "," if j < ((len(pins) + 7) // 8 - 1) else "")
+            else:
+                p = '"{}"'.format(" ".join(pins))
+            items = _extras(extras, name, sig)
+            if items is None and attributes:
+                items = resources.attributes(key, sig)
+            extra = _format_extras(items, len(pins) > 8) if items else ""
+            if len(sigs) == 1:
+                emit("Pins({}){}".format(p, extra), end="")
+            else:
+                emit('        Subsignal("{}", Pins({}){}),'.format(sig, p, extra))
+        if (name, ) in extras:
+            if len(sigs) == 1:
+                emit(_format_extras(extras[name, ]), end="")
+            else:
+                emit(_format_extras(extras[name, ], False, "        ", "       "))
+        emit("    )," if len(sigs) > 1 else "),")
+    emit("]")
+
+def write_json(resources, f=sys.stdout, extras={}, attributes=True):
+    """Write the resources as JSON: list of {name, number, subsignals: {name: {pins, constraints}}}."""
+    r = []
+    for key, sigs in sorted(resources.pins.items(), key=lambda x: (x[0][0], x[0][1])):
+        name, number = key
+        subsignals = {}
+        for sig, pins in sigs.items():
+            items = _extras(extras, name, sig)
+            if items is None and attributes:
+                items = resources.attributes(key, sig)
+            subsignals[sig or ""] = {
+                "pins"        : _pins_list(key, sig, pins),
+                "constraints" : [list(i) for i in items or []],
+            }
+        r.append({
+            "name"        : name,
+            "number"      : number,
+            "subsignals"  : subsignals,
+            "constraints" : [list(i) for i in extras.get((name, ), [])],
+        })
+    json.dump(r, f, indent=4)
+    f.write("\n")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Import vendor constraint files into LiteX-Boards IOs")
+    parser.add_argument("files",           nargs="+",                         help="Constraint files (.xdc, .qsf, .lpf, .pcf, .cst)")
+    parser.add_argument("--format",        default=None, choices=list(parsers), help="Constraint format (default: from file extension)")
+    parser.add_argument("--rules",         default=None,                      help="Python file defining name-mapping rules (and extras)")
+    parser.add_argument("--strict",        action="store_true",               help="Fail on ports not handled by the rules")
+    parser.add_argument("--no-attributes", action="store_true",               help="Do not import IO attributes from the constraint files")
+    parser.add_argument("--json",          action="store_true",               help="Write JSON instead of a Python _io list")
+    parser.add_argument("-o", "--output",  default=None,                      help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    rules  = runpy.run_path(args.rules) if args.rules is not None else {}
+    mapper = NameMapper(rules.get("rules", []), strict=args.strict)
+    resources = import_constraints(args.files, args.format, mapper)
+    writer    = write_json if args.json else write_io
+    output    = sys.stdout if args.output is None else open(args.output, "w")
+    writer(resources, output, extras=rules.get("extras", {}), attributes=not args.no_attributes)
+    if args.output is not None:
+        output.close()
+
+if __name__ == "__main__":
+    main()
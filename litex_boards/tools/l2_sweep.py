@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+L2 cache size/data width sweep for the SDRAM targets.
+
+Each target is elaborated up to its add_sdram() to get its SDRAM module, PHY settings and system
+clock frequency, then the main_ram path of the SoC (L2 cache, LiteDRAM core) is simulated over a
+model of the SDRAM for each L2 cache size/minimal data width of the grid, running a fixed memory
+benchmark (sequential, hot set and random 32-bit accesses of a CPU). The throughput of each
+configuration is reported against its block RAM cost (estimated with the block RAM primitives of
+the vendor, L2 data memories being split in byte-wide memories by FullMemoryWE), and the cheapest
+configuration within --tolerance percent of the best throughput recommended:
+
+    $ python3 -m litex_boards.tools.l2_sweep ulx3s alveo_u250 -j 2
+    $ python3 -m litex_boards.tools.l2_sweep arty --sizes 0 4096 8192 --widths 128 -- --variant=a7-100
+
+Extra arguments (after --) are passed to the targets. Results are written to --results.
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from litex_boards import targets
+from litex_boards import platforms
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def benchmark(n=4096, region=2**16, hot=2**14, seed=0):
+    """Return the (we, byte address) accesses of the memory benchmark, in region bytes.
+
+    40% of sequential accesses (streams of 64 words), 30% of accesses in a hot set of hot bytes and
+    30% of random accesses; 25% of writes.
+    """
+    rng      = random.Random(seed)
+    accesses = []
+    stream   = 0
+    while len(accesses) < n:
+        kind = rng.random()
+        if kind < 0.4:
+            for i in range(64):
+                accesses.append((rng.random() < 0.25, (stream + 4*i) % region))
+            stream = (stream + 256) % region
+        elif kind < 0.7:
+            accesses.append((rng.random() < 0.25, region - hot + 4*rng.randrange(hot//4)))
+        else:
+            accesses.append((rng.random() < 0.25, 4*rng.randrange(region//4)))
+    return accesses[:n]
+
+# Block RAM Cost -----------------------------------------------------------------------------------
+
+# Block RAM primitives: (name, bits, data widths).
+_m9k  = ("M9K",    9216, [1, 2, 4, 9, 18, 36])
+_m10k = ("M10K",  10240, [1, 2, 4, 5, 8, 10, 16, 20, 32, 40])
+_b18k = ("18Kb",  18432, [1, 2, 4, 9, 18, 36])
+_ebr  = ("EBR",    4096, [2, 4, 8, 16])
+
+def bram_primitive(vendor, device=""):
+    if vendor == "intel":
+        return _m10k if device.startswith("5C") else _m9k
+    if vendor == "lattice" and device.upper().startswith("ICE"):
+        return _ebr
+    return _b18k
+
+def bram_blocks(width, depth, primitive):
+    """Return the number of primitives of a width x depth memory (best primitive aspect ratio)."""
+    name, bits, widths = primitive
+    r = None
+    for w in widths:
+        n = math.ceil(width/w)*math.ceil(depth/2**int(math.log2(bits//w)))
+        r = n if r is None else min(r, n)
+    return r
+
+def l2_cost(l2_size, data_width, primitive, full_memory_we=True):
+    """Return the block RAM primitives used by a L2 cache (data and tag memories)."""
+    if l2_size == 0:
+        return 0
+    offsetbits = int(math.log2(max(data_width//32, 1)))
+    linebits   = int(math.log2(l2_size//4)) - offsetbits
+    tagbits    = 30 + offsetbits - linebits
+    if full_memory_we:
+        data = (data_width//8)*bram_blocks(8, 2**linebits, primitive)
+    else:
+        data = bram_blocks(data_width, 2**linebits, primitive)
+    return data + bram_blocks(tagbits + 1, 2**linebits, primitive)
+
+def configurations(port_data_width, sizes, widths):
+    """Return the distinct (l2_size, l2_data_width) configurations of the grid."""
+    r = set()
+    for size in sizes:
+        for width in widths:
+            if size == 0:
+                r.add((0, port_data_width))
+            else:
+                # Sizes/widths adjusted as SoC.add_sdram() does.
+                r.add((2**int(math.log2(max(size, 2*port_data_width//8))), max(port_data_width, width)))
+    return sorted(r)
+
+def recommend(points, tolerance=5.0):
+    """Return the cheapest point with a throughput within tolerance percent of the best."""
+    points = [p for p in points if not p.get("errors") and "throughput" in p]
+    if not points:
+        return None
+    best = max(p["throughput"] for p in points)
+    candidates = [p for p in points if p["throughput"] >= best*(1 - tolerance/100)]
+    return min(candidates, key=lambda p: (p["bram"], -p["throughput"]))
+
+# Target Elaboration/Simulation --------------------------------------------------------------------
+
+class _Captured(Exception):
+    pass
+
+def capture_sdram(name, args=()):
+    """Run a target up to its add_sdram(), return its SDRAM configuration (None when no SDRAM)."""
+    from litex.soc.integration.soc import SoC
+    from litex_boards.integration.builder import Builder
+    captured = {}
+    def add_sdram(soc, name="sdram", phy=None, module=None, **kwargs):
+        captured.update(
+            module         = module,
+            phy_settings   = phy.settings,
+            clk_freq       = soc.sys_clk_freq,
+            bus_data_width = soc.bus.data_width,
+            l2_reverse     = kwargs.get("l2_cache_reverse", True))
+        raise _Captured()
+    def builder(self, *args, **kwargs):
+        raise _Captured() # No SDRAM.
+    methods  = SoC.add_sdram, Builder.__init__
+    argv     = sys.argv
+    SoC.add_sdram, Builder.__init__ = add_sdram, builder
+    sys.argv = [name] + list(args)
+    try:
+        targets.get(name).main()
+    except _Captured:
+        pass
+    finally:
+        SoC.add_sdram, Builder.__init__ = methods
+        sys.argv = argv
+    return captured or None
+
+def simulate(sdram, l2_size, l2_data_width, accesses, region):
+    from migen.sim import run_simulation
+    from litex_boards.integration.sdram import SDRAMBenchModel
+    dut = SDRAMBenchModel(sdram["module"], sdram["phy_settings"], sdram["clk_freq"],
+        size                    = region,
+        bus_data_width          = sdram["bus_data_width"],
+        l2_cache_size           = l2_size,
+        l2_cache_min_data_width = l2_data_width,
+        l2_cache_reverse        = sdram["l2_reverse"])
+    r = {}
+    run_simulation(dut, dut.run(accesses, r))
+    r["throughput"] = 4*len(accesses)*sdram["clk_freq"]/r["cycles"]
+    return r
+
+def sweep(name, args, sizes, widths, accesses, region, tolerance):
+    """Sweep the L2 configurations of a target, return its results."""
+    sdram = capture_sdram(name, args)
+    if sdram is None:
+        return {"error": "no SDRAM"}
+    info      = platforms.info(targets.info(name)["platforms"][0])
+    primitive = bram_primitive(info["vendor"], (info["devices"] or [""])[0])
+    settings  = sdram["phy_settings"]
+    port_data_width = 2**int(math.log2(settings.dfi_databits*settings.nphases))
+    trace  = benchmark(accesses, region)
+    points = []
+    for l2_size, l2_data_width in configurations(port_data_width, sizes, widths):
+        point = {"l2_size": l2_size, "l2_data_width": l2_data_width,
+            "bram": l2_cost(l2_size, l2_data_width, primitive)}
+        point.update(simulate(sdram, l2_size, l2_data_width, trace, region))
+        print("{:<24} L2 {:>6} bytes {:>4}-bit: {:>8.1f} MB/s, {:>3} {}".format(name,
+            l2_size, l2_data_width, point["throughput"]/1e6, point["bram"], primitive[0]), file=sys.stderr)
+        points.append(point)
+    return {
+        "module"          : type(sdram["module"]).__name__,
+        "memtype"         : settings.memtype,
+        "port_data_width" : port_data_width,
+        "sys_clk_freq"    : sdram["clk_freq"],
+        "primitive"       : primitive[0],
+        "points"          : points,
+        "recommended"     : recommend(points, tolerance),
+    }
+
+# Run ----------------------------------------------------------------------------------------------
+
+def sdram_targets():
+    # Targets integrating a LiteDRAM core.
+    r = []
+    for name in targets.boards():
+        with open(os.path.join(os.path.dirname(targets.__file__), name + ".py")) as f:
+            if "add_sdram" in f.read():
+                r.append(name)
+    return r
+
+def worker_command(name, args):
+    """Command sweeping a target in its own process (targets and simulations are independent)."""
+    return [sys.executable, "-m", "litex_boards.tools.l2_sweep", "--worker", name,
+        "--sizes",     *[str(s) for s in args.sizes],
+        "--widths",    *[str(w) for w in args.widths],
+        "--accesses",  str(args.accesses),
+        "--region",    str(args.region),
+        "--tolerance", str(args.tolerance),
+        "--"] + args.target_args
+
+def _run(name, args):
+    process = subprocess.run(worker_command(name, args), stdout=subprocess.PIPE)
+    try:
+        return json.loads(process.stdout.decode().strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"error": "sweep failed (exit code {})".format(process.returncode)}
+
+def print_results(results):
+    print("{:<24} {:<14} {:>9} {:>10} {:>10} {:>8}".format(
+        "Target", "Module", "L2 bytes", "L2 width", "MB/s", "BRAM"))
+    for name, r in sorted(results.items()):
+        best = r.get("recommended")
+        if best is None:
+            print("{:<24} {}".format(name, r.get("error", "no result")))
+            continue
+        print("{:<24} {:<14} {:>9} {:>10} {:>10.1f} {:>4} {}".format(name, r["module"],
+            best["l2_size"], best["l2_data_width"], best["throughput"]/1e6, best["bram"], r["primitive"]))
+
+def parse_args(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Target arguments (after --) are split first: argparse would assign them to targets.
+    target_args = []
+    if "--" in argv:
+        argv, target_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    parser = argparse.ArgumentParser(description="L2 cache size/data width sweep for the SDRAM targets")
+    parser.add_argument("targets",      nargs="*",                                        help="Targets to sweep (default: all SDRAM targets)")
+    parser.add_argument("--sizes",      nargs="+", type=int, default=[0, 2048, 4096, 8192, 16384, 32768], help="L2 cache sizes (bytes)")
+    parser.add_argument("--widths",     nargs="+", type=int, default=[32, 64, 128, 256, 512], help="L2 cache minimal data widths")
+    parser.add_argument("--accesses",   default=4096, type=int,                           help="Number of accesses of the benchmark")
+    parser.add_argument("--region",     default=2**16, type=int,                          help="Memory region of the benchmark (bytes)")
+    parser.add_argument("--tolerance",  default=5.0, type=float,                          help="Throughput tolerance of the recommendation (percent)")
+    parser.add_argument("-j", "--jobs", default=1, type=int,                              help="Number of targets swept in parallel")
+    parser.add_argument("--results",    default="build/l2_sweep/l2_sweep.json",           help="Results file")
+    parser.add_argument("--worker",     default=None,                                     help=argparse.SUPPRESS)
+    args, unknown_args = parser.parse_known_args(argv)
+    args.target_args   = unknown_args + target_args
+    return args
+
+def main():
+    args = parse_args()
+
+    if args.worker is not None:
+        r = sweep(args.worker, args.target_args, args.sizes, args.widths, args.accesses, args.region, args.tolerance)
+        print(json.dumps(r))
+        return
+
+    names = args.targets or sdram_targets()
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        results = dict(zip(names, executor.map(lambda name: _run(name, args), names)))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+    with open(args.results, "w") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+    print_results(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Persistent OpenOCD programming session.
+
+Keeps OpenOCD running between bitstream loads and flash writes (see build/openocd.py's
+OpenOCDSession): the adapter is opened and the JTAG chain scanned once and the flash proxy
+bitstream stays loaded. The session is started on the first load/flash (or with start) and
+shared by all the commands using the same platform/serial:
+
+    $ python3 -m litex_boards.tools.openocd_session arty load arty.bit
+    $ python3 -m litex_boards.tools.openocd_session arty flash arty.bin --no-reconfigure
+    $ python3 -m litex_boards.tools.openocd_session arty stop
+
+With --sector-diff, flash only erases/programs the sectors differing from the current Flash content
+(see build/spiflash.py).
+"""
+
+import os
+import argparse
+
+from litex_boards import platforms
+from litex_boards.build.openocd import OpenOCDSession
+from litex_boards.build.spiflash import OpenOCDSPIFlash, program_file
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent OpenOCD programming session")
+    parser.add_argument("platform",                                               help="Platform of the board")
+    parser.add_argument("command",          choices=["start", "load", "flash", "stop", "status"])
+    parser.add_argument("filename",         nargs="?",                            help="Bitstream to load or image to flash")
+    parser.add_argument("--address",        default="0",                          help="Flash address")
+    parser.add_argument("--no-reconfigure", action="store_true",                  help="Don't reconfigure the FPGA after flashing (flash proxy kept loaded)")
+    parser.add_argument("--sector-diff",    action="store_true",                  help="Only erase/program the changed Flash sectors")
+    parser.add_argument("--variant",        default=None,                         help="Platform variant")
+    parser.add_argument("--serial",         default=None,                         help="Serial number of the JTAG adapter")
+    parser.add_argument("--port",           default=6666, type=int,               help="OpenOCD Tcl RPC port")
+    parser.add_argument("--session-dir",    default="build/openocd_session",      help="Directory of the session state/log")
+    args = parser.parse_args()
+
+    if args.command in ["load", "flash"] and args.filename is None:
+        parser.error("{} requires a filename.".format(args.command))
+
+    name     = args.platform if args.serial is None else "{}_{}".format(args.platform, args.serial)
+    kwargs   = {} if args.variant is None else {"variant": args.variant}
+    platform = platforms.get(args.platform).Platform(**kwargs)
+    session  = OpenOCDSession(platform.create_programmer(),
+        state  = os.path.join(args.session_dir, name + ".json"),
+        serial = args.serial,
+        port   = args.port)
+
+    if args.command == "start":
+        session.start()
+    elif args.command == "load":
+        session.load_bitstream(os.path.abspath(args.filename)) # OpenOCD may run in another directory.
+    elif args.command == "flash" and args.sector_diff:
+        with OpenOCDSPIFlash(session) as device:
+            program_file(device, int(args.address, 0), os.path.abspath(args.filename))
+            if not args.no_reconfigure:
+                device.reconfigure()
+    elif args.command == "flash":
+        session.flash(int(args.address, 0), os.path.abspath(args.filename), reconfigure=not args.no_reconfigure)
+    elif args.command == "stop":
+        session.stop()
+    print("OpenOCD session {}: {}.".format(name,
+        "running (PID {}, port {})".format(session.state["pid"], session.state["port"]) if session.running() else "stopped"))
+
+if __name__ == "__main__":
+    main()
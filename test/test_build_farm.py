@@ -0,0 +1,35 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import tempfile
+import unittest
+
+from litex_boards.tools.build_farm import BuildFarm, toolchain, footprint
+
+
+class TestBuildFarm(unittest.TestCase):
+    def test_footprint(self):
+        self.assertEqual(toolchain("arty"), "vivado")
+        self.assertEqual(toolchain("arty", ["--toolchain", "symbiflow"]), "symbiflow")
+        self.assertEqual(toolchain("versa_ecp5"), "trellis")
+        self.assertGreater(footprint("alveo_u250")[0], footprint("arty")[0])
+        self.assertEqual(footprint("versa_ecp5", ["--seeds", "8", "--jobs", "4"])[1], 4)
+
+    def test_schedule(self):
+        with tempfile.TemporaryDirectory() as directory:
+            farm = BuildFarm(directory, memory=int(20e9), threads=8, backfill=1, run=False)
+            a, merged = farm.submit("arty")                    # 8GB.
+            self.assertFalse(merged)
+            self.assertEqual(farm.submit("arty", ["--build"]), (a, True))
+            b, _ = farm.submit("alveo_u250")                   # 24GB: clamped to 20GB, waits.
+            c, _ = farm.submit("versa_ecp5")                   # 2GB: backfilled once.
+            d, _ = farm.submit("icebreaker")                   # 1GB: not backfilled anymore.
+            self.assertEqual(a.clients, 2)
+            self.assertEqual([j.state for j in [a, b, c, d]], ["running", "queued", "running", "queued"])
+            farm.done(a, 0)
+            farm.done(c, 0)
+            self.assertEqual([j.state for j in [a, b, c, d]], ["done", "running", "done", "queued"])
+            self.assertEqual(list(a.follow()), [])
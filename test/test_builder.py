@@ -0,0 +1,73 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import json
+import tempfile
+import unittest
+
+from migen import *
+
+from litex.build.generic_platform import Pins, IOStandard
+from litex.build.lattice import LatticePlatform
+from litex.build.io import CRG
+from litex.soc.integration.soc_core import SoCMini
+
+from litex_boards.integration.builder import Builder
+from litex_boards.tools import fmax_search
+
+_io = [("clk25", 0, Pins("G2"), IOStandard("LVCMOS33"))]
+
+class Platform(LatticePlatform):
+    default_clk_name   = "clk25"
+    default_clk_period = 1e9/25e6
+
+    def __init__(self):
+        LatticePlatform.__init__(self, "LFE5U-45F-6BG381C", _io, toolchain="trellis")
+
+def build(output_dir, log):
+    """Build a minimal SoC with the Builder, the toolchain run being replaced by writing log."""
+    platform = Platform()
+    soc      = SoCMini(platform, clk_freq=25e6)
+    soc.submodules.crg = CRG(platform.request("clk25"))
+    builder  = Builder(soc, output_dir=output_dir, compile_software=False)
+    def run_toolchain():
+        with open(os.path.join(builder.gateware_dir, "build_" + soc.build_name + ".log"), "w") as f:
+            f.write(log)
+    builder.run_toolchain = run_toolchain
+    builder.build(run=True)
+    return builder
+
+
+class TestBuilder(unittest.TestCase):
+    def test_report(self):
+        with tempfile.TemporaryDirectory() as d:
+            builder = build(d, "Info: Max frequency for clock '$glbnet$sys_clk': 55.00 MHz (PASS at 25.00 MHz)\n")
+            with open(os.path.join(builder.gateware_dir, builder.soc.build_name + "_report.json")) as f:
+                report = json.load(f)
+        self.assertEqual(report["toolchain"], "nextpnr")
+        self.assertEqual(report["domains"]["sys"]["fmax"], 55.0)
+        self.assertGreater(report["wns"], 0)
+
+    def test_liblitedram(self):
+        # liblitedram replaced when the SoC stores its SDRAM calibration in SPI Flash.
+        from litex_boards.integration.sdram_calibration import liblitedram_directory
+        for constants, directory in [({}, False), ({"SDRAM_CALIBRATION_FLASH_OFFSET": 0x100000}, True)]:
+            soc = SoCMini(Platform(), clk_freq=25e6)
+            for name, value in constants.items():
+                soc.add_constant(name, value)
+            packages = dict(Builder(soc, compile_software=False).software_packages)
+            self.assertEqual(packages["liblitedram"] == liblitedram_directory, directory)
+
+    def test_fmax_search_result(self):
+        for log, status in [
+            ("Info: Max frequency for clock '$glbnet$sys_clk': 55.00 MHz (PASS at 25.00 MHz)\n", "pass"),
+            ("Info: Max frequency for clock '$glbnet$sys_clk': 20.00 MHz (FAIL at 25.00 MHz)\n", "fail")]:
+            with tempfile.TemporaryDirectory() as d:
+                build(d, log)
+                r = fmax_search.result(d)
+            self.assertEqual(r["status"], status)
+            self.assertEqual(r["sys_fmax"], 55.0 if status == "pass" else 20.0)
@@ -0,0 +1,66 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.integration.cache import BuildCache
+
+
+class _Toolchain:
+    pass
+
+class _Platform:
+    toolchain = _Toolchain()
+    sources   = []
+
+
+class TestBuildCache(unittest.TestCase):
+    def prepare(self, gateware_dir, netlist="module top(); endmodule\n", ident="LiteX SoC 2021-01-01 12:00:00"):
+        os.makedirs(gateware_dir)
+        with open(os.path.join(gateware_dir, "top_mem.init"), "w") as f:
+            f.write("".join("{:02x}\n".format(c) for c in ident.encode() + b"\0"))
+        with open(os.path.join(gateware_dir, "top.v"), "w") as f:
+            f.write("// Auto-generated by LiteX on {}\n".format(gateware_dir))
+            f.write(netlist)
+        with open(os.path.join(gateware_dir, "top.tcl"), "w") as f:
+            f.write("read_verilog {{{}}}\n".format(os.path.join(gateware_dir, "top.v")))
+
+    def test_hit_across_output_dirs(self):
+        with tempfile.TemporaryDirectory() as d:
+            cache = BuildCache(os.path.join(d, "cache"))
+            self.prepare(os.path.join(d, "a"))
+            self.prepare(os.path.join(d, "b"))
+            key = cache.key(_Platform(), os.path.join(d, "a"))
+            self.assertEqual(key, cache.key(_Platform(), os.path.join(d, "b")))
+            self.assertFalse(cache.fetch(key, os.path.join(d, "a")))
+            snapshot = cache.snapshot(os.path.join(d, "a"))
+            with open(os.path.join(d, "a", "top.bit"), "wb") as f:
+                f.write(b"\xff"*16)
+            cache.store(key, os.path.join(d, "a"), snapshot)
+            self.assertTrue(cache.fetch(key, os.path.join(d, "b")))
+            with open(os.path.join(d, "b", "top.bit"), "rb") as f:
+                self.assertEqual(f.read(), b"\xff"*16)
+
+    def test_netlist_change_misses(self):
+        with tempfile.TemporaryDirectory() as d:
+            cache = BuildCache(os.path.join(d, "cache"))
+            self.prepare(os.path.join(d, "a"))
+            self.prepare(os.path.join(d, "b"), netlist="module top(input a); endmodule\n")
+            self.assertNotEqual(
+                cache.key(_Platform(), os.path.join(d, "a")),
+                cache.key(_Platform(), os.path.join(d, "b")))
+
+    def test_hit_across_build_times(self):
+        with tempfile.TemporaryDirectory() as d:
+            cache = BuildCache(os.path.join(d, "cache"))
+            self.prepare(os.path.join(d, "a"), ident="LiteX SoC 2021-01-01 12:00:00")
+            self.prepare(os.path.join(d, "b"), ident="LiteX SoC 2021-03-14 09:26:53")
+            self.prepare(os.path.join(d, "c"), ident="LiteX SoD 2021-03-14 09:26:53")
+            key = cache.key(_Platform(), os.path.join(d, "a"))
+            self.assertEqual(key,    cache.key(_Platform(), os.path.join(d, "b")))
+            self.assertNotEqual(key, cache.key(_Platform(), os.path.join(d, "c")))
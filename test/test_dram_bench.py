@@ -0,0 +1,82 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import random
+import unittest
+
+from litex_boards.tools import dram_bench
+
+
+class FakeRegister:
+    def __init__(self, value=0, on_write=None):
+        self.value    = value
+        self.on_write = on_write
+
+    def read(self):
+        return self.value
+
+    def write(self, value):
+        self.value = value
+        if self.on_write is not None:
+            self.on_write()
+
+
+class FakeBus:
+    # BIST moving one 16-byte word per cycle (+ 10 cycles of latency for the checker), over a memory
+    # addressed as LiteDRAM does: random addresses are masked with end - base on word addresses and
+    # the random data restart on each run.
+    def __init__(self):
+        self.constants = type("Constants", (), {"d": {
+            "config_clock_frequency"  : 100_000_000,
+            "sdram_bench_data_width"  : 128,
+            "sdram_bench_size"        : 2**28,
+        }})
+        self.memory   = {}
+        self.accesses = []
+        regs = {}
+        for name, latency in [("sdram_generator", 0), ("sdram_checker", 10)]:
+            for reg in ["reset", "base", "end", "length", "random", "done", "ticks"]:
+                regs[name + "_" + reg] = FakeRegister()
+            def start(name=name, latency=latency):
+                reg    = lambda r: regs[name + "_" + r].value
+                lfsr   = random.Random(0)
+                errors = 0
+                for i in range(reg("length")//16):
+                    address = reg("base")//16 + (lfsr.getrandbits(31) & (reg("end") - reg("base") - 1) if reg("random") & 0b10 else i)
+                    data    = hash((i, "data")) if reg("random") & 0b01 else i
+                    self.accesses.append(16*address)
+                    if name == "sdram_generator":
+                        self.memory[address] = data
+                    else:
+                        errors += self.memory.get(address) != data
+                regs[name + "_done"].value  = 1
+                regs[name + "_ticks"].value = reg("length")//16 + latency
+                regs["sdram_checker_errors"].value = errors
+            regs[name + "_start"] = FakeRegister(on_write=start)
+        regs["sdram_checker_errors"] = FakeRegister()
+        self.regs = type("Regs", (), regs)
+
+
+class TestDRAMBench(unittest.TestCase):
+    def test_run(self):
+        bus = FakeBus()
+        r   = dram_bench.DRAMBench(bus).run(length=3*2**20)
+        self.assertEqual((r["base"], r["length"], r["word"], r["errors"]), (2**27, 3*2**20, 16, 0))
+        self.assertTrue(all(2**27 <= a < 2**27 + 3*2**20 for a in bus.accesses))
+        self.assertAlmostEqual(r["sequential"]["write_bandwidth"], 1.6e9)
+        self.assertLess(r["sequential"]["read_bandwidth"], 1.6e9)
+        # Random: 64 bursts of 16 words.
+        self.assertAlmostEqual(r["random"]["write_bandwidth"], 1.6e9)
+        self.assertAlmostEqual(r["random"]["read_bandwidth"],  1.6e9*16/26)
+        self.assertAlmostEqual(r["random"]["write_latency"], 10e-9)
+        self.assertAlmostEqual(r["random"]["read_latency"],  110e-9)
+
+    def test_errors(self):
+        bus   = FakeBus()
+        bench = dram_bench.DRAMBench(bus)
+        bench.generator.run(0, 256, random_data=True)
+        bus.memory[3] += 1
+        self.assertEqual(bench.checker.run(0, 256, random_data=True), (26, 1))
@@ -0,0 +1,38 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litex_boards.tools.fmax_search import search
+
+
+class TestFmaxSearch(unittest.TestCase):
+    def evaluate(self, fmax, crg_max=None):
+        def evaluate(freqs):
+            self.rounds.append(freqs)
+            r = []
+            for f in freqs:
+                if crg_max is not None and f > crg_max:
+                    r.append({"status": "crg"})
+                else:
+                    r.append({"status": "pass" if f <= fmax else "fail"})
+            return r
+        self.rounds = []
+        return evaluate
+
+    def test_search(self):
+        for jobs in [1, 2, 4]:
+            best, results = search(self.evaluate(fmax=137.4e6), 100e6, 200e6, step=1e6, jobs=jobs)
+            self.assertEqual(best, 137e6)
+            self.assertTrue(all(len(freqs) <= max(jobs, 2) for freqs in self.rounds))
+
+    def test_crg(self):
+        best, results = search(self.evaluate(fmax=180e6, crg_max=150e6), 100e6, 200e6, step=1e6, jobs=4)
+        self.assertEqual(best, 150e6)
+
+    def test_bounds(self):
+        self.assertEqual(search(self.evaluate(fmax=250e6), 100e6, 200e6, jobs=4)[0], 200e6)
+        self.assertEqual(search(self.evaluate(fmax=50e6),  100e6, 200e6, jobs=4)[0], None)
@@ -0,0 +1,41 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import json
+import tempfile
+import unittest
+
+from litex_boards.integration.image import FlashImage
+
+
+class TestFlashImage(unittest.TestCase):
+    def write(self, d, name, data):
+        filename = os.path.join(d, name)
+        with open(filename, "wb") as f:
+            f.write(data)
+        return filename
+
+    def test_layout(self):
+        with tempfile.TemporaryDirectory() as d:
+            image = FlashImage(fill=0xff)
+            image.add("bitstream", self.write(d, "top.bin",  b"\x01"*10), 0x00, size=0x10)
+            image.add("bios",      self.write(d, "bios.bin", b"\x02"*4),  0x10, size=0x08)
+            self.assertEqual(image.build(os.path.join(d, "image.bin")), 0x18)
+            with open(os.path.join(d, "image.bin"), "rb") as f:
+                self.assertEqual(f.read(), b"\x01"*10 + b"\xff"*6 + b"\x02"*4 + b"\xff"*4)
+            with open(os.path.join(d, "image.bin.json")) as f:
+                manifest = json.load(f)
+            self.assertEqual([(r["name"], r["offset"], r["length"]) for r in manifest["regions"]],
+                [("bitstream", 0x00, 10), ("bios", 0x10, 4)])
+
+    def test_overlap(self):
+        with tempfile.TemporaryDirectory() as d:
+            image = FlashImage(fill=0x00)
+            image.add("bitstream", self.write(d, "top.bin",  b"\x01"*10), 0)
+            image.add("bios",      self.write(d, "bios.bin", b"\x02"*4),  8)
+            with self.assertRaises(ValueError):
+                image.build(os.path.join(d, "image.bin"))
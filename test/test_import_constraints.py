@@ -0,0 +1,70 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import io
+import os
+import tempfile
+import unittest
+
+from litex_boards.tools.import_constraints import Rule, NameMapper, import_constraints, write_io
+
+
+constraints = {
+    "xdc": """
+set_property PACKAGE_PIN E3 [get_ports clk100] ;# Comment
+set_property -dict {PACKAGE_PIN H5 IOSTANDARD LVCMOS33} [get_ports {led[0]}]
+set_property -dict {PACKAGE_PIN J5 IOSTANDARD LVCMOS33} [get_ports {led[1]}]
+""",
+    "qsf": """
+set_location_assignment PIN_E3 -to clk100
+set_location_assignment PIN_H5 -to led[0]
+set_location_assignment PIN_J5 -to led[1]
+set_instance_assignment -name IO_STANDARD "3.3-V LVTTL" -to led[0]
+set_instance_assignment -name IO_STANDARD "3.3-V LVTTL" -to led[1]
+""",
+    "lpf": """
+LOCATE COMP "clk100" SITE "E3";
+LOCATE COMP "led[0]" SITE "H5"; IOBUF PORT "led[0]" IO_TYPE=LVCMOS33;
+LOCATE COMP "led[1]" SITE "J5"; IOBUF PORT "led[1]" IO_TYPE=LVCMOS33;
+""",
+    "pcf": """
+set_io clk100 E3
+set_io -nowarn led[0] H5
+set_io led[1] J5
+""",
+    "cst": """
+IO_LOC "clk100" E3; // Comment
+IO_LOC "led[0]" H5;
+IO_LOC "led[1]" J5;
+""",
+}
+
+
+class TestImportConstraints(unittest.TestCase):
+    def import_constraints(self, fmt, mapper=None):
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "board." + fmt)
+            with open(filename, "w") as f:
+                f.write(constraints[fmt])
+            return import_constraints([filename], mapper=mapper)
+
+    def test_formats(self):
+        for fmt in constraints:
+            with self.subTest(fmt=fmt):
+                resources = self.import_constraints(fmt)
+                self.assertEqual(resources.pins[("clk100", 0)], {None: {0: "E3"}})
+                self.assertEqual(resources.pins[("led", 0)],    {None: {0: "H5", 1: "J5"}})
+
+    def test_rules(self):
+        mapper = NameMapper([
+            Rule(r"led\[(\d)\]", "user_led", number="{0}", index="0"),
+            Rule(r"clk100", None),
+        ])
+        resources = self.import_constraints("xdc", mapper)
+        self.assertEqual(sorted(resources.pins), [("user_led", 0), ("user_led", 1)])
+        f = io.StringIO()
+        write_io(resources, f)
+        self.assertIn('("user_led", 1, Pins("J5"), IOStandard("LVCMOS33")),', f.getvalue())
@@ -0,0 +1,29 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.integration import incremental
+
+
+class TestIncremental(unittest.TestCase):
+    def test_commands(self):
+        # Commands are formatted with build_name by the Vivado toolchain.
+        self.assertEqual(incremental.read_command.format(build_name="top"),
+            "if {[file exists top_incremental.dcp]} { read_checkpoint -incremental -auto_incremental top_incremental.dcp }")
+
+    def test_reference(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.assertFalse(incremental.discard(d, "top"))
+            incremental.update(d, "top") # No routed checkpoint: no reference.
+            self.assertFalse(os.path.exists(incremental.reference(d, "top")))
+            with open(os.path.join(d, "top_route.dcp"), "wb") as f:
+                f.write(b"dcp")
+            incremental.update(d, "top")
+            self.assertTrue(os.path.exists(incremental.reference(d, "top")))
+            self.assertTrue(incremental.discard(d, "top"))
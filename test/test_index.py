@@ -0,0 +1,36 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import unittest
+
+from litex_boards import platforms, targets
+from litex_boards.tools import generate_index
+
+
+class TestIndex(unittest.TestCase):
+    def test_up_to_date(self):
+        for package, index in [
+            ("platforms", generate_index.platforms_index()),
+            ("targets",   generate_index.targets_index())]:
+            with self.subTest(package=package):
+                filename = os.path.join(generate_index.root_dir, package, "_index.py")
+                with open(filename) as f:
+                    self.assertEqual(f.read(), generate_index.generate(index),
+                        msg="Outdated index, run: python3 -m litex_boards.tools.generate_index")
+
+    def test_lazy(self):
+        self.assertIn("arty", platforms.boards(vendor="xilinx"))
+        self.assertIn("xc7a100tcsg324-1", platforms.info("arty")["devices"])
+        self.assertEqual(platforms.variants("arty")["variant"], ["a7-35", "a7-100"])
+        self.assertIn("kcu105", targets.boards(option="--with-pcie"))
+        self.assertNotIn("litex_boards.platforms.arty", sys.modules)
+        self.assertNotIn("litex_boards.targets.arty",   sys.modules)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            platforms.info("not_a_board")
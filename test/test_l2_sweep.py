@@ -0,0 +1,72 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litedram.modules import MT41K128M16
+from litedram.phy.model import get_sdram_phy_settings
+
+from litex_boards.tools import l2_sweep
+
+
+class TestL2Sweep(unittest.TestCase):
+    def test_benchmark(self):
+        accesses = l2_sweep.benchmark(1000, region=2**16)
+        self.assertEqual(accesses, l2_sweep.benchmark(1000, region=2**16)) # Deterministic.
+        self.assertEqual(len(accesses), 1000)
+        self.assertTrue(all(0 <= a < 2**16 and a % 4 == 0 for _, a in accesses))
+        self.assertTrue(0.15 < sum(we for we, _ in accesses)/1000 < 0.35)
+
+    def test_simulate(self):
+        sdram = dict(
+            module         = MT41K128M16(100e6, "1:4"),
+            phy_settings   = get_sdram_phy_settings(memtype="DDR3", data_width=16, clk_freq=100e6),
+            clk_freq       = 100e6,
+            bus_data_width = 32,
+            l2_reverse     = True)
+        accesses = l2_sweep.benchmark(100, region=2**14, hot=2**12)
+        r = l2_sweep.simulate(sdram, 2048, 128, accesses, 2**14)
+        self.assertEqual(r["errors"], 0)
+        self.assertGreater(r["cycles"], len(accesses))
+        self.assertLess(r["throughput"], 4*100e6)
+
+    def test_cost(self):
+        b18k = l2_sweep.bram_primitive("xilinx")
+        self.assertEqual(l2_sweep.bram_blocks(8,  512,  b18k), 1)
+        self.assertEqual(l2_sweep.bram_blocks(16, 4096, b18k), 4)
+        self.assertEqual(l2_sweep.bram_blocks(72, 512,  b18k), 2)
+        # 8KiB, 128-bit: 16 byte-wide data memories + tag memory.
+        self.assertEqual(l2_sweep.l2_cost(8192, 128, b18k), 17)
+        self.assertEqual(l2_sweep.l2_cost(8192, 128, b18k, full_memory_we=False), 5)
+        self.assertEqual(l2_sweep.l2_cost(0, 128, b18k), 0)
+        self.assertEqual(l2_sweep.bram_primitive("intel", "5CSEBA6U23I7")[0], "M10K")
+
+    def test_configurations(self):
+        self.assertEqual(l2_sweep.configurations(128, [0, 16, 8192], [32, 256]),
+            [(0, 128), (32, 128), (32, 256), (8192, 128), (8192, 256)])
+
+    def test_recommend(self):
+        points = [
+            {"l2_size": 0,     "throughput": 50e6,  "bram": 0},
+            {"l2_size": 4096,  "throughput": 97e6,  "bram": 9},
+            {"l2_size": 8192,  "throughput": 100e6, "bram": 17},
+            {"l2_size": 16384, "throughput": 120e6, "bram": 33, "errors": 1},
+        ]
+        self.assertEqual(l2_sweep.recommend(points)["l2_size"], 4096)
+        self.assertEqual(l2_sweep.recommend(points, tolerance=1)["l2_size"], 8192)
+        self.assertIsNone(l2_sweep.recommend([]))
+
+    def test_target_args(self):
+        args = l2_sweep.parse_args(["arty", "--sizes", "0", "4096", "--", "--variant=a7-100", "--sys-clk-freq", "50e6"])
+        self.assertEqual(args.targets, ["arty"])
+        self.assertEqual(args.sizes,   [0, 4096])
+        self.assertEqual(args.target_args, ["--variant=a7-100", "--sys-clk-freq", "50e6"])
+        # Target arguments reach the worker.
+        worker = l2_sweep.parse_args(l2_sweep.worker_command("arty", args)[3:])
+        self.assertEqual(worker.worker,      "arty")
+        self.assertEqual(worker.targets,     [])
+        self.assertEqual(worker.target_args, args.target_args)
+        self.assertEqual(l2_sweep.parse_args(["arty"]).target_args, [])
@@ -0,0 +1,57 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.build.openocd import serial_config, openocd_commands, FleetProgrammer
+from litex_boards.build.openocd import split_script, session_commands
+
+prog_dir = os.path.join(os.path.dirname(__file__), "..", "litex_boards", "prog")
+
+
+class Programmer:
+    # Same interface as LiteX's OpenOCD programmers.
+    def __init__(self, config):
+        self.config = config
+
+    def find_config(self):
+        return self.config
+
+    def call(self, command, check=True):
+        raise OSError("Programmer called.")
+
+    def load_bitstream(self, bitstream):
+        self.call(["openocd", "-f", self.find_config(), "-c", "init; pld load 0 {}; exit".format(bitstream)])
+
+
+class TestOpenOCD(unittest.TestCase):
+    def test_serial_config(self):
+        with tempfile.TemporaryDirectory() as d:
+            config = serial_config(os.path.join(prog_dir, "openocd_colorlight_5a_75b.cfg"), "FT1234", d)
+            self.assertEqual(os.path.basename(config), "openocd_colorlight_5a_75b_FT1234.cfg")
+            with open(config) as f:
+                self.assertTrue(f.read().endswith("\nftdi_serial \"FT1234\"\n"))
+
+    def test_fleet(self):
+        programmer = Programmer(os.path.join(prog_dir, "openocd_xc7_ft2232.cfg"))
+        commands   = openocd_commands(programmer, "load_bitstream", "top.bit")
+        self.assertEqual(commands, [["openocd", "-f", programmer.config, "-c", "init; pld load 0 top.bit; exit"]])
+        with tempfile.TemporaryDirectory() as d:
+            fleet   = FleetProgrammer(programmer, ["A", "B"], directory=d)
+            results = fleet.load_bitstream("top.bit")
+            self.assertEqual(sorted(results), ["A", "B"])
+            with open(results["B"]["log"]) as f:
+                self.assertIn("openocd_xc7_ft2232_B.cfg", f.readline())
+
+    def test_session_commands(self):
+        commands = [["openocd", "-f", "ecp5.cfg", "-c", "transport select jtag; target create ecp5.spi0.proxy testee "
+            "-chain-position ecp5.tap; init; svf quiet progress \"proxy.svf\"; flash write_image erase \"a;b.bin\" 0x0; exit"]]
+        self.assertEqual(session_commands(commands), (
+            ["transport select jtag", "target create ecp5.spi0.proxy testee -chain-position ecp5.tap"],
+            ["svf quiet progress \"proxy.svf\"", "flash write_image erase \"a;b.bin\" 0x0"]))
+        self.assertEqual(split_script("init; pld load 0 {a;b.bit}; exit"), ["init", "pld load 0 {a;b.bit}", "exit"])
@@ -0,0 +1,20 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litex_boards.integration.pcie import check_pcie_dmas
+
+
+class TestPCIe(unittest.TestCase):
+    def test_check_pcie_dmas(self):
+        check_pcie_dmas(1)
+        check_pcie_dmas(16)
+        for ndmas in [0, -1, 17]:
+            with self.assertRaises(ValueError):
+                check_pcie_dmas(ndmas)
+        with self.assertRaises(ValueError):
+            check_pcie_dmas(2, msi_irqs=2)
@@ -0,0 +1,35 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litex.build.generic_platform import ConstraintError
+
+from litex_boards.platforms import arty
+
+
+class TestPlatforms(unittest.TestCase):
+    def test_request(self):
+        platform = arty.Platform()
+        led1 = platform.request("user_led", 1)
+        led0 = platform.request("user_led")
+        self.assertIs(platform.lookup_request("user_led", 1), led1)
+        self.assertIs(platform.lookup_request("user_led", 0), led0)
+        self.assertEqual(len(platform.request_all("user_led")), 2)
+        with self.assertRaises(ConstraintError):
+            platform.request("user_led", 0)
+        self.assertIsNone(platform.request("user_led", 0, loose=True))
+
+    def test_subsignal_lookup(self):
+        platform = arty.Platform()
+        serial   = platform.request("serial")
+        self.assertIs(platform.lookup_request("serial:tx"), serial.tx)
+
+    def test_pin_index(self):
+        platform = arty.Platform()
+        self.assertIn(("clk100", 0, None), platform.constraint_manager.pin_resources("E3"))
+        platform.add_extension([("test_clk", 0, platform.constraint_manager.available[0][2])])
+        self.assertIn("E3", platform.constraint_manager.pin_conflicts())
@@ -0,0 +1,31 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+import tracemalloc
+
+from litex_boards.integration.profile import ElaborationProfiler
+
+
+class TestElaborationProfiler(unittest.TestCase):
+    def test_nested_stages(self):
+        tracemalloc.start()
+        try:
+            profiler = ElaborationProfiler()
+            with profiler.stage("SoCCore.__init__"):
+                with profiler.stage("add_sdram"):
+                    data = bytearray(1024*1024)
+                    del data
+                with profiler.stage("add_sdram"):
+                    pass
+        finally:
+            tracemalloc.stop()
+        report = profiler.report()
+        self.assertEqual([(s["name"], s["depth"]) for s in report["stages"]],
+            [("SoCCore.__init__", 0), ("add_sdram", 1), ("add_sdram", 1)])
+        self.assertEqual(report["summary"]["add_sdram"]["calls"], 2)
+        self.assertGreaterEqual(report["stages"][1]["peak_memory"], 1024*1024)
+        self.assertGreaterEqual(report["stages"][0]["peak_memory"], report["stages"][1]["peak_memory"])
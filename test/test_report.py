@@ -0,0 +1,93 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.integration.report import build_report, clock_domain
+
+vivado_utilization = """
+1. Slice Logic
+--------------
+
++----------------------------+------+-------+-----------+-------+
+|          Site Type         | Used | Fixed | Available | Util% |
++----------------------------+------+-------+-----------+-------+
+| Slice LUTs                 | 2584 |     0 |     20800 | 12.42 |
+| Slice Registers            | 2167 |     0 |     41600 |  5.21 |
++----------------------------+------+-------+-----------+-------+
+| Block RAM Tile             |    8 |     0 |        50 | 16.00 |
+| DSPs                       |    4 |     0 |        90 |  4.44 |
+"""
+
+vivado_timing = """
+------------------------------------------------------------------------------------------------
+| Clock Summary
+| -------------
+------------------------------------------------------------------------------------------------
+
+Clock               Waveform(ns)       Period(ns)      Frequency(MHz)
+-----               ------------       ----------      --------------
+clk100              {0.000 5.000}      10.000          100.000
+  main_sys_clk      {0.000 5.000}      10.000          100.000
+  main_mmcm_fb      {0.000 5.000}      10.000          100.000
+
+
+------------------------------------------------------------------------------------------------
+| Intra Clock Table
+| -----------------
+------------------------------------------------------------------------------------------------
+
+Clock                   WNS(ns)      TNS(ns)  TNS Failing Endpoints  TNS Total Endpoints      WHS(ns)      THS(ns)     WPWS(ns)
+-----                   -------      -------  ---------------------  -------------------      -------      -------     --------
+clk100                    7.500        0.000                      0                   10        0.120        0.000        3.000
+  main_sys_clk            2.000        0.000                      0                 5000        0.050        0.000        4.000
+  main_mmcm_fb                                                                                                          8.751
+"""
+
+nextpnr_log = """
+Info: Device utilisation:
+Info: 	          TRELLIS_SLICE:  1200/12144     9%
+Info: 	                 DP16KD:     4/   56     7%
+Info: 	             MULT18X18D:     0/   28     0%
+Info: Max frequency for clock '$glbnet$sys_clk': 55.00 MHz (PASS at 50.00 MHz)
+Info: Max frequency for clock '$glbnet$sys_clk': 62.50 MHz (PASS at 50.00 MHz)
+"""
+
+
+class TestReport(unittest.TestCase):
+    def write(self, d, name, content):
+        with open(os.path.join(d, name), "w") as f:
+            f.write(content)
+
+    def test_clock_domain(self):
+        domains = ["sys", "sys4x", "eth_rx", "eth"]
+        self.assertEqual(clock_domain("main_sys4x_clk", domains), "sys4x")
+        self.assertEqual(clock_domain("$glbnet$sys_clk", domains), "sys")
+        self.assertEqual(clock_domain("eth_rx_clk", domains), "eth_rx")
+        self.assertEqual(clock_domain("clk100", domains), None)
+
+    def test_vivado(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.write(d, "top_utilization_place.rpt", vivado_utilization)
+            self.write(d, "top_timing.rpt", vivado_timing)
+            report = build_report(d, "top", "XilinxVivadoToolchain", ["sys"])
+        self.assertEqual(report["utilization"]["lut"],  {"used": 2584, "available": 20800})
+        self.assertEqual(report["utilization"]["bram"], {"used": 8,    "available": 50})
+        self.assertNotIn("main_mmcm_fb", report["clocks"])
+        self.assertEqual(report["domains"]["sys"]["clocks"], ["main_sys_clk"])
+        self.assertEqual(report["domains"]["sys"]["wns"],  2.0)
+        self.assertEqual(report["domains"]["sys"]["fmax"], 125.0)
+        self.assertEqual(report["wns"], 2.0)
+
+    def test_nextpnr(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.write(d, "build_top.log", nextpnr_log)
+            report = build_report(d, "top", "LatticeTrellisToolchain", ["sys"])
+        self.assertEqual(report["utilization"]["lut"], {"used": 1200, "available": 12144})
+        self.assertEqual(report["domains"]["sys"]["fmax"], 62.5)
+        self.assertEqual(report["domains"]["sys"]["wns"],  4.0)
@@ -0,0 +1,79 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.build.generic_platform import Pins, IOStandard
+from litex.build.lattice import LatticePlatform
+from litex.soc.integration.soc_core import SoCCore
+
+from litedram.modules import MT41K128M16
+from litedram.phy.model import SDRAMPHYModel, get_sdram_phy_settings
+
+from litex_boards.integration.sdram import add_sdram_channels
+from litex_boards.integration.target import add_target_options
+
+_io = [("clk25", 0, Pins("G2"), IOStandard("LVCMOS33"))]
+
+def soc(nchannels, interleave, csrs=[]):
+    """SoC with nchannels SDRAM channels of 256MiB over SDRAM models, csrs added between PHYs."""
+    platform = LatticePlatform("LFE5U-45F-6BG381C", _io, toolchain="trellis")
+    soc      = SoCCore(platform, 25e6, cpu_type=None, with_uart=False)
+    module   = MT41K128M16(25e6, "1:4")
+    phys     = []
+    for n in range(nchannels):
+        name = "ddrphy" if n == 0 else "ddrphy{}".format(n)
+        phy  = SDRAMPHYModel(module, get_sdram_phy_settings(memtype="DDR3", data_width=16, clk_freq=25e6), clk_freq=25e6)
+        setattr(soc.submodules, name, phy)
+        soc.add_csr(name)
+        for csr in csrs:
+            soc.add_csr("{}{}".format(csr, n))
+        phys.append(phy)
+    if phys:
+        add_sdram_channels(soc, phys, module, soc.mem_map["main_ram"], interleave=interleave)
+    return soc
+
+
+class TestSDRAMChannels(unittest.TestCase):
+    def check_csrs(self, soc, nchannels):
+        # The CSRs of each channel are at the same offset from the ones of the first channel.
+        locs = soc.csr.locs
+        for n in range(1, nchannels):
+            offset = locs["ddrphy{}".format(n)] - locs["ddrphy"]
+            self.assertEqual(locs["sdram{}".format(n)] - locs["sdram"], offset)
+            self.assertEqual(soc.constants["SDRAM{}_CSR_BASE".format(n)],
+                soc.mem_map["csr"] + offset*soc.csr.paging)
+        self.assertEqual(soc.constants["SDRAM_CHANNELS"], nchannels)
+
+    def test_separate(self):
+        s = soc(3, interleave=False, csrs=["leds"])
+        self.check_csrs(s, 3)
+        self.assertEqual([s.bus.regions[r].size for r in ["main_ram", "main_ram1", "main_ram2"]], [2**28]*3)
+        self.assertNotIn("SDRAM_CHANNELS_INTERLEAVED", s.constants)
+
+    def test_interleave(self):
+        s = soc(4, interleave=True)
+        self.check_csrs(s, 4)
+        self.assertEqual(s.bus.regions["main_ram"].size, 4*2**28)
+        self.assertNotIn("main_ram1", s.bus.regions)
+        self.assertIn("SDRAM_CHANNELS_INTERLEAVED", s.constants)
+        with self.assertRaises(ValueError):
+            soc(3, interleave=True)
+
+    def test_single(self):
+        s = soc(1, interleave=False)
+        self.assertNotIn("SDRAM_CHANNELS", s.constants)
+
+    def test_dram_bench(self):
+        s = soc(2, interleave=False)
+        add_target_options(s, with_dram_bench=True)
+        for core in ["sdram", "sdram1"]:
+            self.assertTrue(hasattr(s, core + "_generator") and hasattr(s, core + "_checker"))
+            self.assertEqual(s.constants[core.upper() + "_BENCH_SIZE"], 2**28)
+        with self.assertRaises(ValueError):
+            add_target_options(soc(0, interleave=False), with_dram_bench=True)
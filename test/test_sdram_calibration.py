@@ -0,0 +1,74 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.soc.interconnect.csr import CSR, CSRStorage
+
+from litex_boards.integration.sdram_calibration import SDRAMPHYDelayShadow
+
+class DelayPHY:
+    # Delay CSRs of a DDR PHY (read delays per module, clock delay shared).
+    def __init__(self, nmodules=4):
+        self._dly_sel     = CSRStorage(nmodules, name="dly_sel")
+        self._rdly_dq_rst = CSR(name="rdly_dq_rst")
+        self._rdly_dq_inc = CSR(name="rdly_dq_inc")
+        self._cdly_rst    = CSR(name="cdly_rst")
+        self._cdly_inc    = CSR(name="cdly_inc")
+
+def pulse(csr, n=1):
+    for i in range(n):
+        yield csr.re.eq(1)
+        yield
+        yield csr.re.eq(0)
+        yield
+
+
+class TestSDRAMCalibration(unittest.TestCase):
+    def test_delay_shadow(self):
+        phy    = DelayPHY()
+        shadow = SDRAMPHYDelayShadow(phy)
+        counts = []
+
+        def read(name):
+            values = []
+            for module in range(4):
+                yield shadow._sel.storage.eq(module)
+                yield
+                values.append((yield getattr(shadow, "_" + name).status))
+            counts.append(values)
+
+        def generator():
+            # Module 0: 3 increments, module 2: reset + 5 increments, modules 1/3: none.
+            yield phy._dly_sel.storage.eq(0b0001)
+            yield from pulse(phy._rdly_dq_inc, 3)
+            yield phy._dly_sel.storage.eq(0b0100)
+            yield from pulse(phy._rdly_dq_rst)
+            yield from pulse(phy._rdly_dq_inc, 5)
+            # Increments without selected module are ignored, cdly is not per module.
+            yield phy._dly_sel.storage.eq(0)
+            yield from pulse(phy._rdly_dq_inc)
+            yield from pulse(phy._cdly_inc, 2)
+            yield from read("rdly_dq")
+            yield from read("cdly")
+            # Reset of module 0 only.
+            yield phy._dly_sel.storage.eq(0b0001)
+            yield from pulse(phy._rdly_dq_rst)
+            yield from pulse(phy._cdly_rst)
+            yield phy._dly_sel.storage.eq(0)
+            yield from read("rdly_dq")
+            yield from read("cdly")
+
+        run_simulation(shadow, generator())
+        self.assertEqual(shadow.delays, ["rdly_dq", "cdly"])
+        self.assertEqual(counts, [
+            [3, 0, 5, 0], # rdly_dq.
+            [2, 2, 2, 2], # cdly.
+            [0, 0, 5, 0], # rdly_dq, module 0 reset.
+            [0, 0, 0, 0], # cdly, reset.
+        ])
@@ -0,0 +1,40 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litex_boards.integration.seeds import split_script, seed_command, seed_score, best_seed, spread
+
+script = """# Autogenerated by LiteX / git: 0123456
+set -e
+yosys -l top.rpt top.ys
+nextpnr-ecp5 --json top.json --lpf top.lpf --textcfg top.config --25k --package CABGA381 --speed 6 --timing-allow-fail --seed 1
+ecppack --bootaddr 0 top.config --svf top.svf --bit top.bit
+"""
+
+
+class TestSeeds(unittest.TestCase):
+    def test_split_script(self):
+        synthesis, nextpnr, post = split_script(script)
+        self.assertEqual(synthesis, ["yosys -l top.rpt top.ys"])
+        self.assertTrue(nextpnr.startswith("nextpnr-ecp5"))
+        self.assertEqual(post, ["ecppack --bootaddr 0 top.config --svf top.svf --bit top.bit"])
+        self.assertTrue(seed_command(nextpnr, 42).endswith("--timing-allow-fail --seed 42"))
+        self.assertEqual(seed_command("nextpnr-ice40 --json top.json", 3), "nextpnr-ice40 --json top.json --seed 3")
+
+    def test_best_seed(self):
+        results = {
+            1: {"clocks": {"sys": {"period": 10.0, "fmax": 105.0}, "sys2x": {"period": 5.0, "fmax": 190.0}}},
+            2: {"clocks": {"sys": {"period": 10.0, "fmax":  98.0}, "sys2x": {"period": 5.0, "fmax": 230.0}}},
+            3: {"error": "Error occured during place-and-route."},
+        }
+        for r in results.values():
+            if "clocks" in r:
+                r["score"] = seed_score(r["clocks"])
+        # Seed 1 fails on sys2x (0.95), seed 2 on sys (0.98).
+        self.assertEqual(best_seed(results), 2)
+        self.assertEqual(spread(results)["sys"], {"min": 98.0, "max": 105.0})
+        self.assertEqual(best_seed({3: results[3]}), None)
@@ -0,0 +1,67 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import binascii
+import tempfile
+import unittest
+
+from litex_boards.integration.spd import load_spd, spd_crc, check_spd
+
+def spd(memtype=0x0b, module_type=0x3):
+    data = [0x00]*256
+    data[0], data[1], data[2], data[3] = 0x92, 0x10, memtype, module_type
+    crc = spd_crc(data)
+    data[126], data[127] = crc & 0xff, crc >> 8
+    return data
+
+def hexdump(data, base=0):
+    lines = ["Memory dump:"]
+    for address in range(0, len(data), 16):
+        lines.append("0x{:08x}  {}  ................".format(base + address,
+            " ".join("{:02x}".format(b) for b in data[address:address + 16])))
+    return "\n".join(lines) + "\n"
+
+
+class TestSPD(unittest.TestCase):
+    def test_crc(self):
+        data = list(range(128))
+        data[2] = 0x0c
+        self.assertEqual(spd_crc(data), binascii.crc_hqx(bytes(data[:126]), 0))
+        # DDR3 with CRC over bytes 0-116.
+        data[0], data[2] = 0x92, 0x0b
+        self.assertEqual(spd_crc(data), binascii.crc_hqx(bytes(data[:117]), 0))
+
+    def test_load(self):
+        data = spd()
+        with tempfile.TemporaryDirectory() as d:
+            binary = os.path.join(d, "spd.bin")
+            with open(binary, "wb") as f:
+                f.write(bytes(data + [0xff]*256)) # DDR4 EEPROMs are 512 bytes.
+            self.assertEqual(load_spd(binary), data)
+            text = os.path.join(d, "spd.txt")
+            with open(text, "w") as f:
+                f.write("litex> sdram_spd 0\n" + hexdump(data) + "\nWARNING: memory differs:\n" + hexdump(spd(0x0c)))
+            self.assertEqual(load_spd(text), data)
+            short = os.path.join(d, "short.bin")
+            with open(short, "wb") as f:
+                f.write(bytes(data[:64]))
+            with self.assertRaises(ValueError):
+                load_spd(short)
+
+    def test_check(self):
+        check_spd(spd(0x0b, 0x3), memtype="DDR3", registered=False)
+        check_spd(spd(0x0c, 0x1), memtype="DDR4", registered=True)
+        with self.assertRaises(ValueError):
+            check_spd(spd(0x0b, 0x3), memtype="DDR4")
+        with self.assertRaises(ValueError):
+            check_spd(spd(0x0c, 0x2), memtype="DDR4", registered=True)
+        corrupted = spd()
+        corrupted[10] ^= 0x01
+        with self.assertRaises(ValueError):
+            check_spd(corrupted)
+        with self.assertRaises(ValueError):
+            check_spd(spd(0x08))
@@ -0,0 +1,106 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2021 LiteX-Hub community
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import unittest
+
+from litex_boards.build import spiflash
+
+
+class FakeFlash:
+    erase_sizes = [4096, 65536]
+
+    def __init__(self, size):
+        self.data   = bytearray(b"\xff"*size)
+        self.erases = []
+        self.writes = 0
+
+    def read(self, address, length):
+        return bytes(self.data[address:address + length])
+
+    def erase(self, address, length):
+        assert address % self.erase_sizes[0] == 0 and length % self.erase_sizes[0] == 0
+        self.erases.append((address, length))
+        self.data[address:address + length] = b"\xff"*length
+
+    def write(self, address, data):
+        # NOR Flash: programming only clears bits.
+        for i, b in enumerate(data):
+            self.data[address + i] &= b
+        self.writes += len(data)
+
+class FakeProgrammer:
+    def find_flash_proxy(self):
+        return "proxy.bit"
+
+class FakeSession:
+    # OpenOCDSession with the jtagspi proxy loaded, read_bank/write_bank done on a FakeFlash.
+    def __init__(self, flash):
+        self.flash      = flash
+        self.state      = {"proxy": None}
+        self.programmer = FakeProgrammer()
+
+    def running(self):
+        return True
+
+    def _save(self):
+        pass
+
+    def rpc(self, command):
+        args = command.replace("{", "").replace("}", "").split()
+        if args[:2] == ["flash", "read_bank"]:
+            with open(args[3], "wb") as f:
+                f.write(self.flash.read(int(args[4], 0), int(args[5], 0)))
+        elif args[:2] == ["flash", "write_bank"]:
+            with open(args[3], "rb") as f:
+                self.flash.write(int(args[4], 0), f.read())
+        elif args[:2] == ["flash", "erase_address"]:
+            self.flash.erase(int(args[2], 0), int(args[3], 0))
+
+
+class TestSPIFlash(unittest.TestCase):
+    def test_plan(self):
+        current = bytes(2*65536)
+        image   = bytearray(current)
+        image[0x1000]  = 1              # One sector of the first block.
+        image[0x2000]  = 1              # Contiguous sector: merged.
+        for address in range(0x10000, 0x20000, 0x1000)[:9]:
+            image[address] = 1          # Most of the second block: block erase.
+        self.assertEqual(spiflash.plan(current, bytes(image)), [(0x1000, 0x2000), (0x10000, 0x10000)])
+        self.assertEqual(spiflash.plan(current, current), [])
+
+    def test_program(self):
+        flash = FakeFlash(256*1024)
+        image = bytes(range(256))*512 + b"\xff"*4096 + b"\x55"*100
+        r = spiflash.program(flash, 0x10000, image)
+        self.assertEqual(flash.read(0x10000, len(image)), image)
+        self.assertEqual(flash.writes, 128*1024 + 256) # Blank pages not programmed.
+        # Same image: nothing erased.
+        flash.erases = []
+        r = spiflash.program(flash, 0x10000, image)
+        self.assertEqual((flash.erases, r["sectors"]), ([], "0/34"))
+        # One byte changed: one sector erased.
+        image = image[:0x5001] + b"\x00" + image[0x5002:]
+        spiflash.program(flash, 0x10000, image)
+        self.assertEqual(flash.erases, [(0x15000, 0x1000)])
+        self.assertEqual(flash.read(0x10000, len(image)), image)
+
+    def test_verify(self):
+        flash = FakeFlash(65536)
+        flash.write = lambda address, data: None # Programming silently failing.
+        with self.assertRaises(OSError):
+            spiflash.program(flash, 0, b"\x00"*4096)
+        with self.assertRaises(ValueError):
+            spiflash.program(flash, 0x100, b"\x00")
+
+    def test_openocd_tmp(self):
+        flash = FakeFlash(65536)
+        with spiflash.OpenOCDSPIFlash(FakeSession(flash)) as device:
+            device.write(0x10, b"\x12\x34")
+            self.assertEqual(device.read(0x10, 2), b"\x12\x34")
+            tmp = device.tmp.name
+            self.assertTrue(os.path.isdir(tmp))
+        self.assertFalse(os.path.exists(tmp))
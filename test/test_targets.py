@@ -5,132 +5,249 @@
 # This file is Copyright (c) 2019 Tim 'mithro' Ansell <me@mith.ro>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import os
+import sys
+import time
+import argparse
 import subprocess
+import tempfile
 import unittest
-import os
+import importlib
+import traceback
+import multiprocessing
+import concurrent.futures
 
 from migen import *
 
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+
+_build_test_socs = []
 
-def build_test(socs):
-    errors = 0
-    for soc in socs:
-        os.system("rm -rf build")
-        builder = Builder(soc, output_dir="./build", compile_software=False, compile_gateware=False)
+def _build_test_one(soc):
+    with tempfile.TemporaryDirectory(prefix="litex_boards_") as output_dir:
+        builder = Builder(soc, output_dir=output_dir, compile_software=False, compile_gateware=False)
         builder.build()
-        errors += not os.path.isfile("./build/gateware/top.v")
-    os.system("rm -rf build")
-    return errors
+        return not os.path.isfile(os.path.join(builder.gateware_dir, soc.build_name + ".v"))
+
+def _build_test_worker(index):
+    return _build_test_one(_build_test_socs[index])
+
+def build_test(socs, jobs=None):
+    """Build each SoC of `socs` in its own temporary directory, return the number of failures.
+
+    SoCs are built concurrently on `jobs` workers (default: CPU count). Workers are forked so that
+    they inherit the already elaborated SoCs; builds are sequential when jobs=1 or when fork is not
+    available on the host.
+    """
+    socs = list(socs)
+    if jobs == 1 or len(socs) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return sum(_build_test_one(soc) for soc in socs)
+    _build_test_socs[:] = socs
+    try:
+        with multiprocessing.get_context("fork").Pool(jobs) as pool:
+            return sum(pool.map(_build_test_worker, range(len(socs))))
+    finally:
+        _build_test_socs[:] = []
+
+# Platforms ----------------------------------------------------------------------------------------
+
+platforms = []
+
+# Xilinx Spartan6
+platforms.append("linsn_rv901t")
+platforms.append("minispartan6")
+platforms.append("pipistrello")
+platforms.append("sp605")
+platforms.append("pano_logic_g2")
+
+# Xilinx Spartan7
+platforms.append("arty_s7")
+
+# Xilinx Artix7
+platforms.append("ac701")
+platforms.append("aller")
+platforms.append("arty")
+platforms.append("mimas_a7")
+platforms.append("netv2")
+platforms.append("nexys4ddr")
+platforms.append("nexys_video")
+platforms.append("tagus")
+platforms.append("acorn_cle_215")
+platforms.append("marblemini")
+platforms.append("litefury")
+platforms.append("qmtech_wukong")
+
+# Xilinx Kintex7
+platforms.append("genesys2")
+platforms.append("kc705")
+platforms.append("kx2")
+platforms.append("nereid")
+
+# Xilinx Virtex7
+platforms.append("vc707")
+
+# Xilinx Kintex Ultrascale
+platforms.append("kcu105")
+
+# Xilinx Zynq-7000
+platforms.append("zedboard")
+platforms.append("zybo_z7")
+
+# Xilinx Zynq Ultrascale+
+platforms.append("zcu104")
+platforms.append("mercury_xu5")
+
+# Xilinx Virtex Ultrascale+
+platforms.append("vcu118")
+
+# Intel Cyclone3
+platforms.append("mist")
+
+# Intel Cyclone4
+platforms.append("de0nano")
+platforms.append("de2_115")
+platforms.append("qmtech_ep4ce15")
+
+# Intel Cyclone5
+platforms.append("de1soc")
+platforms.append("de10nano")
+
+# Intel Cyclone10
+platforms.append("c10lprefkit")
+
+# Intel Max10
+platforms.append("de10lite")
+
+# Lattice iCE40
+platforms.append("fomu_evt")
+platforms.append("fomu_hacker")
+platforms.append("fomu_pvt")
+platforms.append("tinyfpga_bx")
+platforms.append("icebreaker")
+
+# Lattice MachXO2
+platforms.append("machxo3")
+
+# Lattice ECP5
+platforms.append("ecp5_evn")
+platforms.append("hadbadge")
+platforms.append("orangecrab")
+platforms.append("trellisboard")
+platforms.append("ulx3s")
+platforms.append("versa_ecp5")
+platforms.append("colorlight_5a_75b")
+platforms.append("colorlight_5a_75e")
+platforms.append("camlink_4k")
+
+# Lattice Crosslink NX
+platforms.append("crosslink_nx_evn")
+platforms.append("crosslink_nx_vip")
+
+# Gowin
+platforms.append("tec0117")
+
+# Microsemi PolarFire
+platforms.append("avalanche")
+
+# Simple SoC Runner --------------------------------------------------------------------------------
+
+def build_simple(name, output_dir):
+    """Build the simple SoC for platform `name` in-process, return (name, duration, error)."""
+    start = time.time()
+    error = None
+    try:
+        from litex_boards.targets.simple import BaseSoC
+        platform = importlib.import_module("litex_boards.platforms." + name).Platform()
+        soc      = BaseSoC(platform, uart_name="stub")
+        builder  = Builder(soc,
+            output_dir     = os.path.join(output_dir, name),
+            elaborate_only = True)
+        builder.build()
+        if not os.path.isfile(os.path.join(builder.gateware_dir, soc.build_name + ".v")):
+            error = "{}.v not generated".format(soc.build_name)
+    except Exception:
+        error = traceback.format_exc()
+    return name, time.time() - start, error
+
+def run_simple(names, output_dir=None, jobs=None):
+    """Build the simple SoC for each platform of `names` in a process pool.
+
+    Each platform gets its own output directory so workers never collide (in a temporary directory
+    removed afterwards when output_dir is None). Returns a dict mapping each platform name to a
+    (duration, error) tuple, error being None on success.
+    """
+    if output_dir is None:
+        with tempfile.TemporaryDirectory(prefix="litex_boards_") as output_dir:
+            return run_simple(names, output_dir, jobs)
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(build_simple, name, output_dir) for name in names]
+        for future in concurrent.futures.as_completed(futures):
+            name, duration, error = future.result()
+            results[name] = (duration, error)
+    return results
+
+
+# Target Arguments ---------------------------------------------------------------------------------
+
+def run_target_command(command):
+    """Run a target command elaborating only, return (returncode, output)."""
+    p = subprocess.run(command + ["--elaborate-only"],
+        stdout             = subprocess.PIPE,
+        stderr             = subprocess.STDOUT,
+        universal_newlines = True,
+        errors             = "replace")
+    return p.returncode, p.stdout
 
 
 class TestTargets(unittest.TestCase):
     # Build simple design for all platforms
     def test_simple(self):
-        platforms = []
-
-        # Xilinx Spartan6
-        platforms.append("linsn_rv901t")
-        platforms.append("minispartan6")
-        platforms.append("pipistrello")
-        platforms.append("sp605")
-        platforms.append("pano_logic_g2")
-
-        # Xilinx Spartan7
-        platforms.append("arty_s7")
-
-        # Xilinx Artix7
-        platforms.append("ac701")
-        platforms.append("aller")
-        platforms.append("arty")
-        platforms.append("mimas_a7")
-        platforms.append("netv2")
-        platforms.append("nexys4ddr")
-        platforms.append("nexys_video")
-        platforms.append("tagus")
-        platforms.append("acorn_cle_215")
-        platforms.append("marblemini")
-        platforms.append("litefury")
-        platforms.append("qmtech_wukong")
-
-        # Xilinx Kintex7
-        platforms.append("genesys2")
-        platforms.append("kc705")
-        platforms.append("kx2")
-        platforms.append("nereid")
-
-        # Xilinx Virtex7
-        platforms.append("vc707")
-
-        # Xilinx Kintex Ultrascale
-        platforms.append("kcu105")
-
-        # Xilinx Zynq-7000
-        platforms.append("zedboard")
-        platforms.append("zybo_z7")
-
-        # Xilinx Zynq Ultrascale+
-        platforms.append("zcu104")
-        platforms.append("mercury_xu5")
-
-        # Xilinx Virtex Ultrascale+
-        platforms.append("vcu118")
-
-        # Intel Cyclone3
-        platforms.append("mist")
-
-        # Intel Cyclone4
-        platforms.append("de0nano")
-        platforms.append("de2_115")
-        platforms.append("qmtech_ep4ce15")
-
-        # Intel Cyclone5
-        platforms.append("de1soc")
-        platforms.append("de10nano")
-
-        # Intel Cyclone10
-        platforms.append("c10lprefkit")
-
-        # Intel Max10
-        platforms.append("de10lite")
-
-        # Lattice iCE40
-        platforms.append("fomu_evt")
-        platforms.append("fomu_hacker")
-        platforms.append("fomu_pvt")
-        platforms.append("tinyfpga_bx")
-        platforms.append("icebreaker")
-
-        # Lattice MachXO2
-        platforms.append("machxo3")
-
-        # Lattice ECP5
-        platforms.append("ecp5_evn")
-        platforms.append("hadbadge")
-        platforms.append("orangecrab")
-        platforms.append("trellisboard")
-        platforms.append("ulx3s")
-        platforms.append("versa_ecp5")
-        platforms.append("colorlight_5a_75b")
-        platforms.append("colorlight_5a_75e")
-        platforms.append("camlink_4k")
-
-        # Lattice Crosslink NX
-        platforms.append("crosslink_nx_evn")
-        platforms.append("crosslink_nx_vip")
-
-        # Gowin
-        platforms.append("tec0117")
-
-        # Microsemi PolarFire
-        platforms.append("avalanche")
-
+        results = run_simple(platforms)
         for name in platforms:
             with self.subTest(platform=name):
-                cmd = """\
-litex_boards/targets/simple.py litex_boards.platforms.{} \
-    --no-compile-software   \
-    --no-compile-gateware   \
-    --uart-name="stub"      \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+                duration, error = results[name]
+                self.assertIsNone(error, msg=error)
+
+    # Build farm commands accepted by the Vivado targets
+    def test_build_farm_args(self):
+        from litex_boards import targets
+        from litex_boards.tools.build_farm import BuildFarm, toolchain
+        with tempfile.TemporaryDirectory() as d:
+            farm     = BuildFarm(d, run=False)
+            names    = [name for name in targets.boards() if toolchain(name) == "vivado"]
+            commands = []
+            for name in names:
+                job, _  = farm.submit(name)
+                command = farm.command(job)
+                self.assertEqual(command[command.index("--max-threads") + 1], str(job.threads))
+                commands.append(command)
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                results = list(executor.map(run_target_command, commands))
+        for name, (returncode, output) in zip(names, results):
+            with self.subTest(target=name):
+                self.assertEqual(returncode, 0, msg=output)
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Build simple SoC for LiteX-Boards platforms in parallel")
+    parser.add_argument("platforms",    nargs="*",                   help="Platforms to build (default: all)")
+    parser.add_argument("--jobs",       default=None, type=int,      help="Number of parallel jobs (default: CPU count)")
+    parser.add_argument("--output-dir", default=None,                help="Base output directory (default: temporary, removed)")
+    args = parser.parse_args()
+
+    names   = args.platforms or platforms
+    start   = time.time()
+    results = run_simple(names, output_dir=args.output_dir, jobs=args.jobs)
+    for name in names:
+        duration, error = results[name]
+        print("{:<20} {:>8.2f}s  {}".format(name, duration, "FAIL" if error else "PASS"))
+        if error:
+            print(error)
+    failures = [name for name in names if results[name][1] is not None]
+    print("{}/{} passed in {:.2f}s".format(len(names) - len(failures), len(names), time.time() - start))
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()